@@ -0,0 +1,31 @@
+"""Add partial index for active capacity plan lookups
+
+Revision ID: 4f1c2a7d9e30
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1c2a7d9e30'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are created from model metadata, which already includes this index
+    # on new databases; existing databases only get it from this revision
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_plan_active_team "
+        "ON team_capacity_plans (discipline_team) WHERE is_active"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_plan_active_team")
@@ -0,0 +1,66 @@
+"""Enforce one active default JIRA configuration per environment
+
+Revision ID: 8a3e5b1f6c42
+Revises: 4f1c2a7d9e30
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a3e5b1f6c42'
+down_revision: Union[str, None] = '4f1c2a7d9e30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_jira_config_default_env")
+    
+    # Keep the most recently updated active default per environment, so the
+    # constraint can be added to databases that already hold duplicates
+    op.execute(
+        """
+        UPDATE jira_configurations SET is_default = false
+        WHERE is_default AND is_active AND id NOT IN (
+            SELECT DISTINCT ON (environment) id FROM jira_configurations
+            WHERE is_default AND is_active
+            ORDER BY environment, updated_at DESC, id DESC
+        )
+        """
+    )
+    
+    # Databases created from model metadata already have the constraint
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_constraint WHERE conname = 'uq_jira_config_default_env'
+            ) THEN
+                ALTER TABLE jira_configurations
+                    ADD CONSTRAINT uq_jira_config_default_env
+                    EXCLUDE USING btree (environment WITH =)
+                    WHERE (is_default AND is_active)
+                    DEFERRABLE INITIALLY DEFERRED;
+            END IF;
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE jira_configurations DROP CONSTRAINT IF EXISTS uq_jira_config_default_env"
+    )
+    op.create_index(
+        'idx_jira_config_default_env',
+        'jira_configurations',
+        ['is_default', 'environment'],
+        postgresql_where=sa.text('is_default = true')
+    )
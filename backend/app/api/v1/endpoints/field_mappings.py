@@ -120,14 +120,16 @@ async def list_field_mapping_templates(
     db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    is_active: Optional[bool] = Query(None, description="Filter by active status")
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    include_mappings: bool = Query(True, description="Include each template's field mappings")
 ):
     """List all field mapping templates."""
     service = FieldMappingService(db)
     return await service.get_field_mapping_templates(
         skip=skip,
         limit=limit,
-        is_active=is_active
+        is_active=is_active,
+        include_mappings=include_mappings
     )
 
 
@@ -175,7 +177,7 @@ async def transform_field_value(
 ):
     """Transform a field value using specified transformation rules."""
     service = FieldMappingService(db)
-    return await service.transform_field_value(transformation_request)
+    return service.transform_field_value(transformation_request)
 
 
 @router.post("/validate", response_model=FieldValidationResponse)
@@ -185,7 +187,7 @@ async def validate_field_value(
 ):
     """Validate a field value against validation rules."""
     service = FieldMappingService(db)
-    return await service.validate_field_value(validation_request)
+    return service.validate_field_value(validation_request)
 
 
 # JIRA Integration Operations
@@ -6,6 +6,7 @@ and health monitoring with support for both Cloud and Server instances.
 """
 
 import logging
+from dataclasses import asdict
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 
@@ -999,7 +1000,7 @@ async def list_jira_configurations(
                 )
         
         # Get configurations with filtering
-        configurations = await config_service.get_configurations(
+        configurations, total = await config_service.get_configurations_page(
             environment=environment,
             status=status_enum,
             is_active=is_active,
@@ -1014,9 +1015,8 @@ async def list_jira_configurations(
         ]
         
         # Calculate pagination info
-        total = len(config_responses)  # Note: This is simplified, in production you'd get total separately
         page = (offset // limit) + 1 if limit > 0 else 1
-        has_next = len(configurations) == limit  # Simplified check
+        has_next = offset + len(configurations) < total
         has_previous = offset > 0
         
         logger.debug(f"Found {len(configurations)} JIRA configurations")
@@ -1305,6 +1305,8 @@ async def get_default_jira_configuration(
 @router.get("/configurations/monitor", response_model=JiraConfigurationMonitoringResponse)
 async def monitor_jira_configurations(
     environment: Optional[str] = None,
+    test_connections: bool = False,
+    include_details: bool = True,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> JiraConfigurationMonitoringResponse:
@@ -1313,6 +1315,8 @@ async def monitor_jira_configurations(
     
     Returns comprehensive monitoring data including health metrics,
     error counts, and status summaries for JIRA configurations.
+    Set test_connections to re-test every configuration concurrently first,
+    and include_details=false to return only the summary counts.
     """
     try:
         logger.debug(f"Monitoring JIRA configurations for environment '{environment}' for user {current_user.id}")
@@ -1321,12 +1325,16 @@ async def monitor_jira_configurations(
         config_service = JiraConfigurationService(db)
         
         # Get monitoring data
-        monitoring_data = await config_service.monitor_configurations(environment)
+        summary = await config_service.monitor_configurations(
+            environment,
+            test_connections=test_connections,
+            include_details=include_details
+        )
         
-        logger.debug(f"Configuration monitoring complete: {monitoring_data['health_percentage']:.1f}% healthy")
+        logger.debug(f"Configuration monitoring complete: {summary.health_percentage:.1f}% healthy")
         
         # Convert to response model
-        return JiraConfigurationMonitoringResponse(**monitoring_data)
+        return JiraConfigurationMonitoringResponse(**asdict(summary))
         
     except Exception as e:
         logger.error(f"Error monitoring JIRA configurations: {e}", exc_info=True)
@@ -88,6 +88,7 @@ class Settings(BaseSettings):
     JIRA_URL: Optional[str] = Field(None, env="JIRA_URL")
     JIRA_EMAIL: Optional[str] = Field(None, env="JIRA_EMAIL") 
     JIRA_API_TOKEN: Optional[str] = Field(None, env="JIRA_API_TOKEN")
+    JIRA_RATE_LIMIT: Optional[float] = Field(None, env="JIRA_RATE_LIMIT")  # requests per second
     
     # JIRA Webhook Configuration (Optional)
     JIRA_WEBHOOK_SECRET: Optional[str] = Field(None, env="JIRA_WEBHOOK_SECRET")
@@ -44,6 +44,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     # Stop background tasks service
     await background_service.stop()
+    
+    # Close cached JIRA API clients
+    from app.services.jira_configuration_service import JiraConfigurationService
+    from app.services.jira_service import JiraAPIClient
+    await JiraConfigurationService.aclose()
+    await JiraAPIClient.aclose_all()
 
 
 # Security scheme for OpenAPI
@@ -7,7 +7,7 @@ Handles capacity planning, allocation, and tracking across discipline teams.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, String, DateTime, Integer, Float, Text, Boolean, ForeignKey, JSON, Index, CheckConstraint
+from sqlalchemy import Column, String, DateTime, Integer, Float, Text, Boolean, ForeignKey, JSON, Index, CheckConstraint, text
 from sqlalchemy.orm import relationship, validates
 
 from app.models.base import Base
@@ -157,6 +157,9 @@ class TeamCapacityPlan(Base):
         # Performance indexes
         Index('idx_plan_team_dates', 'discipline_team', 'start_date', 'end_date', 'is_active'),
         Index('idx_plan_active', 'is_active', 'end_date'),
+        # Partial index matching active plan lookups by team
+        Index('idx_plan_active_team', 'discipline_team',
+              postgresql_where=text('is_active')),
     )
     
     @validates('default_capacity')
@@ -8,7 +8,8 @@ for sensitive data fields and connection monitoring capabilities.
 from datetime import datetime
 from typing import Dict, Any, Optional
 
-from sqlalchemy import Column, String, Integer, Boolean, Text, Enum, DateTime, JSON, Index, CheckConstraint
+from sqlalchemy import Column, String, Integer, Boolean, Text, Enum, DateTime, JSON, Index, CheckConstraint, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import validates
 from sqlalchemy.ext.hybrid import hybrid_property
 import logging
@@ -20,6 +21,11 @@ from app.enums import JiraInstanceType, JiraAuthMethod, ConnectionStatus
 logger = logging.getLogger(__name__)
 
 
+def _enum_values(enum_class) -> list:
+    """Store enum members by value so the existing lowercase PostgreSQL ENUM labels are kept."""
+    return [member.value for member in enum_class]
+
+
 class JiraConfiguration(Base):
     """
     JIRA connection configuration model for persistent storage.
@@ -35,8 +41,16 @@ class JiraConfiguration(Base):
     
     # Connection details
     url = Column(String(500), nullable=False)
-    instance_type = Column(Enum('cloud', 'server', 'datacenter', name='jirainstancetype'), nullable=False, default='cloud')
-    auth_method = Column(Enum('token', 'basic', 'oauth', name='jiraauthmethod'), nullable=False, default='token')
+    instance_type = Column(
+        Enum(JiraInstanceType, name='jirainstancetype', values_callable=_enum_values),
+        nullable=False,
+        default=JiraInstanceType.CLOUD
+    )
+    auth_method = Column(
+        Enum(JiraAuthMethod, name='jiraauthmethod', values_callable=_enum_values),
+        nullable=False,
+        default=JiraAuthMethod.TOKEN
+    )
     
     
     # Authentication credentials (encrypted)
@@ -53,7 +67,11 @@ class JiraConfiguration(Base):
     capabilities = Column(JSON, nullable=True)  # Detected capabilities
     
     # Connection status and monitoring
-    status = Column(Enum('active', 'inactive', 'error', 'testing', 'pending', name='connectionstatus'), nullable=False, default='pending')
+    status = Column(
+        Enum(ConnectionStatus, name='connectionstatus', values_callable=_enum_values),
+        nullable=False,
+        default=ConnectionStatus.PENDING
+    )
     is_active = Column(Boolean, default=True, nullable=False)
     is_default = Column(Boolean, default=False, nullable=False)
     
@@ -82,9 +100,17 @@ class JiraConfiguration(Base):
         CheckConstraint("url ~ '^https?://'", name='valid_url_format'),
         # Ensure name is not empty when trimmed
         CheckConstraint("trim(name) != ''", name='name_not_empty'),
-        # Only one default configuration per environment
-        Index('idx_jira_config_default_env', 'is_default', 'environment', 
-              postgresql_where='is_default = true'),
+        # Only one active default configuration per environment. The partial
+        # btree index also serves default lookups; the check is deferred to
+        # commit so a single UPDATE can move the default between rows.
+        ExcludeConstraint(
+            ('environment', '='),
+            name='uq_jira_config_default_env',
+            using='btree',
+            where=text('is_default AND is_active'),
+            deferrable=True,
+            initially='DEFERRED'
+        ),
         # Compound index for status and activity lookups
         Index('idx_jira_config_status_active', 'status', 'is_active'),
         # Index for URL lookups
@@ -97,6 +123,10 @@ class JiraConfiguration(Base):
         Index('idx_jira_config_environment', 'environment', 'is_active'),
     )
     
+    # Fetch server-generated id and timestamps via RETURNING on flush, so a
+    # written configuration is fully loaded without a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
     @hybrid_property
     def api_token(self) -> Optional[str]:
         """Decrypt and return API token."""
@@ -154,6 +184,11 @@ class JiraConfiguration(Base):
             raise ValueError("Name cannot be empty")
         return name.strip() if name else name
     
+    @validates('auth_method')
+    def validate_auth_method(self, key, auth_method):
+        """Coerce authentication method strings to JiraAuthMethod."""
+        return JiraAuthMethod(auth_method) if auth_method is not None else auth_method
+    
     @validates('email')
     def validate_email_for_auth(self, key, email):
         """Validate email for authentication methods."""
@@ -10,6 +10,7 @@ from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 
 from sqlalchemy import select, and_, or_, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,6 +28,9 @@ from app.core.exceptions import NotFoundError, ValidationError
 
 logger = get_logger(__name__)
 
+# Maximum number of team/project names listed in a single key finding
+MAX_FINDING_NAMES = 3
+
 
 class CapacityConflictType(Enum):
     """Types of capacity conflicts."""
@@ -602,63 +606,86 @@ class CapacityAnalysisService:
             # Analyze patterns
             team_patterns = {}
             project_patterns = {}
+            # Team names in first-seen order; a team's position is its bit in teams_mask
+            team_names = []
+            team_bits = {}
             
             for allocation in historical_data:
                 team = allocation.discipline_team
                 project = allocation.project_key
                 
-                # Team pattern analysis
-                if team not in team_patterns:
-                    team_patterns[team] = {
-                        "allocations": [],
-                        "utilizations": [],
-                        "efficiency_ratios": []
+                # Team pattern analysis: running sums instead of per-team value lists
+                team_data = team_patterns.get(team)
+                if team_data is None:
+                    team_data = team_patterns[team] = {
+                        "count": 0,
+                        "allocation_sum": 0.0,
+                        "allocation_sq_sum": 0.0,
+                        "utilization_sum": 0.0,
+                        "efficiency_sum": 0.0
                     }
+                    team_bits[team] = 1 << len(team_names)
+                    team_names.append(team)
                 
-                team_patterns[team]["allocations"].append(allocation.allocated_capacity)
-                team_patterns[team]["utilizations"].append(allocation.utilized_capacity)
-                team_patterns[team]["efficiency_ratios"].append(allocation.efficiency_ratio)
+                allocated = allocation.allocated_capacity
+                team_data["count"] += 1
+                team_data["allocation_sum"] += allocated
+                team_data["allocation_sq_sum"] += allocated * allocated
+                team_data["utilization_sum"] += allocation.utilized_capacity
+                team_data["efficiency_sum"] += allocation.efficiency_ratio
                 
                 # Project pattern analysis
-                if project not in project_patterns:
-                    project_patterns[project] = {
-                        "teams_involved": set(),
-                        "total_allocations": [],
-                        "average_utilization": []
+                project_data = project_patterns.get(project)
+                if project_data is None:
+                    project_data = project_patterns[project] = {
+                        "teams_mask": 0,
+                        "count": 0,
+                        "allocation_sum": 0.0,
+                        "utilization_sum": 0.0
                     }
                 
-                project_patterns[project]["teams_involved"].add(team)
-                project_patterns[project]["total_allocations"].append(allocation.allocated_capacity)
-                project_patterns[project]["average_utilization"].append(allocation.utilization_percentage)
+                project_data["teams_mask"] |= team_bits[team]
+                project_data["count"] += 1
+                project_data["allocation_sum"] += allocated
+                project_data["utilization_sum"] += allocation.utilization_percentage
             
             # Calculate insights
             team_insights = {}
             for team, data in team_patterns.items():
-                if len(data["allocations"]) >= 2:
-                    avg_allocation = sum(data["allocations"]) / len(data["allocations"])
-                    avg_utilization = sum(data["utilizations"]) / len(data["utilizations"])
-                    avg_efficiency = sum(data["efficiency_ratios"]) / len(data["efficiency_ratios"])
+                count = data["count"]
+                if count >= 2:
+                    avg_allocation = data["allocation_sum"] / count
+                    # Sum of squared deviations from the mean
+                    allocation_variance_sum = max(
+                        data["allocation_sq_sum"] - data["allocation_sum"] * avg_allocation, 0.0
+                    )
                     
                     team_insights[team] = {
                         "average_allocation": avg_allocation,
-                        "average_utilization": avg_utilization,
-                        "average_efficiency": avg_efficiency,
+                        "average_utilization": data["utilization_sum"] / count,
+                        "average_efficiency": data["efficiency_sum"] / count,
                         "allocation_trend": "stable",  # Simplified - could be enhanced
                         "consistency_score": 1.0 - (
-                            sum((x - avg_allocation) ** 2 for x in data["allocations"]) / 
-                            (len(data["allocations"]) * avg_allocation) if avg_allocation > 0 else 0
+                            allocation_variance_sum / (count * avg_allocation)
+                            if avg_allocation > 0 else 0
                         )
                     }
             
             project_insights = {}
             for project, data in project_patterns.items():
-                if len(data["total_allocations"]) >= 2:
+                count = data["count"]
+                if count >= 2:
+                    teams_mask = data["teams_mask"]
+                    teams_count = teams_mask.bit_count()
                     project_insights[project] = {
-                        "teams_count": len(data["teams_involved"]),
-                        "teams_involved": list(data["teams_involved"]),
-                        "average_allocation": sum(data["total_allocations"]) / len(data["total_allocations"]),
-                        "average_utilization": sum(data["average_utilization"]) / len(data["average_utilization"]),
-                        "resource_distribution": "multi_team" if len(data["teams_involved"]) > 1 else "single_team"
+                        "teams_count": teams_count,
+                        "teams_involved": [
+                            name for index, name in enumerate(team_names)
+                            if teams_mask >> index & 1
+                        ],
+                        "average_allocation": data["allocation_sum"] / count,
+                        "average_utilization": data["utilization_sum"] / count,
+                        "resource_distribution": "multi_team" if teams_count > 1 else "single_team"
                     }
             
             analysis_result = {
@@ -689,30 +716,30 @@ class CapacityAnalysisService:
         findings = []
         
         if team_insights:
-            # Find most efficient teams
-            efficient_teams = [
+            # Find most efficient teams (only the first few are reported)
+            efficient_teams = list(islice((
                 team for team, data in team_insights.items()
                 if data["average_efficiency"] > 0.9
-            ]
+            ), MAX_FINDING_NAMES))
             if efficient_teams:
-                findings.append(f"High-efficiency teams identified: {', '.join(efficient_teams[:3])}")
+                findings.append(f"High-efficiency teams identified: {', '.join(efficient_teams)}")
             
             # Find teams with capacity issues
-            over_utilized_teams = [
+            over_utilized_teams = list(islice((
                 team for team, data in team_insights.items()
                 if data["average_utilization"] > data["average_allocation"] * 1.1
-            ]
+            ), MAX_FINDING_NAMES))
             if over_utilized_teams:
-                findings.append(f"Teams showing over-utilization patterns: {', '.join(over_utilized_teams[:3])}")
+                findings.append(f"Teams showing over-utilization patterns: {', '.join(over_utilized_teams)}")
         
         if project_insights:
             # Find multi-team projects
-            multi_team_projects = [
+            multi_team_projects = list(islice((
                 project for project, data in project_insights.items()
-                if len(data["teams_involved"]) > 2
-            ]
+                if data["teams_count"] > 2
+            ), MAX_FINDING_NAMES))
             if multi_team_projects:
-                findings.append(f"Complex multi-team projects requiring coordination: {', '.join(multi_team_projects[:3])}")
+                findings.append(f"Complex multi-team projects requiring coordination: {', '.join(multi_team_projects)}")
         
         if not findings:
             findings.append("No significant patterns detected in historical data")
@@ -4,14 +4,32 @@ Field mapping service for dynamic JIRA field mapping management.
 Extends existing service patterns to handle field mappings, transformations, and validation.
 """
 
+import itertools
 import json
-from typing import List, Optional, Dict, Any, Union
+import operator
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Dict, Any, Tuple, Union
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import select, desc, and_, or_
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from sqlalchemy import Row, select, desc, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
 from app.models.field_mapping import (
     FieldMapping, FieldMappingTemplate, FieldMappingVersion,
@@ -23,12 +41,195 @@ from app.schemas.field_mapping import (
     FieldValidationRequest, FieldValidationResponse
 )
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the same errors
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# String values treated as True when converting to boolean fields
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+
+# Sentinel distinguishing absent keys from keys set to None
+_MISSING = object()
+
+# Default JIRA timestamp format used by the date_format transformation
+JIRA_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+# Canonical values of JIRA_DATETIME_FORMAT, which the C parser reads exactly as strptime does
+_JIRA_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{1,6}Z")
+
+
+def _parse_jira_datetime(value: str) -> datetime:
+    """
+    Parse a JIRA_DATETIME_FORMAT value with ciso8601 when it is in canonical form.
+    
+    ciso8601 also accepts date-only values and UTC offsets, dropping the
+    offset, so anything else goes through strptime and fails as before.
+    """
+    if _JIRA_DATETIME_RE.fullmatch(value):
+        return ciso8601.parse_datetime_as_naive(value)
+    return datetime.strptime(value, JIRA_DATETIME_FORMAT)
+
+
+@lru_cache(maxsize=64)
+def _get_date_parser(input_format: str) -> Callable[[str], datetime]:
+    """Get a parser specialised for a fixed input date format."""
+    if input_format == JIRA_DATETIME_FORMAT and CISO8601_AVAILABLE:
+        # C parser for the common ISO-8601 case
+        return _parse_jira_datetime
+    return lambda value: datetime.strptime(value, input_format)
+
+
+
+# Transformation functions, dispatched by transformation type
+def _transform_direct(value: Any, config: Dict[str, Any], field_type: FieldType) -> Any:
+    """Return the value unchanged."""
+    return value
+
+
+def _transform_extract_object_value(value: Any, config: Dict[str, Any], field_type: FieldType) -> Any:
+    """Extract value from object (e.g., {value: "Frontend Team"} -> "Frontend Team")."""
+    if isinstance(value, dict):
+        return value.get(config.get("key", "value"))
+    return value
+
+
+def _transform_string_format(value: Any, config: Dict[str, Any], field_type: FieldType) -> Any:
+    """Format string with template."""
+    if "template" in config:
+        return config["template"].format(value=value)
+    return str(value)
+
+
+def _transform_numeric_conversion(value: Any, config: Dict[str, Any], field_type: FieldType) -> Any:
+    """Convert to numeric with fallback."""
+    try:
+        if field_type == FieldType.INTEGER:
+            return int(float(value)) if value is not None else 0
+        elif field_type == FieldType.FLOAT:
+            return float(value) if value is not None else 0.0
+    except (ValueError, TypeError):
+        return config.get("default", 0)
+    return value
+
+
+def _transform_date_format(value: Any, config: Dict[str, Any], field_type: FieldType) -> Any:
+    """Convert date format."""
+    if isinstance(value, str):
+        try:
+            input_format = config.get("input_format", JIRA_DATETIME_FORMAT)
+            output_format = config.get("output_format", "%Y-%m-%d")
+            dt = _get_date_parser(input_format)(value)
+            return dt.strftime(output_format)
+        except ValueError:
+            return value
+    return value
+
+
+def _transform_conditional(value: Any, config: Dict[str, Any], field_type: FieldType) -> Any:
+    """Return the result of the first matching condition."""
+    conditions = _compile_conditions(config.get("conditions", []))
+    return _evaluate_conditions(value, conditions, config.get("default", _MISSING))
+
+
+_TRANSFORMATIONS: Dict[str, Callable[[Any, Dict[str, Any], FieldType], Any]] = {
+    "direct": _transform_direct,
+    "extract_object_value": _transform_extract_object_value,
+    "string_format": _transform_string_format,
+    "numeric_conversion": _transform_numeric_conversion,
+    "date_format": _transform_date_format,
+    "conditional": _transform_conditional,
+}
+
+# Condition operators for conditional transformations, indexed by operator code
+_CONDITION_OPERATOR_CODES: Dict[str, int] = {
+    "equals": 0,
+    "not_equals": 1,
+    "contains": 2,
+    "starts_with": 3,
+    "ends_with": 4,
+    "greater_than": 5,
+    "less_than": 6,
+}
+
+_CONDITION_EVALUATORS: Tuple[Callable[[Any, Any], bool], ...] = (
+    operator.eq,
+    operator.ne,
+    lambda value, expected: expected in str(value),
+    lambda value, expected: str(value).startswith(str(expected)),
+    lambda value, expected: str(value).endswith(str(expected)),
+    operator.gt,
+    operator.lt,
+)
+
+# Operators comparing float(value) against a numeric expected value
+_NUMERIC_OPERATOR_CODES = frozenset({5, 6})
+
+# (operator code, expected value, result) with result _MISSING when unset
+CompiledCondition = Tuple[int, Any, Any]
+
+
+def _compile_conditions(conditions: List[Dict[str, Any]]) -> Tuple[CompiledCondition, ...]:
+    """Normalise condition dicts into tuples evaluated by operator code."""
+    compiled = []
+    for condition in conditions:
+        op_code = _CONDITION_OPERATOR_CODES.get(condition.get("operator", "equals"))
+        if op_code is None:
+            # Unknown operators never match
+            continue
+        
+        expected = condition.get("value")
+        if op_code in _NUMERIC_OPERATOR_CODES:
+            try:
+                expected = float(expected)
+            except (ValueError, TypeError):
+                # Left as-is so the comparison fails when this condition is reached
+                pass
+        
+        compiled.append((op_code, expected, condition.get("result", _MISSING)))
+    return tuple(compiled)
+
+
+def _evaluate_conditions(
+    value: Any,
+    conditions: Tuple[CompiledCondition, ...],
+    default: Any
+) -> Any:
+    """Return the result of the first matching compiled condition."""
+    numeric_value = None
+    for op_code, expected, result in conditions:
+        if op_code in _NUMERIC_OPERATOR_CODES:
+            if numeric_value is None:
+                # Convert once for every numeric comparison against this value
+                numeric_value = float(value)
+            matched = _CONDITION_EVALUATORS[op_code](numeric_value, expected)
+        else:
+            matched = _CONDITION_EVALUATORS[op_code](value, expected)
+        
+        if matched:
+            return value if result is _MISSING else result
+    return value if default is _MISSING else default
+
+
+@dataclass(frozen=True)
+class CompiledFieldMapping:
+    """Field mapping with its per-issue decisions resolved up front."""
+    name: str
+    jira_field_id: str
+    target_field: str
+    field_type: FieldType
+    default_value: Optional[str]
+    is_required: bool
+    transform: Optional[Callable[[Any], Any]]
+    validation_rules: Optional[Dict[str, Any]]
 
 class FieldMappingService:
     """Service class for field mapping operations."""
     
     def __init__(self, db: AsyncSession):
         self.db = db
+        # Compiled mapping plans keyed by template ID
+        self._mapping_plans: Dict[Optional[int], List[CompiledFieldMapping]] = {}
+        # Disambiguates version numbers generated within the same millisecond
+        self._version_sequence = itertools.count()
     
     # Field Mapping CRUD operations
     async def get_field_mappings(
@@ -93,15 +294,77 @@ class FieldMappingService:
         mapping = FieldMapping(**mapping_data.model_dump())
         self.db.add(mapping)
         await self.db.commit()
+        self._mapping_plans.clear()
         await self.db.refresh(mapping, ["template"])
         
         # Create version record
         await self._create_version_record(
-            mapping.id, "create", "Initial creation", None, mapping_data.model_dump()
+            mapping.id, "create", "Initial creation", None, mapping_data.model_dump(mode="json")
         )
         
         return mapping
     
+    async def bulk_create_field_mappings(
+        self,
+        mappings_data: List[FieldMappingCreate],
+        template_id: Optional[int] = None,
+        commit: bool = True
+    ) -> List[int]:
+        """
+        Create multiple field mappings with batched inserts.
+        
+        Mappings and their version records are written with one INSERT each,
+        so the number of round trips does not grow with the number of mappings.
+        
+        Args:
+            mappings_data: Field mappings to create
+            template_id: Template to assign to every mapping, if provided
+            commit: Whether to commit; pass False to keep the caller's transaction open
+            
+        Returns:
+            IDs of the created mappings, in input order
+        """
+        if not mappings_data:
+            return []
+        
+        rows = []
+        configs = []
+        for mapping_data in mappings_data:
+            row = mapping_data.model_dump()
+            if template_id is not None:
+                row["template_id"] = template_id
+            rows.append(row)
+            configs.append(mapping_data.model_dump(mode="json"))
+        
+        result = await self.db.execute(
+            # RETURNING rows are matched to their parameter sets, so the ids
+            # zip with configs below in input order
+            FieldMapping.__table__.insert().returning(
+                FieldMapping.id, sort_by_parameter_order=True
+            ),
+            rows
+        )
+        mapping_ids = list(result.scalars().all())
+        
+        version_rows = [
+            {
+                "mapping_id": mapping_id,
+                "version_number": self._next_version_number(),
+                "change_type": "create",
+                "change_description": "Initial creation",
+                "previous_config": None,
+                "new_config": config
+            }
+            for mapping_id, config in zip(mapping_ids, configs)
+        ]
+        await self.db.execute(FieldMappingVersion.__table__.insert(), version_rows)
+        
+        if commit:
+            await self.db.commit()
+        self._mapping_plans.clear()
+        
+        return mapping_ids
+    
     async def update_field_mapping(
         self, 
         mapping_id: int, 
@@ -130,7 +393,10 @@ class FieldMappingService:
             setattr(mapping, field, value)
         
         await self.db.commit()
-        await self.db.refresh(mapping, ["template"])
+        self._mapping_plans.clear()
+        # The template was loaded with the mapping; reload it only if it changed
+        if "template_id" in update_data:
+            await self.db.refresh(mapping, ["template"])
         
         # Create version record
         await self._create_version_record(
@@ -148,6 +414,7 @@ class FieldMappingService:
         
         mapping.is_active = False
         await self.db.commit()
+        self._mapping_plans.clear()
         
         # Create version record
         await self._create_version_record(
@@ -161,12 +428,24 @@ class FieldMappingService:
         self, 
         skip: int = 0, 
         limit: int = 100,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        include_mappings: bool = True
     ) -> List[FieldMappingTemplate]:
-        """Get list of field mapping templates."""
-        query = select(FieldMappingTemplate).options(
-            selectinload(FieldMappingTemplate.mappings)
-        )
+        """
+        Get list of field mapping templates.
+        
+        Callers that only need the templates themselves can pass
+        include_mappings=False to skip loading mappings; the mappings
+        collection is then left empty.
+        """
+        if include_mappings:
+            query = select(FieldMappingTemplate).options(
+                selectinload(FieldMappingTemplate.mappings)
+            )
+        else:
+            query = select(FieldMappingTemplate).options(
+                noload(FieldMappingTemplate.mappings)
+            )
         
         if is_active is not None:
             query = query.where(FieldMappingTemplate.is_active == is_active)
@@ -202,37 +481,31 @@ class FieldMappingService:
         self.db.add(template)
         await self.db.flush()  # Get the ID
         
-        # Create associated mappings
-        for mapping_data in mappings_data:
-            mapping_data.template_id = template.id
-            mapping = FieldMapping(**mapping_data.model_dump())
-            self.db.add(mapping)
+        # Create associated mappings in the same transaction
+        await self.bulk_create_field_mappings(
+            mappings_data, template_id=template.id, commit=False
+        )
         
         await self.db.commit()
+        self._mapping_plans.clear()
         await self.db.refresh(template, ["mappings"])
         
         return template
     
     # Field transformation and validation
-    async def transform_field_value(
+    def transform_field_value(
         self, 
         transformation_request: FieldTransformationRequest
     ) -> FieldTransformationResponse:
         """Transform a field value based on transformation configuration."""
         try:
-            source_value = transformation_request.source_value
-            field_type = transformation_request.field_type
-            transformation_config = transformation_request.transformation_config or {}
-            
-            # Apply transformation based on type
-            transformed_value = await self._apply_transformation(
-                source_value, transformation_request.transformation_type, 
-                transformation_config, field_type
+            final_value = self._transform_value(
+                transformation_request.source_value,
+                transformation_request.transformation_type,
+                transformation_request.transformation_config or {},
+                transformation_request.field_type
             )
             
-            # Convert to target type
-            final_value = await self._convert_to_type(transformed_value, field_type)
-            
             return FieldTransformationResponse(
                 transformed_value=final_value,
                 success=True
@@ -245,40 +518,17 @@ class FieldMappingService:
                 error_message=str(e)
             )
     
-    async def validate_field_value(
+    def validate_field_value(
         self, 
         validation_request: FieldValidationRequest
     ) -> FieldValidationResponse:
         """Validate a field value against validation rules."""
-        try:
-            field_value = validation_request.field_value
-            validation_rules = validation_request.validation_rules
-            field_type = validation_request.field_type
-            is_required = validation_request.is_required
-            
-            # Check required validation
-            if is_required and (field_value is None or field_value == ""):
-                return FieldValidationResponse(
-                    is_valid=False,
-                    error_messages=["Field is required but no value provided"]
-                )
-            
-            # Skip validation if value is None/empty and not required
-            if field_value is None or field_value == "":
-                return FieldValidationResponse(is_valid=True)
-            
-            # Apply validation rules
-            validation_result = await self._apply_validation_rules(
-                field_value, validation_rules, field_type
-            )
-            
-            return validation_result
-            
-        except Exception as e:
-            return FieldValidationResponse(
-                is_valid=False,
-                error_messages=[f"Validation error: {str(e)}"]
-            )
+        return self._validate_value(
+            validation_request.field_value,
+            validation_request.validation_rules,
+            validation_request.field_type,
+            validation_request.is_required
+        )
     
     async def apply_field_mappings(
         self, 
@@ -286,15 +536,93 @@ class FieldMappingService:
         template_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """Apply field mappings to JIRA data."""
-        result = {}
+        plan = await self._get_mapping_plan(template_id)
+        return self._apply_mapping_plan(plan, jira_data)
+    
+    async def apply_field_mappings_batch(
+        self,
+        issues: Iterable[Dict[str, Any]],
+        template_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply field mappings to many JIRA issues.
         
-        # Get active field mappings
-        mappings = await self.get_field_mappings(
-            template_id=template_id, 
-            is_active=True
-        )
+        The mappings are fetched and compiled once for the whole batch.
         
+        Args:
+            issues: JIRA issue data to map
+            template_id: Template whose mappings to apply
+            
+        Returns:
+            Mapped data for each issue, in input order
+        """
+        plan = await self._get_mapping_plan(template_id)
+        return [self._apply_mapping_plan(plan, issue) for issue in issues]
+    
+    # Private helper methods
+    async def _get_mapping_plan(self, template_id: Optional[int] = None) -> List[CompiledFieldMapping]:
+        """Get the compiled mapping plan for a template, compiling it on first use."""
+        plan = self._mapping_plans.get(template_id)
+        if plan is None:
+            mappings = await self.get_active_mappings(template_id)
+            plan = self._compile_mapping_plan(mappings)
+            self._mapping_plans[template_id] = plan
+        return plan
+    
+    def _compile_mapping_plan(self, mappings: List[Any]) -> List[CompiledFieldMapping]:
+        """Resolve the template-invariant decisions for each mapping once."""
+        plan = []
         for mapping in mappings:
+            transform = None
+            if mapping.transformation_config and mapping.mapping_type == MappingType.TRANSFORMATION:
+                transform = self._bind_transformation(
+                    mapping.transformation_config, mapping.field_type
+                )
+            
+            plan.append(CompiledFieldMapping(
+                name=mapping.name,
+                jira_field_id=mapping.jira_field_id,
+                target_field=mapping.target_field,
+                field_type=mapping.field_type,
+                default_value=mapping.default_value,
+                is_required=mapping.is_required,
+                transform=transform,
+                validation_rules=mapping.validation_rules or None
+            ))
+        return plan
+    
+    def _bind_transformation(
+        self,
+        config: Dict[str, Any],
+        field_type: FieldType
+    ) -> Callable[[Any], Any]:
+        """Bind a transformation and type conversion to a mapping's configuration."""
+        transformation_type = config.get("type", "direct")
+        if transformation_type == "conditional":
+            # Normalise the conditions once instead of for every value
+            conditions = _compile_conditions(config.get("conditions", []))
+            default = config.get("default", _MISSING)
+            
+            def transformation(value: Any, config: Dict[str, Any], field_type: FieldType) -> Any:
+                return _evaluate_conditions(value, conditions, default)
+        else:
+            transformation = _TRANSFORMATIONS.get(transformation_type, _transform_direct)
+        convert_to_type = self._convert_to_type
+        
+        def transform(value: Any) -> Any:
+            return convert_to_type(transformation(value, config, field_type), field_type)
+        
+        return transform
+    
+    def _apply_mapping_plan(
+        self,
+        plan: List[CompiledFieldMapping],
+        jira_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Apply a compiled mapping plan to JIRA data."""
+        result = {}
+        
+        for mapping in plan:
             try:
                 # Extract value from JIRA data
                 jira_value = self._extract_jira_field_value(jira_data, mapping.jira_field_id)
@@ -308,30 +636,21 @@ class FieldMappingService:
                     continue
                 
                 # Apply transformation if configured
-                if mapping.transformation_config and mapping.mapping_type == MappingType.TRANSFORMATION:
-                    transform_request = FieldTransformationRequest(
-                        source_value=jira_value,
-                        transformation_type=mapping.transformation_config.get("type", "direct"),
-                        transformation_config=mapping.transformation_config,
-                        field_type=mapping.field_type
-                    )
-                    transform_response = await self.transform_field_value(transform_request)
-                    
-                    if transform_response.success:
-                        jira_value = transform_response.transformed_value
-                    else:
-                        # Log transformation error and use original value
-                        jira_value = jira_value
+                if mapping.transform is not None:
+                    try:
+                        jira_value = mapping.transform(jira_value)
+                    except Exception:
+                        # Keep the original value if the transformation fails
+                        pass
                 
                 # Apply validation if configured
-                if mapping.validation_rules:
-                    validation_request = FieldValidationRequest(
-                        field_value=jira_value,
-                        validation_rules=mapping.validation_rules,
-                        field_type=mapping.field_type,
-                        is_required=mapping.is_required
+                if mapping.validation_rules is not None:
+                    validation_response = self._validate_value(
+                        jira_value,
+                        mapping.validation_rules,
+                        mapping.field_type,
+                        mapping.is_required
                     )
-                    validation_response = await self.validate_field_value(validation_request)
                     
                     if not validation_response.is_valid:
                         # Use default value or skip if validation fails
@@ -350,7 +669,6 @@ class FieldMappingService:
         
         return result
     
-    # Private helper methods
     async def _create_version_record(
         self, 
         mapping_id: int, 
@@ -362,7 +680,7 @@ class FieldMappingService:
         """Create a version record for field mapping changes."""
         version = FieldMappingVersion(
             mapping_id=mapping_id,
-            version_number=f"{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            version_number=self._next_version_number(),
             change_type=change_type,
             change_description=description,
             previous_config=previous_config,
@@ -370,13 +688,86 @@ class FieldMappingService:
         )
         self.db.add(version)
     
+    def _next_version_number(self) -> str:
+        """Generate a version number: epoch milliseconds plus a per-service sequence."""
+        return f"{time.time_ns() // 1_000_000}_{next(self._version_sequence)}"
+    
+    async def get_active_mappings(self, template_id: Optional[int] = None) -> List[Row]:
+        """
+        Get the active mappings to apply, selecting only the columns used.
+        
+        Skips loading the template relationship and unused columns, and
+        returns every active mapping rather than a paginated subset.
+        """
+        query = select(
+            FieldMapping.name,
+            FieldMapping.jira_field_id,
+            FieldMapping.target_field,
+            FieldMapping.field_type,
+            FieldMapping.mapping_type,
+            FieldMapping.transformation_config,
+            FieldMapping.validation_rules,
+            FieldMapping.default_value,
+            FieldMapping.is_required
+        ).where(FieldMapping.is_active == True)
+        
+        if template_id:
+            query = query.where(FieldMapping.template_id == template_id)
+        
+        query = query.order_by(desc(FieldMapping.updated_at))
+        
+        result = await self.db.execute(query)
+        return result.all()
+    
     async def _get_template_by_name(self, name: str) -> Optional[FieldMappingTemplate]:
         """Get template by name."""
         query = select(FieldMappingTemplate).where(FieldMappingTemplate.name == name)
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
-    async def _apply_transformation(
+    def _transform_value(
+        self,
+        value: Any,
+        transformation_type: str,
+        config: Dict[str, Any],
+        field_type: FieldType
+    ) -> Any:
+        """Transform a value and convert it to the target field type."""
+        transformed_value = self._apply_transformation(
+            value, transformation_type, config, field_type
+        )
+        return self._convert_to_type(transformed_value, field_type)
+    
+    def _validate_value(
+        self,
+        value: Any,
+        rules: Dict[str, Any],
+        field_type: FieldType,
+        is_required: bool
+    ) -> FieldValidationResponse:
+        """Validate a value, including the required check."""
+        try:
+            # Check required validation
+            if is_required and (value is None or value == ""):
+                return FieldValidationResponse(
+                    is_valid=False,
+                    error_messages=["Field is required but no value provided"]
+                )
+            
+            # Skip validation if value is None/empty and not required
+            if value is None or value == "":
+                return FieldValidationResponse(is_valid=True)
+            
+            # Apply validation rules
+            return self._apply_validation_rules(value, rules, field_type)
+            
+        except Exception as e:
+            return FieldValidationResponse(
+                is_valid=False,
+                error_messages=[f"Validation error: {str(e)}"]
+            )
+    
+    def _apply_transformation(
         self, 
         value: Any, 
         transformation_type: str,
@@ -384,55 +775,10 @@ class FieldMappingService:
         field_type: FieldType
     ) -> Any:
         """Apply transformation to a field value."""
-        if transformation_type == "direct":
-            return value
-        
-        elif transformation_type == "extract_object_value":
-            # Extract value from object (e.g., {value: "Frontend Team"} -> "Frontend Team")
-            if isinstance(value, dict):
-                return value.get(config.get("key", "value"))
-            return value
-        
-        elif transformation_type == "string_format":
-            # Format string with template
-            if "template" in config:
-                return config["template"].format(value=value)
-            return str(value)
-        
-        elif transformation_type == "numeric_conversion":
-            # Convert to numeric with fallback
-            try:
-                if field_type == FieldType.INTEGER:
-                    return int(float(value)) if value is not None else 0
-                elif field_type == FieldType.FLOAT:
-                    return float(value) if value is not None else 0.0
-            except (ValueError, TypeError):
-                return config.get("default", 0)
-        
-        elif transformation_type == "date_format":
-            # Convert date format
-            from datetime import datetime
-            if isinstance(value, str):
-                try:
-                    input_format = config.get("input_format", "%Y-%m-%dT%H:%M:%S.%fZ")
-                    output_format = config.get("output_format", "%Y-%m-%d")
-                    dt = datetime.strptime(value, input_format)
-                    return dt.strftime(output_format)
-                except ValueError:
-                    return value
-            return value
-        
-        elif transformation_type == "conditional":
-            # Conditional transformation
-            conditions = config.get("conditions", [])
-            for condition in conditions:
-                if self._evaluate_condition(value, condition):
-                    return condition.get("result", value)
-            return config.get("default", value)
-        
-        return value
+        transform = _TRANSFORMATIONS.get(transformation_type, _transform_direct)
+        return transform(value, config, field_type)
     
-    async def _convert_to_type(self, value: Any, field_type: FieldType) -> Any:
+    def _convert_to_type(self, value: Any, field_type: FieldType) -> Any:
         """Convert value to target field type."""
         if value is None:
             return None
@@ -446,7 +792,7 @@ class FieldMappingService:
                 return float(value)
             elif field_type == FieldType.BOOLEAN:
                 if isinstance(value, str):
-                    return value.lower() in ["true", "1", "yes", "on"]
+                    return value.lower() in _TRUE_STRINGS
                 return bool(value)
             elif field_type == FieldType.LIST:
                 if isinstance(value, str):
@@ -457,14 +803,14 @@ class FieldMappingService:
                     return [value]
             elif field_type == FieldType.OBJECT:
                 if isinstance(value, str):
-                    return json.loads(value)
+                    return _json_loads(value)
                 return value
             else:
                 return value
         except (ValueError, TypeError, json.JSONDecodeError):
             return value
     
-    async def _apply_validation_rules(
+    def _apply_validation_rules(
         self, 
         value: Any, 
         rules: Dict[str, Any], 
@@ -477,7 +823,7 @@ class FieldMappingService:
         # Type validation
         if "type_check" in rules and rules["type_check"]:
             try:
-                await self._convert_to_type(value, field_type)
+                self._convert_to_type(value, field_type)
             except:
                 errors.append(f"Value cannot be converted to {field_type.value}")
         
@@ -514,33 +860,11 @@ class FieldMappingService:
     def _extract_jira_field_value(self, jira_data: Dict[str, Any], field_id: str) -> Any:
         """Extract field value from JIRA data structure."""
         # Handle nested field structure (fields.customfield_xxx)
-        if "fields" in jira_data and field_id in jira_data["fields"]:
-            return jira_data["fields"][field_id]
+        fields = jira_data.get("fields")
+        if fields:
+            value = fields.get(field_id, _MISSING)
+            if value is not _MISSING:
+                return value
         
         # Handle direct field access
-        if field_id in jira_data:
-            return jira_data[field_id]
-        
-        return None
-    
-    def _evaluate_condition(self, value: Any, condition: Dict[str, Any]) -> bool:
-        """Evaluate a conditional transformation."""
-        operator = condition.get("operator", "equals")
-        expected = condition.get("value")
-        
-        if operator == "equals":
-            return value == expected
-        elif operator == "not_equals":
-            return value != expected
-        elif operator == "contains":
-            return expected in str(value)
-        elif operator == "starts_with":
-            return str(value).startswith(str(expected))
-        elif operator == "ends_with":
-            return str(value).endswith(str(expected))
-        elif operator == "greater_than":
-            return float(value) > float(expected)
-        elif operator == "less_than":
-            return float(value) < float(expected)
-        
-        return False
\ No newline at end of file
+        return jira_data.get(field_id)
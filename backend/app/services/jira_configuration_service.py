@@ -5,28 +5,121 @@ Provides CRUD operations, connection testing, validation, and monitoring
 for JIRA configurations with proper encryption and error handling.
 """
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+from urllib.parse import urlparse
+
+import httpx
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, and_, or_, func
+from sqlalchemy import select, update, delete, and_, or_, func, lambda_stmt
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, make_transient_to_detached, raiseload
 
 from app.core.config import settings
 from app.core.exceptions import ExternalServiceError, ValidationError, SprintReportsException
 from app.core.logging import get_logger
 from app.models.jira_configuration import JiraConfiguration
-from app.enums import JiraInstanceType, JiraAuthMethod, ConnectionStatus
+from app.enums import JiraInstanceType, ConnectionStatus
 from app.schemas.jira import (
     JiraConnectionConfig,
     JiraConnectionTest,
     JiraConnectionTestResult
 )
-from app.services.jira_service import JiraService, JiraAPIClient
+from app.services.jira_service import JiraService, JiraAPIClient, HTTP2_AVAILABLE, invalidate_cache
 
 logger = get_logger(__name__)
 
+# Maximum number of connection tests run at once while monitoring
+MONITOR_TEST_CONCURRENCY = 10
+
+# Connection pools shared by the configuration API clients of each event loop,
+# created on first use. httpx transports are bound to the loop they run on.
+_shared_transports: Dict[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = {}
+
+# Fields whose change requires re-testing the connection
+_TEST_REQUIRED_FIELDS = frozenset({
+    'url', 'auth_method', 'email', 'api_token',
+    'username', 'password', 'oauth_config'
+})
+
+# Plain column fields that can be written with a single UPDATE ... RETURNING;
+# anything else needs the ORM path for validators, encryption or testing
+_IN_PLACE_UPDATE_FIELDS = frozenset({
+    'description', 'is_active', 'is_default', 'custom_fields',
+    'tags', 'api_version', 'server_info', 'capabilities'
+})
+
+# Configurations fetched per batch when streaming configuration rows
+CONFIGURATION_STREAM_BATCH_SIZE = 100
+
+# Seconds a cached default configuration is served before re-querying
+DEFAULT_CONFIG_CACHE_TTL = 60
+
+# Default configuration per environment as (version, expires_at, snapshot).
+# The snapshot is a detached copy, or None when the environment has no default.
+_default_config_cache: Dict[str, Tuple[int, float, Optional[JiraConfiguration]]] = {}
+
+# Per-environment version, bumped whenever configurations in it are written
+_default_config_versions: Dict[str, int] = {}
+
+# Reusable API clients for persisted configurations, keyed by event loop and
+# configuration ID. Each entry carries the fingerprint of the stored connection
+# settings so that edits to the URL or credentials never reuse a stale client.
+_client_cache: Dict[
+    Tuple[asyncio.AbstractEventLoop, int],
+    Tuple[Tuple[Any, ...], JiraConnectionConfig, JiraAPIClient]
+] = {}
+
+
+def _prune_closed_loops() -> None:
+    """
+    Drop cached clients and transports of event loops that have been closed.
+    
+    They cannot be closed from another loop, so they are only forgotten.
+    """
+    for key in [key for key in _client_cache if key[0].is_closed()]:
+        del _client_cache[key]
+    for loop in [loop for loop in _shared_transports if loop.is_closed()]:
+        del _shared_transports[loop]
+
+
+@dataclass(slots=True)
+class ConfigStatus:
+    """Monitoring status of a single JIRA configuration."""
+    id: int
+    name: str
+    url: str
+    status: str
+    is_healthy: bool
+    last_tested: Optional[datetime]
+    consecutive_errors: int
+    avg_response_time_ms: Optional[int]
+
+
+@dataclass(slots=True)
+class MonitorSummary:
+    """Health summary of the JIRA configurations in an environment."""
+    total_configurations: int
+    healthy_count: int
+    error_count: int
+    inactive_count: int
+    health_percentage: float
+    environment: Optional[str]
+    timestamp: datetime
+    configurations: List[ConfigStatus]
+
+
+@lru_cache(maxsize=256)
+def _is_atlassian_cloud_url(url: str) -> bool:
+    """Check whether a URL points at an Atlassian Cloud host."""
+    hostname = urlparse(url).hostname
+    return bool(hostname) and hostname.endswith('.atlassian.net')
+
 
 class JiraConfigurationService:
     """
@@ -77,12 +170,16 @@ class JiraConfigurationService:
         try:
             self.logger.info(f"Creating JIRA configuration '{name}' for environment '{environment}'")
             
-            # Test connection first if requested
+            # Test connection first if requested, overlapping the network
+            # round-trip with the read-only default-check query
             if test_connection:
-                test_result = await self._test_configuration_connection(config)
+                test_result, (active_count, default_count) = await asyncio.gather(
+                    self._test_configuration_connection(config),
+                    self._count_active_and_defaults(environment)
+                )
                 if not test_result.connection_valid:
                     error_msg = f"Connection test failed: {', '.join(test_result.errors)}"
-                    self.logger.error(f"Configuration creation failed - {error_msg}")
+                    self.logger.warning(f"Configuration creation failed - {error_msg}")
                     raise ExternalServiceError("JIRA", error_msg)
             
             # Auto-detect instance type if not specified
@@ -91,14 +188,8 @@ class JiraConfigurationService:
                 instance_type = self._detect_instance_type(config.url)
             
             # Create configuration model
-            # Ensure we use string values for enums, not enum objects
-            if isinstance(config.auth_method, str):
-                auth_method_value = config.auth_method
-            else:
-                auth_method_value = config.auth_method.value
-                
-            status_value = 'active' if test_connection else 'pending'
-            instance_type_value = 'cloud' if instance_type else 'server'
+            status_value = ConnectionStatus.ACTIVE if test_connection else ConnectionStatus.PENDING
+            instance_type_value = JiraInstanceType.CLOUD if instance_type else JiraInstanceType.SERVER
             
             
             jira_config = JiraConfiguration(
@@ -106,7 +197,7 @@ class JiraConfigurationService:
                 description=description,
                 url=config.url,
                 instance_type=instance_type_value,
-                auth_method=auth_method_value,
+                auth_method=config.auth_method,
                 email=config.email,
                 username=config.username,
                 created_by_user_id=user_id,
@@ -123,15 +214,19 @@ class JiraConfigurationService:
                 jira_config.oauth_config = config.oauth_config
             
             # Handle default configuration logic
-            if await self._should_set_as_default(environment):
+            if not test_connection:
+                active_count, default_count = await self._count_active_and_defaults(environment)
+            if active_count == 0:
+                # First active configuration becomes the default
                 jira_config.is_default = True
                 # Unset other defaults for this environment
-                await self._unset_other_defaults(environment)
+                if default_count:
+                    await self._unset_other_defaults(environment)
             
             # Save to database
             self.db.add(jira_config)
             await self.db.commit()
-            await self.db.refresh(jira_config)
+            self._invalidate_default_configuration(environment)
             
             self.logger.info(f"Successfully created JIRA configuration {jira_config.id} '{name}'")
             return jira_config
@@ -141,7 +236,7 @@ class JiraConfigurationService:
             raise
         except IntegrityError as e:
             await self.db.rollback()
-            self.logger.error(f"Database integrity error creating configuration: {e}")
+            self.logger.warning(f"Database integrity error creating configuration: {e}")
             raise ValidationError(f"Configuration with name '{name}' already exists")
         except SQLAlchemyError as e:
             await self.db.rollback()
@@ -149,7 +244,7 @@ class JiraConfigurationService:
             raise SprintReportsException("Failed to create JIRA configuration")
         except Exception as e:
             await self.db.rollback()
-            self.logger.error(f"Unexpected error creating configuration: {e}", exc_info=True)
+            self.logger.exception(f"Unexpected error creating configuration: {e}")
             raise SprintReportsException("Unexpected error creating JIRA configuration")
     
     async def get_configuration(self, config_id: int) -> Optional[JiraConfiguration]:
@@ -168,8 +263,10 @@ class JiraConfigurationService:
         try:
             self.logger.debug(f"Retrieving JIRA configuration {config_id}")
             
+            # Lambda statements are cached by code location, so the query is
+            # built and compiled once and only config_id is bound per call
             result = await self.db.execute(
-                select(JiraConfiguration).where(JiraConfiguration.id == config_id)
+                lambda_stmt(lambda: select(JiraConfiguration).where(JiraConfiguration.id == config_id))
             )
             config = result.scalar_one_or_none()
             
@@ -214,24 +311,8 @@ class JiraConfigurationService:
                 f"status: {status}, active: {is_active}, limit: {limit}, offset: {offset}"
             )
             
-            query = select(JiraConfiguration)
-            
-            # Apply filters
-            filters = []
-            if environment is not None:
-                filters.append(JiraConfiguration.environment == environment)
-            if status is not None:
-                filters.append(JiraConfiguration.status == status)
-            if is_active is not None:
-                filters.append(JiraConfiguration.is_active == is_active)
-            
-            if filters:
-                query = query.where(and_(*filters))
-            
-            # Apply ordering, limit, and offset
-            query = query.order_by(
-                JiraConfiguration.is_default.desc(),
-                JiraConfiguration.created_at.desc()
+            query = self._build_configurations_query(
+                environment, status, is_active
             ).limit(limit).offset(offset)
             
             result = await self.db.execute(query)
@@ -244,6 +325,85 @@ class JiraConfigurationService:
             self.logger.error(f"Database error retrieving configurations: {e}")
             raise SprintReportsException("Failed to retrieve JIRA configurations")
     
+    async def get_configurations_stream(
+        self,
+        environment: Optional[str] = None,
+        status: Optional[ConnectionStatus] = None,
+        is_active: Optional[bool] = None
+    ) -> AsyncIterator[JiraConfiguration]:
+        """
+        Stream all matching JIRA configurations without buffering the result.
+        
+        Rows are fetched from a server-side cursor in batches of
+        CONFIGURATION_STREAM_BATCH_SIZE.
+        
+        Args:
+            environment: Filter by environment
+            status: Filter by connection status
+            is_active: Filter by active status
+            
+        Yields:
+            JIRA configurations in listing order
+            
+        Raises:
+            SprintReportsException: If database operation fails
+        """
+        query = self._build_configurations_query(environment, status, is_active)
+        try:
+            result = await self.db.stream_scalars(
+                query.execution_options(yield_per=CONFIGURATION_STREAM_BATCH_SIZE)
+            )
+            async for config in result:
+                yield config
+                
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error streaming configurations: {e}")
+            raise SprintReportsException("Failed to retrieve JIRA configurations")
+    
+    async def get_configurations_page(
+        self,
+        environment: Optional[str] = None,
+        status: Optional[ConnectionStatus] = None,
+        is_active: Optional[bool] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Tuple[List[JiraConfiguration], int]:
+        """
+        Get a page of JIRA configurations together with the total match count.
+        
+        The total is computed with a window function in the same query, so no
+        separate COUNT round-trip is needed. A page past the end returns no
+        rows and a total of 0.
+        
+        Args:
+            environment: Filter by environment
+            status: Filter by connection status
+            is_active: Filter by active status
+            limit: Maximum number of results
+            offset: Number of results to skip
+            
+        Returns:
+            Tuple of (configurations, total matching configurations)
+            
+        Raises:
+            SprintReportsException: If database operation fails
+        """
+        try:
+            query = self._build_configurations_query(
+                environment, status, is_active
+            ).add_columns(func.count().over()).limit(limit).offset(offset)
+            
+            result = await self.db.execute(query)
+            rows = result.all()
+            
+            total = rows[0][1] if rows else 0
+            self.logger.debug(f"Found {len(rows)} of {total} JIRA configurations")
+            return [row[0] for row in rows], total
+            
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error retrieving configurations: {e}")
+            raise SprintReportsException("Failed to retrieve JIRA configurations")
+    
     async def get_default_configuration(
         self, 
         environment: str = "production"
@@ -260,17 +420,24 @@ class JiraConfigurationService:
         Raises:
             SprintReportsException: If database operation fails
         """
+        version = _default_config_versions.get(environment, 0)
+        cached = _default_config_cache.get(environment)
+        if cached and cached[0] == version and cached[1] > time.monotonic():
+            self.logger.debug(f"Using cached default configuration for environment '{environment}'")
+            snapshot = cached[2]
+            return await self.db.merge(snapshot, load=False) if snapshot is not None else None
+        
         try:
             self.logger.debug(f"Retrieving default JIRA configuration for environment '{environment}'")
             
             result = await self.db.execute(
-                select(JiraConfiguration).where(
+                lambda_stmt(lambda: select(JiraConfiguration).where(
                     and_(
                         JiraConfiguration.is_default == True,
                         JiraConfiguration.environment == environment,
                         JiraConfiguration.is_active == True
                     )
-                )
+                ))
             )
             config = result.scalar_one_or_none()
             
@@ -279,6 +446,13 @@ class JiraConfigurationService:
             else:
                 self.logger.debug(f"No default configuration found for environment '{environment}'")
             
+            # Stored under the version read before the query, so a write that
+            # happened meanwhile leaves the entry already invalid
+            _default_config_cache[environment] = (
+                version,
+                time.monotonic() + DEFAULT_CONFIG_CACHE_TTL,
+                self._detached_copy(config) if config else None
+            )
             return config
             
         except SQLAlchemyError as e:
@@ -310,6 +484,9 @@ class JiraConfigurationService:
         try:
             self.logger.info(f"Updating JIRA configuration {config_id}")
             
+            if updates and _IN_PLACE_UPDATE_FIELDS.issuperset(updates):
+                return await self._update_in_place(config_id, updates)
+            
             # Get existing configuration
             config = await self.get_configuration(config_id)
             if not config:
@@ -324,25 +501,30 @@ class JiraConfigurationService:
                 
                 if not test_result.connection_valid:
                     error_msg = f"Connection test failed: {', '.join(test_result.errors)}"
-                    self.logger.error(f"Configuration update failed - {error_msg}")
+                    self.logger.warning(f"Configuration update failed - {error_msg}")
                     raise ExternalServiceError("JIRA", error_msg)
             
+            original_environment = config.environment
+            
             # Apply updates
+            promote_default = bool(updates.get('is_default'))
             for key, value in updates.items():
+                if key == 'is_default' and promote_default:
+                    # Applied together with clearing the other defaults below
+                    continue
                 if hasattr(config, key):
                     setattr(config, key, value)
                 else:
                     self.logger.warning(f"Ignoring unknown field '{key}' in update")
             
             # Handle default configuration changes
-            if updates.get('is_default'):
-                await self._unset_other_defaults(config.environment, exclude_id=config_id)
-            
-            # Update timestamp
-            config.updated_at = datetime.now(timezone.utc)
+            if promote_default:
+                await self._promote_default(config.environment, config_id)
             
+            # updated_at is set by the database on flush (onupdate=func.now())
             await self.db.commit()
-            await self.db.refresh(config)
+            self._invalidate_default_configuration(original_environment, config.environment)
+            await self._evict_cached_client(config_id)
             
             self.logger.info(f"Successfully updated JIRA configuration {config_id}")
             return config
@@ -356,9 +538,50 @@ class JiraConfigurationService:
             raise SprintReportsException(f"Failed to update JIRA configuration {config_id}")
         except Exception as e:
             await self.db.rollback()
-            self.logger.error(f"Unexpected error updating configuration {config_id}: {e}", exc_info=True)
+            self.logger.exception(f"Unexpected error updating configuration {config_id}: {e}")
             raise SprintReportsException("Unexpected error updating JIRA configuration")
     
+    async def _update_in_place(
+        self,
+        config_id: int,
+        updates: Dict[str, Any]
+    ) -> Optional[JiraConfiguration]:
+        """
+        Apply plain column updates with one UPDATE ... RETURNING statement.
+        
+        Used when no field needs validation, encryption or a connection test,
+        so the configuration does not have to be loaded first.
+        """
+        promote_default = bool(updates.get('is_default'))
+        values = {
+            key: value for key, value in updates.items()
+            if not (key == 'is_default' and promote_default)
+        }
+        
+        # updated_at is set in the same statement by the column's onupdate=func.now()
+        result = await self.db.execute(
+            update(JiraConfiguration)
+            .where(JiraConfiguration.id == config_id)
+            .values(**values)
+            .returning(JiraConfiguration)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        config = result.scalar_one_or_none()
+        if not config:
+            await self.db.rollback()
+            self.logger.warning(f"Configuration {config_id} not found for update")
+            return None
+        
+        # Handle default configuration changes
+        if promote_default:
+            await self._promote_default(config.environment, config_id)
+        
+        await self.db.commit()
+        self._invalidate_default_configuration(config.environment)
+        
+        self.logger.info(f"Successfully updated JIRA configuration {config_id}")
+        return config
+    
     async def delete_configuration(self, config_id: int) -> bool:
         """
         Delete JIRA configuration.
@@ -385,15 +608,16 @@ class JiraConfigurationService:
             # Check if this is the last active configuration
             active_count = await self._count_active_configurations(config.environment)
             if active_count <= 1 and config.is_active:
-                self.logger.error(f"Cannot delete last active configuration {config_id}")
+                self.logger.warning(f"Cannot delete last active configuration {config_id}")
                 raise ValidationError("Cannot delete the last active JIRA configuration")
             
             # Perform soft delete by setting inactive
             config.is_active = False
             config.status = ConnectionStatus.INACTIVE
-            config.updated_at = datetime.now(timezone.utc)
             
             await self.db.commit()
+            self._invalidate_default_configuration(config.environment)
+            await self._evict_cached_client(config_id)
             
             self.logger.info(f"Successfully deleted (deactivated) JIRA configuration {config_id}")
             return True
@@ -431,26 +655,11 @@ class JiraConfigurationService:
             if not config:
                 raise SprintReportsException(f"JIRA configuration {config_id} not found")
             
-            # Create connection config for testing
-            # Ensure auth_method is properly converted to enum
-            if isinstance(config.auth_method, str):
-                auth_method = JiraAuthMethod(config.auth_method)
-            else:
-                auth_method = config.auth_method
-            
-            connection_config = JiraConnectionConfig(
-                url=config.url,
-                auth_method=auth_method,
-                email=config.email,
-                api_token=config.api_token,
-                username=config.username,
-                password=config.password,
-                oauth_config=config.oauth_config,
-                is_cloud=config.is_cloud_instance()
-            )
+            # Reuse the client built for this configuration on earlier tests
+            connection_config, client = await self._get_cached_client(config)
             
             # Test connection
-            test_result = await self._test_configuration_connection(connection_config)
+            test_result = await self._test_configuration_connection(connection_config, client=client)
             
             # Update configuration status if requested
             if update_status:
@@ -463,6 +672,7 @@ class JiraConfigurationService:
                     config.record_failed_test(error_message)
                 
                 await self.db.commit()
+                self._invalidate_default_configuration(config.environment)
                 self.logger.info(f"Updated configuration {config_id} status based on test result")
             
             return test_result
@@ -471,12 +681,22 @@ class JiraConfigurationService:
             self.logger.error(f"Database error testing configuration {config_id}: {e}")
             raise SprintReportsException(f"Failed to test JIRA configuration {config_id}")
     
-    async def monitor_configurations(self, environment: Optional[str] = None) -> Dict[str, Any]:
+    async def monitor_configurations(
+        self,
+        environment: Optional[str] = None,
+        test_connections: bool = False,
+        include_details: bool = False
+    ) -> MonitorSummary:
         """
         Monitor health and status of JIRA configurations.
         
+        The summary counts are aggregated in the database; individual
+        configurations are only loaded when details or re-tests are requested.
+        
         Args:
             environment: Optional environment filter
+            test_connections: Whether to re-test every connection before reporting
+            include_details: Whether to include a status entry per configuration
             
         Returns:
             Monitoring summary with health metrics
@@ -487,54 +707,40 @@ class JiraConfigurationService:
         try:
             self.logger.debug(f"Monitoring JIRA configurations for environment: {environment}")
             
-            # Get configurations to monitor
-            configs = await self.get_configurations(
+            configs = None
+            if test_connections:
+                # Re-tests run concurrently, so they need the configurations up front
+                configs = await self.get_configurations(
+                    environment=environment,
+                    is_active=True
+                )
+                await self._retest_configurations(configs)
+            
+            total, healthy_count, error_count = await self._aggregate_health(environment)
+            
+            statuses = []
+            if include_details and configs is not None:
+                statuses = [self._build_status(config) for config in configs]
+            elif include_details:
+                statuses = [
+                    self._build_status_from_row(row)
+                    async for row in self._stream_status_rows(environment)
+                ]
+            
+            summary = MonitorSummary(
+                total_configurations=total,
+                healthy_count=healthy_count,
+                error_count=error_count,
+                inactive_count=total - healthy_count - error_count,
+                # Calculate health percentage
+                health_percentage=healthy_count / total * 100 if total > 0 else 0,
                 environment=environment,
-                is_active=True
+                timestamp=datetime.now(timezone.utc),
+                configurations=statuses
             )
             
-            monitoring_data = {
-                "total_configurations": len(configs),
-                "healthy_count": 0,
-                "error_count": 0,
-                "inactive_count": 0,
-                "configurations": [],
-                "environment": environment,
-                "timestamp": datetime.now(timezone.utc)
-            }
-            
-            for config in configs:
-                config_status = {
-                    "id": config.id,
-                    "name": config.name,
-                    "url": config.url,
-                    "status": config.status.value,
-                    "is_healthy": config.is_healthy(),
-                    "last_tested": config.last_tested_at,
-                    "consecutive_errors": config.consecutive_errors,
-                    "avg_response_time_ms": config.avg_response_time_ms
-                }
-                
-                monitoring_data["configurations"].append(config_status)
-                
-                # Update counters
-                if config.is_healthy():
-                    monitoring_data["healthy_count"] += 1
-                elif config.status == ConnectionStatus.ERROR:
-                    monitoring_data["error_count"] += 1
-                else:
-                    monitoring_data["inactive_count"] += 1
-            
-            # Calculate health percentage
-            if monitoring_data["total_configurations"] > 0:
-                monitoring_data["health_percentage"] = (
-                    monitoring_data["healthy_count"] / monitoring_data["total_configurations"] * 100
-                )
-            else:
-                monitoring_data["health_percentage"] = 0
-            
-            self.logger.debug(f"Monitoring complete: {monitoring_data['health_percentage']:.1f}% healthy")
-            return monitoring_data
+            self.logger.debug(f"Monitoring complete: {summary.health_percentage:.1f}% healthy")
+            return summary
             
         except SQLAlchemyError as e:
             self.logger.error(f"Database error monitoring configurations: {e}")
@@ -542,17 +748,274 @@ class JiraConfigurationService:
     
     # Private helper methods
     
+    async def _aggregate_health(self, environment: Optional[str] = None) -> Tuple[int, int, int]:
+        """
+        Count active configurations by health in a single aggregate query.
+        
+        Healthy matches JiraConfiguration.is_healthy(); error counts the
+        remaining configurations in error status.
+        
+        Returns:
+            Tuple of (total, healthy, error) counts
+        """
+        filters = [JiraConfiguration.is_active == True]
+        if environment is not None:
+            filters.append(JiraConfiguration.environment == environment)
+        
+        is_healthy = and_(
+            JiraConfiguration.status == ConnectionStatus.ACTIVE,
+            JiraConfiguration.consecutive_errors == 0
+        )
+        result = await self.db.execute(
+            select(
+                func.count(JiraConfiguration.id),
+                func.count(JiraConfiguration.id).filter(is_healthy),
+                func.count(JiraConfiguration.id).filter(
+                    JiraConfiguration.status == ConnectionStatus.ERROR
+                )
+            ).where(and_(*filters))
+        )
+        total, healthy_count, error_count = result.one()
+        return total, healthy_count, error_count
+    
+    @staticmethod
+    def _invalidate_default_configuration(*environments: str) -> None:
+        """Invalidate cached default configurations for the given environments."""
+        for environment in environments:
+            _default_config_versions[environment] = _default_config_versions.get(environment, 0) + 1
+    
+    @staticmethod
+    def _detached_copy(config: JiraConfiguration) -> JiraConfiguration:
+        """
+        Copy a configuration's column values into a detached instance.
+        
+        The copy can be merged into any session with merge(load=False) without
+        a SELECT, and is unaffected by later changes to the original.
+        """
+        snapshot = JiraConfiguration()
+        for attr in JiraConfiguration.__mapper__.column_attrs:
+            setattr(snapshot, attr.key, getattr(config, attr.key))
+        make_transient_to_detached(snapshot)
+        return snapshot
+    
+    @staticmethod
+    def _build_status(config: JiraConfiguration) -> ConfigStatus:
+        """Build the monitoring status entry for a configuration."""
+        return ConfigStatus(
+            id=config.id,
+            name=config.name,
+            url=config.url,
+            status=config.status.value,
+            is_healthy=config.is_healthy(),
+            last_tested=config.last_tested_at,
+            consecutive_errors=config.consecutive_errors,
+            avg_response_time_ms=config.avg_response_time_ms
+        )
+    
+    async def _stream_status_rows(self, environment: Optional[str] = None) -> AsyncIterator[Any]:
+        """
+        Stream the columns needed for monitoring status entries.
+        
+        Selecting plain column tuples skips ORM instance construction and
+        identity-map bookkeeping for every monitored configuration.
+        """
+        filters = [JiraConfiguration.is_active == True]
+        if environment is not None:
+            filters.append(JiraConfiguration.environment == environment)
+        
+        query = select(
+            JiraConfiguration.id,
+            JiraConfiguration.name,
+            JiraConfiguration.url,
+            JiraConfiguration.status,
+            JiraConfiguration.last_tested_at,
+            JiraConfiguration.consecutive_errors,
+            JiraConfiguration.avg_response_time_ms
+        ).where(and_(*filters)).order_by(
+            JiraConfiguration.is_default.desc(),
+            JiraConfiguration.created_at.desc()
+        ).execution_options(yield_per=CONFIGURATION_STREAM_BATCH_SIZE)
+        
+        result = await self.db.stream(query)
+        async for row in result:
+            yield row
+    
+    @staticmethod
+    def _build_status_from_row(row: Any) -> ConfigStatus:
+        """Build the monitoring status entry from a streamed column row."""
+        return ConfigStatus(
+            id=row.id,
+            name=row.name,
+            url=row.url,
+            status=row.status.value,
+            # Same rule as JiraConfiguration.is_healthy()
+            is_healthy=row.status == ConnectionStatus.ACTIVE and row.consecutive_errors == 0,
+            last_tested=row.last_tested_at,
+            consecutive_errors=row.consecutive_errors,
+            avg_response_time_ms=row.avg_response_time_ms
+        )
+    
+    async def _retest_configurations(self, configs: List[JiraConfiguration]) -> None:
+        """
+        Test connections for several configurations concurrently.
+        
+        Tests run in parallel up to MONITOR_TEST_CONCURRENCY at a time; the
+        results are recorded on the configurations and committed once.
+        """
+        semaphore = asyncio.Semaphore(MONITOR_TEST_CONCURRENCY)
+        
+        async def _run_test(config: JiraConfiguration) -> JiraConnectionTestResult:
+            async with semaphore:
+                connection_config, client = await self._get_cached_client(config)
+                return await self._test_configuration_connection(connection_config, client=client)
+        
+        results = await asyncio.gather(
+            *(_run_test(config) for config in configs),
+            return_exceptions=True
+        )
+        
+        for config, result in zip(configs, results):
+            if isinstance(result, Exception):
+                config.record_failed_test(str(result))
+            elif result.connection_valid:
+                config.record_successful_test(
+                    int(result.total_time_ms) if result.total_time_ms else None
+                )
+            else:
+                config.record_failed_test(
+                    "; ".join(result.errors) if result.errors else "Unknown error"
+                )
+        
+        await self.db.commit()
+        self._invalidate_default_configuration(*{config.environment for config in configs})
+    
     def _detect_instance_type(self, url: str) -> bool:
         """Detect if JIRA instance is Cloud (True) or Server (False)."""
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        return parsed.hostname and parsed.hostname.endswith('.atlassian.net')
+        return _is_atlassian_cloud_url(url)
+    
+    async def _get_cached_client(
+        self,
+        config: JiraConfiguration
+    ) -> Tuple[JiraConnectionConfig, JiraAPIClient]:
+        """
+        Get the connection config and API client for a stored configuration.
+        
+        Decrypting the credentials and setting up the HTTP client are only done
+        when the configuration has not been seen before or its connection
+        settings changed since the cached client was built.
+        """
+        fingerprint = (
+            config.url,
+            config.auth_method,
+            config.instance_type,
+            config.email,
+            config.username,
+            config._api_token,
+            config._password,
+            config._oauth_config
+        )
+        cached = _client_cache.get((asyncio.get_running_loop(), config.id))
+        if cached and cached[0] == fingerprint:
+            return cached[1], cached[2]
+        
+        await self._evict_cached_client(config.id)
+        
+        connection_config = JiraConnectionConfig(
+            url=config.url,
+            auth_method=config.auth_method,
+            email=config.email,
+            api_token=config.api_token,
+            username=config.username,
+            password=config.password,
+            oauth_config=config.oauth_config,
+            is_cloud=config.is_cloud_instance()
+        )
+        client = self._build_client(connection_config)
+        _client_cache[(asyncio.get_running_loop(), config.id)] = (fingerprint, connection_config, client)
+        return connection_config, client
+    
+    async def _evict_cached_client(self, config_id: int) -> None:
+        """
+        Drop and close the running loop's cached API client for a configuration.
+        
+        Clients cached by other loops are replaced on their next use, since the
+        fingerprint of the changed configuration no longer matches.
+        """
+        cached = _client_cache.pop((asyncio.get_running_loop(), config_id), None)
+        if cached:
+            invalidate_cache(cached[2].url)
+            try:
+                await cached[2].close()
+            except Exception as e:
+                self.logger.warning(f"Error closing cached JIRA client for configuration {config_id}: {e}")
+    
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Close the running loop's cached API clients and shared connection pool.
+        
+        Called on application shutdown. Entries of closed loops are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        _prune_closed_loops()
+        
+        for key in [key for key in _client_cache if key[0] is loop]:
+            _, _, client = _client_cache.pop(key)
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Error closing cached JIRA client: {e}")
+        
+        transport = _shared_transports.pop(loop, None)
+        if transport is not None:
+            await transport.aclose()
+    
+    @staticmethod
+    def _build_client(config: JiraConnectionConfig) -> JiraAPIClient:
+        """
+        Create a JIRA API client for a connection configuration.
+        
+        All clients of the running event loop share one connection pool, so
+        repeated tests against the same host reuse open TLS connections instead
+        of handshaking again.
+        """
+        loop = asyncio.get_running_loop()
+        transport = _shared_transports.get(loop)
+        
+        if transport is None:
+            _prune_closed_loops()
+            transport = _shared_transports[loop] = httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60
+                )
+            )
+        
+        return JiraAPIClient(
+            url=config.url,
+            auth_method=config.auth_method,
+            email=config.email,
+            api_token=config.api_token,
+            username=config.username,
+            password=config.password,
+            oauth_dict=config.oauth_config,
+            cloud=config.is_cloud,
+            transport=transport
+        )
     
     async def _test_configuration_connection(
         self, 
-        config: JiraConnectionConfig
+        config: JiraConnectionConfig,
+        client: Optional[JiraAPIClient] = None
     ) -> JiraConnectionTestResult:
-        """Test JIRA configuration connection."""
+        """
+        Test JIRA configuration connection.
+        
+        A client passed in by the caller is left open for reuse; otherwise a
+        temporary client is created and closed once the test completes.
+        """
         from app.schemas.jira import JiraConnectionTest
         
         test_request = JiraConnectionTest(
@@ -562,21 +1025,14 @@ class JiraConfigurationService:
         
         # Use JiraService to perform the actual test
         # This reuses existing connection testing logic
+        owns_client = client is None
         try:
-            client = JiraAPIClient(
-                url=config.url,
-                auth_method=config.auth_method,
-                email=config.email,
-                api_token=config.api_token,
-                username=config.username,
-                password=config.password,
-                oauth_dict=config.oauth_config,
-                cloud=config.is_cloud
-            )
+            if owns_client:
+                client = self._build_client(config)
             
-            start_time = datetime.now()
+            start_ns = time.perf_counter_ns()
             connection_valid = await client.test_connection()
-            end_time = datetime.now()
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
             
             test_result = JiraConnectionTestResult(
                 connection_valid=connection_valid,
@@ -589,14 +1045,15 @@ class JiraConfigurationService:
                 tests={},
                 errors=[] if connection_valid else ["Connection test failed"],
                 recommendations=[],
-                total_time_ms=(end_time - start_time).total_seconds() * 1000
+                total_time_ms=elapsed_ms
             )
             
-            await client.close()
+            if owns_client:
+                await client.close()
             return test_result
             
         except Exception as e:
-            self.logger.error(f"Connection test failed: {e}")
+            self.logger.warning(f"Connection test failed: {e}")
             return JiraConnectionTestResult(
                 connection_valid=False,
                 configuration={
@@ -610,40 +1067,101 @@ class JiraConfigurationService:
                 recommendations=[]
             )
     
-    async def _should_set_as_default(self, environment: str) -> bool:
-        """Check if this should be set as the default configuration."""
+    @staticmethod
+    def _build_configurations_query(
+        environment: Optional[str] = None,
+        status: Optional[ConnectionStatus] = None,
+        is_active: Optional[bool] = None
+    ):
+        """Build the filtered and ordered configuration listing query."""
+        # Listings and monitoring only read column attributes; any relationship
+        # added later must be loaded explicitly instead of lazily per row
+        query = select(JiraConfiguration).options(raiseload('*'))
+        
+        # Apply filters
+        filters = []
+        if environment is not None:
+            filters.append(JiraConfiguration.environment == environment)
+        if status is not None:
+            filters.append(JiraConfiguration.status == status)
+        if is_active is not None:
+            filters.append(JiraConfiguration.is_active == is_active)
+        
+        if filters:
+            query = query.where(and_(*filters))
+        
+        # Apply ordering
+        return query.order_by(
+            JiraConfiguration.is_default.desc(),
+            JiraConfiguration.created_at.desc()
+        )
+    
+    async def _count_active_and_defaults(self, environment: str) -> Tuple[int, int]:
+        """Count active configurations and default-flagged configurations in one query."""
         result = await self.db.execute(
-            select(func.count(JiraConfiguration.id)).where(
-                and_(
-                    JiraConfiguration.environment == environment,
-                    JiraConfiguration.is_active == True
-                )
-            )
+            select(
+                func.count(JiraConfiguration.id).filter(JiraConfiguration.is_active == True),
+                func.count(JiraConfiguration.id).filter(JiraConfiguration.is_default == True)
+            ).where(JiraConfiguration.environment == environment)
         )
-        count = result.scalar()
-        return count == 0  # Set as default if it's the first active config
+        active_count, default_count = result.one()
+        return active_count, default_count
+    
+    @staticmethod
+    def _locked_ids_in_order(*criteria):
+        """
+        Select configuration IDs matching criteria, locked in primary key order.
+        
+        Used as the target of default-flag UPDATEs so that concurrent
+        transactions always acquire row locks in the same order and cannot
+        deadlock on each other's default rows. The subquery selects from the
+        table rather than the mapped class, as it needs no ORM loading.
+        """
+        table = JiraConfiguration.__table__
+        return select(table.c.id).where(
+            and_(*criteria)
+        ).order_by(table.c.id.asc()).with_for_update()
     
     async def _unset_other_defaults(self, environment: str, exclude_id: Optional[int] = None) -> None:
         """Unset default flag for other configurations in the same environment."""
+        criteria = [
+            JiraConfiguration.environment == environment,
+            JiraConfiguration.is_default == True
+        ]
+        if exclude_id:
+            criteria.append(JiraConfiguration.id != exclude_id)
+        
         query = update(JiraConfiguration).where(
-            and_(
-                JiraConfiguration.environment == environment,
-                JiraConfiguration.is_default == True
-            )
+            JiraConfiguration.id.in_(self._locked_ids_in_order(*criteria))
         ).values(is_default=False)
         
-        if exclude_id:
-            query = query.where(JiraConfiguration.id != exclude_id)
+        await self.db.execute(query)
+    
+    async def _promote_default(self, environment: str, config_id: int) -> None:
+        """
+        Make a configuration the default for its environment.
+        
+        Setting the new default and clearing the previous one is a single
+        UPDATE, so the default rows are written once per transaction.
+        """
+        locked_ids = self._locked_ids_in_order(
+            JiraConfiguration.environment == environment,
+            or_(
+                JiraConfiguration.is_default == True,
+                JiraConfiguration.id == config_id
+            )
+        )
+        query = update(JiraConfiguration).where(
+            JiraConfiguration.id.in_(locked_ids)
+        ).values(
+            is_default=(JiraConfiguration.id == config_id)
+        ).execution_options(synchronize_session="fetch")
         
         await self.db.execute(query)
     
     def _requires_connection_test(self, updates: Dict[str, Any]) -> bool:
         """Check if updates require a connection test."""
-        test_required_fields = [
-            'url', 'auth_method', 'email', 'api_token', 
-            'username', 'password', 'oauth_config'
-        ]
-        return any(field in updates for field in test_required_fields)
+        return not _TEST_REQUIRED_FIELDS.isdisjoint(updates)
     
     def _create_test_config_from_updates(
         self, 
@@ -651,16 +1169,10 @@ class JiraConfigurationService:
         updates: Dict[str, Any]
     ) -> JiraConnectionConfig:
         """Create a test configuration from existing config plus updates."""
-        # Get auth method value, handling both string and enum cases
-        auth_method_value = updates.get('auth_method', config.auth_method)
-        if isinstance(auth_method_value, str):
-            auth_method = JiraAuthMethod(auth_method_value)
-        else:
-            auth_method = auth_method_value
-        
+        # JiraConnectionConfig coerces auth_method strings from the update payload
         return JiraConnectionConfig(
             url=updates.get('url', config.url),
-            auth_method=auth_method,
+            auth_method=updates.get('auth_method', config.auth_method),
             email=updates.get('email', config.email),
             api_token=updates.get('api_token', config.api_token),
             username=updates.get('username', config.username),
@@ -672,11 +1184,11 @@ class JiraConfigurationService:
     async def _count_active_configurations(self, environment: str) -> int:
         """Count active configurations in environment."""
         result = await self.db.execute(
-            select(func.count(JiraConfiguration.id)).where(
+            lambda_stmt(lambda: select(func.count(JiraConfiguration.id)).where(
                 and_(
                     JiraConfiguration.environment == environment,
                     JiraConfiguration.is_active == True
                 )
-            )
+            ))
         )
         return result.scalar()
\ No newline at end of file
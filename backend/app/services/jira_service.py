@@ -6,21 +6,220 @@ error handling, authentication, rate limiting support, and dynamic field mapping
 """
 
 import asyncio
+import random
+import re
+import sys
 import time
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Iterable, List, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 import base64
+import copy
+import hashlib
+import heapq
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache, partial
 
 import httpx
-from atlassian import Jira as AtlassianJira
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from app.core.config import settings
 from app.core.exceptions import ExternalServiceError, RateLimitError
 from app.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from atlassian import Jira as AtlassianJira
+
 logger = get_logger(__name__)
 
+_NUMERIC_RE = re.compile(r'\d+\.?\d*')
+
+# Common story points field IDs, in lookup order
+_STORY_POINT_FIELDS = (
+    sys.intern("customfield_10002"),  # Common Atlassian Cloud field
+    sys.intern("customfield_10004"),  # Common Atlassian Server field
+    sys.intern("customfield_10016"),  # Another common field
+)
+
+# Common team field IDs, in lookup order
+_TEAM_FIELDS = (
+    sys.intern("customfield_10741"),  # Discipline team field from example
+    sys.intern("customfield_10740"),  # Alternative team field
+    sys.intern("customfield_10015"),  # Another common team field
+)
+
+# Issue fields read when enhancing sprint issues with project source metadata
+_ENHANCEMENT_FIELDS = frozenset((
+    "project", "priority", "status", "components", "issuelinks", *_STORY_POINT_FIELDS, *_TEAM_FIELDS
+))
+
+# Issue link directions: (dependency type, link key, default link name)
+_LINK_DIRECTIONS = (
+    ("inward", "inwardIssue", "depends on"),
+    ("outward", "outwardIssue", "blocks"),
+)
+
+# Meta-board confidence contributions, indexed by multi-project sprint count
+# (capped at 3) and by unique project count (capped at 4)
+_MULTI_PROJECT_SPRINT_CONFIDENCE = (0.0, 0.2, 0.3, 0.4)
+_PROJECT_DIVERSITY_CONFIDENCE = (0.0, 0.0, 0.1, 0.2, 0.3)
+
+# Fields requested for meta-board sprint analysis, which only reads each issue's project
+_ANALYSIS_FIELDS = "project"
+
+# TTLs (seconds) for JIRA metadata that changes rarely
+FIELD_CACHE_TTL = 600
+SERVER_INFO_CACHE_TTL = 600
+DISCOVERY_SEARCH_CACHE_TTL = 60
+SPRINT_BOARD_CACHE_TTL = 600
+META_BOARD_DETECTION_CACHE_TTL = 30
+WEBHOOK_MAPPING_CACHE_TTL = 60
+
+# Maximum number of meta-board sprints synchronized at once
+SPRINT_SYNC_CONCURRENCY = 5
+
+# GET responses cached by endpoint as (pattern, TTL seconds). Listings of
+# projects and boards change rarely. Issue and sprint listings are never cached,
+# since syncs (including webhook-triggered ones) must see the latest state.
+_GET_CACHE_POLICIES = (
+    (re.compile(r"/rest/api/\d+/project$"), 60),
+    (re.compile(r"/rest/agile/1\.0/board$"), 60),
+    (re.compile(r"/rest/agile/1\.0/board/\d+$"), 60),
+)
+
+# Longest time (seconds) a cached listing may stand in for a failing JIRA
+STALE_RESPONSE_MAX_AGE = 600
+
+# Response bodies larger than this are decoded off the event loop
+LARGE_RESPONSE_BYTES = 256 * 1024
+
+# Cached responses keyed by (instance URL, login, resource...) -> (stored at, value),
+# least recently used first
+_RESPONSE_CACHE: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+_RESPONSE_CACHE_MAXSIZE = 1024
+
+
+def _cache_get(key: tuple, ttl: float) -> Optional[Any]:
+    """Return a cached response younger than ttl, or None."""
+    entry = _RESPONSE_CACHE.get(key)
+    if entry and time.monotonic() - entry[0] < ttl:
+        _RESPONSE_CACHE.move_to_end(key)
+        return entry[1]
+    return None
+
+
+def _cache_set(key: tuple, value: Any) -> None:
+    """Store a response in the metadata cache, evicting the least recently used."""
+    _RESPONSE_CACHE[key] = (time.monotonic(), value)
+    _RESPONSE_CACHE.move_to_end(key)
+    if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+        _RESPONSE_CACHE.popitem(last=False)
+
+
+def invalidate_cache(url: Optional[str] = None) -> None:
+    """Drop cached JIRA metadata for one instance URL, or for all instances."""
+    if url is None:
+        _RESPONSE_CACHE.clear()
+        return
+    url = url.rstrip('/')
+    for key in [key for key in _RESPONSE_CACHE if key[0] == url]:
+        del _RESPONSE_CACHE[key]
+
+
+@lru_cache(maxsize=128)
+def _build_auth_header(
+    auth_method: str,
+    is_cloud: bool,
+    email: Optional[str],
+    api_token: Optional[str]
+) -> Optional[str]:
+    """Build the Authorization header for token authentication, if applicable."""
+    if auth_method != "token" or not api_token:
+        return None
+    if is_cloud:
+        # Cloud token authentication
+        if not email:
+            return None
+        encoded = base64.b64encode(f"{email}:{api_token}".encode()).decode()
+        return f"Basic {encoded}"
+    # Server token authentication
+    return f"Bearer {api_token}"
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket that paces request starts to a steady per-second rate.
+    
+    Concurrent fan-out waits here instead of bursting past JIRA's per-second
+    limit and being re-serialized by 429 retries.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+    
+    def try_acquire(self) -> bool:
+        """Take a token without awaiting if one is free and nobody is queued."""
+        if self._lock.locked():
+            return False
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+    
+    async def acquire(self) -> None:
+        """Take a token, sleeping until one has accrued."""
+        if self.try_acquire():
+            return
+        # The lock is held across the sleep so waiters are served in order
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+# Request pacing shared by every client of a JIRA instance, keyed by
+# (event loop, base URL) because the bucket's lock belongs to one loop
+_RATE_LIMITERS: Dict[tuple, AsyncTokenBucket] = {}
+RATE_LIMIT_BURST = 16
+
+
+def _get_rate_limiter(url: str) -> AsyncTokenBucket:
+    """Return the running loop's token bucket for a JIRA base URL."""
+    key = (asyncio.get_running_loop(), url)
+    limiter = _RATE_LIMITERS.get(key)
+    if limiter is None:
+        # Buckets of finished loops (e.g. earlier Celery tasks) are never used again
+        for stale in [stale for stale in _RATE_LIMITERS if stale[0].is_closed()]:
+            del _RATE_LIMITERS[stale]
+        limiter = AsyncTokenBucket(rate=settings.JIRA_RATE_LIMIT or 8, burst=RATE_LIMIT_BURST)
+        _RATE_LIMITERS[key] = limiter
+    return limiter
+
 
 class JiraAPIClient:
     """
@@ -28,6 +227,14 @@ class JiraAPIClient:
     authentication, error handling, retry logic, and rate limiting.
     """
     
+    # Shared HTTP clients keyed by event loop, instance URL and credential digest,
+    # least recently used first
+    _CLIENT_CACHE: "OrderedDict[tuple, httpx.AsyncClient]" = OrderedDict()
+    _CLIENT_CACHE_MAXSIZE = 32
+    
+    # Connection pool size; also bounds get_many() concurrency
+    _POOL_LIMIT = 100
+    
     def __init__(
         self,
         url: str,
@@ -37,7 +244,8 @@ class JiraAPIClient:
         username: Optional[str] = None,
         password: Optional[str] = None,
         oauth_dict: Optional[Dict[str, str]] = None,
-        cloud: bool = None
+        cloud: bool = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
         """
         Initialize JIRA API client.
@@ -51,8 +259,11 @@ class JiraAPIClient:
             password: Password for basic authentication
             oauth_dict: OAuth configuration dictionary
             cloud: True for Cloud, False for Server, None for auto-detect
+            transport: Shared HTTP transport whose connection pool is reused;
+                its owner is responsible for closing it
         """
         self.url = url.rstrip('/')
+        self._transport = transport
         self.auth_method = auth_method
         self.email = email
         self.api_token = api_token
@@ -69,18 +280,24 @@ class JiraAPIClient:
         # API version preferences
         self.preferred_api_version = "3" if self.is_cloud else "2"
         
-        # Rate limiting
-        self._rate_limit_calls = 0
-        self._rate_limit_window_start = time.time()
-        self._rate_limit_max_calls = 100  # Adjust based on JIRA instance limits
-        self._rate_limit_window = 60  # 1 minute window
+        # Versioned REST endpoints used on hot paths
+        api_base = f"/rest/api/{self.preferred_api_version}"
+        self._ep = {
+            "field": f"{api_base}/field",
+            "project": f"{api_base}/project",
+            "search": f"{api_base}/search",
+            "serverInfo": f"{api_base}/serverInfo",
+        }
+        
+        # Retry backoff ceiling in seconds
+        self._max_backoff = 60.0
         
         # HTTP client setup
         self._setup_http_client()
         
-        # Fallback Atlassian client for complex operations
+        # Fallback Atlassian client for complex operations, created on first use
         self._atlassian_client = None
-        self._setup_atlassian_client()
+        self._atlassian_client_initialized = False
     
     def _detect_cloud_instance(self) -> bool:
         """Detect if this is a JIRA Cloud instance."""
@@ -96,31 +313,94 @@ class JiraAPIClient:
         
         auth = None
         if self.auth_method == "token":
-            if self.is_cloud and self.email and self.api_token:
-                # Cloud token authentication
-                credentials = f"{self.email}:{self.api_token}"
-                encoded = base64.b64encode(credentials.encode()).decode()
-                headers["Authorization"] = f"Basic {encoded}"
-            elif not self.is_cloud and self.api_token:
-                # Server token authentication
-                headers["Authorization"] = f"Bearer {self.api_token}"
+            authorization = _build_auth_header(
+                self.auth_method, bool(self.is_cloud), self.email, self.api_token
+            )
+            if authorization:
+                headers["Authorization"] = authorization
         elif self.auth_method == "basic" and self.username and self.password:
             auth = (self.username, self.password)
         elif self.auth_method == "oauth" and self.oauth_dict:
             # OAuth would require additional implementation
             logger.warning("OAuth authentication not fully implemented")
         
-        self.client = httpx.AsyncClient(
+        self._client_key = None
+        if self._transport is not None:
+            # The transport already shares its connection pool
+            self.client = self._build_http_client(headers, auth)
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Outside a running loop there is nothing to share the client with
+            self.client = self._build_http_client(headers, auth)
+            return
+        
+        # Connections belong to the loop that opened them, so each loop (e.g. each
+        # Celery task's asyncio.run) gets its own clients. Credentials are part of
+        # the key so different logins never share headers, but only as a digest.
+        credentials = hashlib.sha256(repr((headers.get("Authorization"), auth)).encode()).hexdigest()
+        key = (loop, self.url, self.auth_method, self.email or self.username, credentials)
+        client = self._CLIENT_CACHE.get(key)
+        if client is None or client.is_closed:
+            client = self._build_http_client(headers, auth)
+            self._CLIENT_CACHE[key] = client
+            self._prune_client_cache()
+        self._CLIENT_CACHE.move_to_end(key)
+        self._client_key = key
+        self.client = client
+    
+    @classmethod
+    def _prune_client_cache(cls) -> None:
+        """
+        Drop clients of closed event loops and evict the least recently used.
+        
+        Evicted clients are not closed here, because API clients may still be using
+        them; close() on those API clients closes them instead.
+        """
+        for key in [key for key in cls._CLIENT_CACHE if key[0].is_closed()]:
+            del cls._CLIENT_CACHE[key]
+        while len(cls._CLIENT_CACHE) > cls._CLIENT_CACHE_MAXSIZE:
+            cls._CLIENT_CACHE.popitem(last=False)
+    
+    def _build_http_client(self, headers: Dict[str, str], auth: Optional[tuple]) -> httpx.AsyncClient:
+        """
+        Create the underlying httpx client.
+        
+        HTTP/2 multiplexes concurrent REST calls over one connection, and the
+        keep-alive expiry outlasts typical polling intervals so sync loops do
+        not renegotiate TLS. Idle connections may outlive individual tasks,
+        which is intended now that clients are shared.
+        """
+        return httpx.AsyncClient(
             base_url=self.url,
             headers=headers,
             auth=auth,
-            timeout=30.0,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=self._POOL_LIMIT,
+                keepalive_expiry=30.0
+            ),
+            transport=self._transport
         )
     
+    @property
+    def atlassian_client(self) -> Optional["AtlassianJira"]:
+        """Atlassian Python API client fallback, created on first access."""
+        if not self._atlassian_client_initialized:
+            self._atlassian_client_initialized = True
+            self._setup_atlassian_client()
+        return self._atlassian_client
+    
     def _setup_atlassian_client(self):
         """Setup Atlassian Python API client as fallback."""
         try:
+            # Imported here so token-only flows never load atlassian/requests
+            from atlassian import Jira as AtlassianJira
+            
             if self.auth_method == "token" and self.is_cloud and self.email and self.api_token:
                 self._atlassian_client = AtlassianJira(
                     url=self.url,
@@ -138,26 +418,31 @@ class JiraAPIClient:
         except Exception as e:
             logger.warning(f"Could not setup Atlassian client fallback: {e}")
     
-    async def _check_rate_limit(self):
-        """Check and enforce rate limiting."""
-        current_time = time.time()
-        
-        # Reset counter if window has passed
-        if current_time - self._rate_limit_window_start >= self._rate_limit_window:
-            self._rate_limit_calls = 0
-            self._rate_limit_window_start = current_time
-        
-        # Check if rate limit exceeded
-        if self._rate_limit_calls >= self._rate_limit_max_calls:
-            wait_time = self._rate_limit_window - (current_time - self._rate_limit_window_start)
-            if wait_time > 0:
-                logger.warning(f"Rate limit exceeded, waiting {wait_time:.2f} seconds")
-                await asyncio.sleep(wait_time)
-                # Reset after waiting
-                self._rate_limit_calls = 0
-                self._rate_limit_window_start = time.time()
-        
-        self._rate_limit_calls += 1
+    @property
+    def _rate_limiter(self) -> AsyncTokenBucket:
+        """Per-second pacing shared with every client of this instance, below JIRA Cloud's 10 requests/second per IP."""
+        return _get_rate_limiter(self.url)
+    
+    def _sleep_for(self, attempt: int, backoff_factor: float) -> float:
+        """Full-jitter exponential backoff so concurrent retries spread out."""
+        return min(self._max_backoff, random.uniform(0, backoff_factor * (2 ** attempt)))
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given as seconds or an HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
     
     async def _make_request_with_retry(
         self,
@@ -183,18 +468,21 @@ class JiraAPIClient:
         Raises:
             ExternalServiceError: If all retries fail
         """
-        await self._check_rate_limit()
-        
         last_exception = None
         
         for attempt in range(max_retries + 1):
             try:
                 logger.debug(f"Making {method} request to {endpoint}, attempt {attempt + 1}")
+                rate_limiter = self._rate_limiter
+                if not rate_limiter.try_acquire():
+                    await rate_limiter.acquire()
                 response = await self.client.request(method, endpoint, **kwargs)
                 
                 # Handle rate limiting from server
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 60))
+                    retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is None:
+                        retry_after = 60
                     if attempt < max_retries:
                         logger.warning(f"Rate limited by server, waiting {retry_after} seconds")
                         await asyncio.sleep(retry_after)
@@ -217,10 +505,14 @@ class JiraAPIClient:
                 
                 # Handle server errors with retries
                 if response.status_code >= 500 and attempt < max_retries:
-                    wait_time = backoff_factor * (2 ** attempt)
+                    wait_time = None
+                    if response.status_code == 503:
+                        wait_time = self._parse_retry_after(response.headers.get("Retry-After"))
+                    if wait_time is None:
+                        wait_time = self._sleep_for(attempt, backoff_factor)
                     logger.warning(
                         f"Server error {response.status_code} on {endpoint}, "
-                        f"retrying in {wait_time} seconds"
+                        f"retrying in {wait_time:.2f} seconds"
                     )
                     await asyncio.sleep(wait_time)
                     continue
@@ -231,8 +523,8 @@ class JiraAPIClient:
             except httpx.RequestError as e:
                 last_exception = e
                 if attempt < max_retries:
-                    wait_time = backoff_factor * (2 ** attempt)
-                    logger.warning(f"Request error on {endpoint}: {e}, retrying in {wait_time} seconds")
+                    wait_time = self._sleep_for(attempt, backoff_factor)
+                    logger.warning(f"Request error on {endpoint}: {e}, retrying in {wait_time:.2f} seconds")
                     await asyncio.sleep(wait_time)
                     continue
                 else:
@@ -248,8 +540,8 @@ class JiraAPIClient:
                 
                 last_exception = e
                 if attempt < max_retries:
-                    wait_time = backoff_factor * (2 ** attempt)
-                    logger.warning(f"HTTP error on {endpoint}: {e}, retrying in {wait_time} seconds")
+                    wait_time = self._sleep_for(attempt, backoff_factor)
+                    logger.warning(f"HTTP error on {endpoint}: {e}, retrying in {wait_time:.2f} seconds")
                     await asyncio.sleep(wait_time)
                     continue
                 else:
@@ -262,31 +554,134 @@ class JiraAPIClient:
         
         raise ExternalServiceError("JIRA", error_msg)
     
+    @staticmethod
+    async def _json(response: httpx.Response) -> Any:
+        """
+        Decode a JSON response body, using orjson for large issue payloads when available.
+        
+        Bodies over LARGE_RESPONSE_BYTES are decoded in a worker thread so a
+        multi-megabyte search result does not stall other requests on the loop.
+        """
+        loads = partial(orjson.loads, response.content) if ORJSON_AVAILABLE else response.json
+        if len(response.content) > LARGE_RESPONSE_BYTES:
+            return await asyncio.to_thread(loads)
+        return loads()
+    
     async def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make GET request to JIRA API."""
-        response = await self._make_request_with_retry("GET", endpoint, **kwargs)
-        return response.json()
+        """
+        Make GET request to JIRA API.
+        
+        Project and board listings are served from the response cache for their
+        _GET_CACHE_POLICIES TTL. If JIRA is unavailable or rate limiting, a cached
+        listing up to STALE_RESPONSE_MAX_AGE old is returned in place of the error.
+        Callers always get their own copy, so mutating it leaves the cache intact.
+        """
+        policy = self._get_cache_policy(endpoint, kwargs)
+        if policy is None:
+            response = await self._make_request_with_retry("GET", endpoint, **kwargs)
+            return await self._json(response)
+        
+        key, ttl = policy
+        cached = _cache_get(key, ttl)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        try:
+            response = await self._make_request_with_retry("GET", endpoint, **kwargs)
+        except (ExternalServiceError, RateLimitError) as e:
+            # Auth and client errors are not outages; never mask them
+            status_code = e.details.get("status_code")
+            stale = _cache_get(key, STALE_RESPONSE_MAX_AGE)
+            if stale is None or (status_code is not None and status_code < 500):
+                raise
+            logger.warning(f"Serving cached response for {endpoint} after JIRA error: {e}")
+            return copy.deepcopy(stale)
+        
+        data = await self._json(response)
+        _cache_set(key, copy.deepcopy(data))
+        return data
+    
+    def _get_cache_policy(self, endpoint: str, kwargs: Dict[str, Any]) -> Optional[Tuple[tuple, float]]:
+        """Cache key and TTL for a cacheable GET, or None when it is not cached."""
+        if kwargs.keys() - {"params"}:
+            return None
+        for pattern, ttl in _GET_CACHE_POLICIES:
+            if pattern.search(endpoint):
+                params = kwargs.get("params") or {}
+                key = self._cache_key("GET", endpoint, frozenset(params.items()))
+                try:
+                    hash(key)
+                except TypeError:
+                    return None
+                return key, ttl
+        return None
+    
+    @staticmethod
+    def _encode_json_body(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Pre-serialize a json= body with orjson when available.
+        
+        The Content-Type header is already set on the client, so the encoded
+        bytes are sent as-is and reused unchanged across retries.
+        """
+        if ORJSON_AVAILABLE and "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+        return kwargs
+    
+    async def get_many(
+        self,
+        calls: List[Tuple[str, Optional[Dict[str, Any]]]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Make independent GET requests concurrently.
+        
+        Concurrency is bounded by the connection pool size; the rate limiter
+        still applies to every request.
+        
+        Args:
+            calls: (endpoint, params) pairs
+            return_exceptions: Return failures in place of results instead of raising
+            
+        Returns:
+            Responses in the same order as calls
+        """
+        semaphore = asyncio.Semaphore(self._POOL_LIMIT)
+        
+        async def fetch(endpoint: str, params: Optional[Dict[str, Any]]) -> Any:
+            async with semaphore:
+                return await self.get(endpoint, params=params)
+        
+        return await asyncio.gather(
+            *(fetch(endpoint, params) for endpoint, params in calls),
+            return_exceptions=return_exceptions
+        )
     
     async def post(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make POST request to JIRA API."""
-        response = await self._make_request_with_retry("POST", endpoint, **kwargs)
-        return response.json()
+        response = await self._make_request_with_retry("POST", endpoint, **self._encode_json_body(kwargs))
+        return await self._json(response)
     
     async def put(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make PUT request to JIRA API."""
-        response = await self._make_request_with_retry("PUT", endpoint, **kwargs)
-        return response.json()
+        response = await self._make_request_with_retry("PUT", endpoint, **self._encode_json_body(kwargs))
+        return await self._json(response)
     
     async def delete(self, endpoint: str, **kwargs) -> bool:
         """Make DELETE request to JIRA API."""
         response = await self._make_request_with_retry("DELETE", endpoint, **kwargs)
         return response.status_code in (200, 204)
     
+    def _cache_key(self, *resource: Any) -> tuple:
+        """Build a metadata cache key scoped to this instance and login."""
+        return (self.url, self.email or self.username, *resource)
+    
     async def test_connection(self) -> bool:
         """Test connection to JIRA instance."""
         try:
-            endpoint = f"/rest/api/{self.preferred_api_version}/serverInfo"
-            await self.get(endpoint)
+            endpoint = self._ep["serverInfo"]
+            # Always hit the server, but let get_server_info() reuse the result
+            _cache_set(self._cache_key("serverInfo"), await self.get(endpoint))
             logger.info(f"Successfully connected to JIRA instance: {self.url}")
             return True
         except Exception as e:
@@ -294,19 +689,183 @@ class JiraAPIClient:
             return False
     
     async def get_server_info(self) -> Dict[str, Any]:
-        """Get JIRA server information."""
-        endpoint = f"/rest/api/{self.preferred_api_version}/serverInfo"
-        return await self.get(endpoint)
+        """Get JIRA server information, cached for SERVER_INFO_CACHE_TTL seconds."""
+        key = self._cache_key("serverInfo")
+        server_info = _cache_get(key, SERVER_INFO_CACHE_TTL)
+        if server_info is None:
+            endpoint = self._ep["serverInfo"]
+            server_info = await self.get(endpoint)
+            _cache_set(key, server_info)
+        # Callers get their own copy so they cannot mutate the cached entry
+        return copy.deepcopy(server_info)
     
     async def close(self):
-        """Close HTTP client."""
-        if self.client:
+        """Close the HTTP client unless it is still shared through the client cache."""
+        if self._transport is not None:
+            # The transport's owner closes the connection pool
+            return
+        if self._client_key is None or self._CLIENT_CACHE.get(self._client_key) is not self.client:
             await self.client.aclose()
+    
+    @classmethod
+    async def aclose_all(cls):
+        """Close every shared HTTP client of the running loop, e.g. on application shutdown."""
+        loop = asyncio.get_running_loop()
+        clients = list(cls._CLIENT_CACHE.items())
+        cls._CLIENT_CACHE.clear()
+        for key, client in clients:
+            # Clients of other loops cannot be closed from this one
+            if key[0] is loop:
+                await client.aclose()
+
+
+def _nested_value(data: Any, *path: str, default: Any = None) -> Any:
+    """Follow keys through a JIRA payload, returning default when a step is missing."""
+    try:
+        for key in path:
+            data = data[key]
+    except (KeyError, TypeError):
+        return default
+    return data
+
+
+def _issue_project_key(issue: Dict[str, Any]) -> Optional[str]:
+    """Project key of a JIRA issue, or None when it is not present."""
+    try:
+        return issue["fields"]["project"]["key"]
+    except (KeyError, TypeError):
+        return None
+
+
+def _merge_fields(fields: Dict[str, Any], mapped_fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Issue fields overlaid with mapped values, sharing fields when nothing is mapped."""
+    if not mapped_fields:
+        return fields
+    merged = fields.copy()
+    merged.update(mapped_fields)
+    return merged
+
+
+def _new_project_metrics() -> Dict[str, Any]:
+    """Empty per-project totals for meta-board synchronization."""
+    return {
+        "total_sprints": 0,
+        "total_issues": 0,
+        "total_story_points": 0.0,
+        "teams": set(),
+        "components": set()
+    }
+
+
+async def _get_all_pages(
+    client: JiraAPIClient,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    page_size: int = 50,
+    values_key: str = "values"
+) -> List[Dict[str, Any]]:
+    """
+    Collect the values of every page of a paginated JIRA listing.
+    
+    Once the first page reports a total, the remaining pages are requested
+    concurrently, stepping by the size of the first page since JIRA may cap
+    maxResults below page_size. Without a total, pages are fetched in turn
+    until a short or last page.
+    """
+    params = {**(params or {}), "maxResults": page_size}
+    response = await client.get(endpoint, params={**params, "startAt": 0})
+    values = list(response.get(values_key, []))
+    if not values or response.get("isLast"):
+        return values
+    
+    total = response.get("total")
+    if total is not None:
+        step = len(values)
+        pages = await client.get_many([
+            (endpoint, {**params, "startAt": start_at})
+            for start_at in range(step, total, step)
+        ])
+        for page in pages:
+            values.extend(page.get(values_key, []))
+        return values
+    
+    if len(values) < page_size:
+        return values
+    start_at = page_size
+    while True:
+        response = await client.get(endpoint, params={**params, "startAt": start_at})
+        page_values = response.get(values_key, [])
+        values.extend(page_values)
+        if len(page_values) < page_size or response.get("isLast"):
+            return values
+        start_at += page_size
+
+
+# Returned by type converters that leave the value to the transformation rule
+_UNCONVERTED = object()
+
+
+def _to_float(value: Any) -> Any:
+    if isinstance(value, (int, float)):
+        return _UNCONVERTED
+    return float(value) if value != "" else None
+
+
+def _to_int(value: Any) -> Any:
+    if isinstance(value, int):
+        return _UNCONVERTED
+    return int(float(value)) if value != "" else None
+
+
+def _to_string(value: Any) -> Any:
+    if isinstance(value, dict) and "value" in value:
+        return value["value"]
+    return str(value)
+
+
+def _to_list(value: Any) -> Any:
+    if isinstance(value, list):
+        return value
+    elif isinstance(value, str):
+        return [value]
+    return [str(value)]
+
+
+def _to_object(value: Any) -> Any:
+    return value
 
 
 class JiraFieldMappingService:
     """Service for JIRA field mapping operations and discovery."""
     
+    # Target field suggestions by name keyword, in priority order. The lookahead
+    # finds every (possibly overlapping) keyword in one scan; the lowest group
+    # number present wins, matching an ordered chain of substring checks.
+    _SUGGEST_RE = re.compile(
+        r"(?=(?P<story_points>story point|points)"
+        r"|(?P<discipline_team>team|discipline)"
+        r"|(?P<epic_name>epic)"
+        r"|(?P<priority>priority)"
+        r"|(?P<components>component)"
+        r"|(?P<fix_versions>version)"
+        r"|(?P<labels>label)"
+        r"|(?P<environment>environment)"
+        r"|(?P<due_date>due|deadline)"
+        r"|(?P<time_estimate>estimate))"
+    )
+    _SUGGEST_TARGETS = {index: name for name, index in _SUGGEST_RE.groupindex.items()}
+    _HIGH_CONFIDENCE_RE = re.compile(r"story point|team|discipline|epic|priority|component")
+    _MEDIUM_CONFIDENCE_RE = re.compile(r"version|label|environment|due|estimate")
+    
+    # Type converters for project-specific mappings
+    _TRANSFORMERS: Dict[str, Callable[[Any], Any]] = {
+        "float": _to_float,
+        "integer": _to_int,
+        "string": _to_string,
+        "list": _to_list,
+        "object": _to_object,
+    }
+    
     def __init__(self, client: JiraAPIClient, db: Optional[AsyncSession] = None):
         self.client = client
         self.db = db
@@ -323,11 +882,19 @@ class JiraFieldMappingService:
         """
         Get all custom fields from JIRA instance.
         
+        Field definitions change rarely, so results are cached for
+        FIELD_CACHE_TTL seconds per instance.
+        
         Returns:
             List of custom field definitions
         """
+        key = self.client._cache_key("fields")
+        custom_fields = _cache_get(key, FIELD_CACHE_TTL)
+        if custom_fields is not None:
+            return list(custom_fields)
+        
         try:
-            endpoint = f"/rest/api/{self.client.preferred_api_version}/field"
+            endpoint = self.client._ep["field"]
             response = await self.client.get(endpoint)
             
             # Filter to only custom fields
@@ -336,7 +903,8 @@ class JiraFieldMappingService:
                 if field.get("id", "").startswith("customfield_")
             ]
             
-            return custom_fields
+            _cache_set(key, custom_fields)
+            return list(custom_fields)
             
         except Exception as e:
             logger.error(f"Failed to get custom fields: {e}")
@@ -364,9 +932,11 @@ class JiraFieldMappingService:
             # Get sample issues if not provided
             if not sample_issues:
                 if project_key:
+                    # Only the custom field values are analysed
                     search_result = await self._search_issues_for_discovery(
                         jql=f"project = {project_key}",
-                        max_results=10
+                        max_results=10,
+                        fields=[field["id"] for field in custom_fields]
                     )
                     sample_issues = search_result.get("issues", [])
                 else:
@@ -376,32 +946,31 @@ class JiraFieldMappingService:
             if not sample_issues:
                 return {"error": "No sample issues available for analysis"}
             
+            # Collect populated custom field values in one pass over the samples
+            populated = defaultdict(list)
+            for issue in sample_issues[:5]:  # Limit to first 5 issues
+                for field_id, field_value in issue.get("fields", {}).items():
+                    if field_value is not None and field_id.startswith("customfield_"):
+                        populated[field_id].append(field_value)
+            
             # Analyze field usage patterns
             field_analysis = {}
             
             for field in custom_fields:
                 field_id = field["id"]
+                sample_values = populated.get(field_id)
+                if not sample_values:
+                    continue
+                
                 field_name = field["name"]
                 field_type = field.get("schema", {}).get("type", "unknown")
-                
-                # Analyze usage in sample issues
-                usage_count = 0
-                sample_values = []
-                
-                for issue in sample_issues[:5]:  # Limit to first 5 issues
-                    field_value = issue.get("fields", {}).get(field_id)
-                    if field_value is not None:
-                        usage_count += 1
-                        sample_values.append(field_value)
-                
-                if usage_count > 0:
-                    field_analysis[field_id] = {
-                        "name": field_name,
-                        "type": field_type,
-                        "usage_count": usage_count,
-                        "sample_values": sample_values[:3],  # Keep only first 3 samples
-                        "suggested_target": self._suggest_target_field(field_name, field_type, sample_values)
-                    }
+                field_analysis[field_id] = {
+                    "name": field_name,
+                    "type": field_type,
+                    "usage_count": len(sample_values),
+                    "sample_values": sample_values[:3],  # Keep only first 3 samples
+                    "suggested_target": self._suggest_target_field(field_name, field_type, sample_values)
+                }
             
             return {
                 "total_custom_fields": len(custom_fields),
@@ -414,14 +983,38 @@ class JiraFieldMappingService:
             logger.error(f"Failed to discover field mappings: {e}")
             return {"error": f"Failed to discover field mappings: {e}"}
     
-    async def _search_issues_for_discovery(self, jql: str, max_results: int = 10) -> Dict[str, Any]:
-        """Search for issues for field discovery purposes."""
-        endpoint = f"/rest/api/{self.client.preferred_api_version}/search"
-        params = {
-            "jql": jql,
-            "maxResults": max_results
-        }
-        return await self.client.get(endpoint, params=params)
+    async def _search_issues_for_discovery(
+        self,
+        jql: str,
+        max_results: int = 10,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Search for issues for field discovery purposes.
+        
+        When fields are given only those are returned, which keeps comments,
+        worklogs and other bulky default fields out of the payload. The search
+        is then sent as a POST so long custom field lists do not overflow the
+        request line.
+        """
+        key = self.client._cache_key("search", jql, max_results, tuple(fields or ()))
+        result = _cache_get(key, DISCOVERY_SEARCH_CACHE_TTL)
+        if result is None:
+            endpoint = self.client._ep["search"]
+            if fields:
+                result = await self.client.post(endpoint, json={
+                    "jql": jql,
+                    "maxResults": max_results,
+                    "fields": fields
+                })
+            else:
+                params = {
+                    "jql": jql,
+                    "maxResults": max_results
+                }
+                result = await self.client.get(endpoint, params=params)
+            _cache_set(key, result)
+        return result
     
     async def _get_sample_issues_from_board(self) -> List[Dict[str, Any]]:
         """Get sample issues from first available board."""
@@ -433,29 +1026,12 @@ class JiraFieldMappingService:
         field_name_lower = field_name.lower()
         
         # Common field mappings
-        if "story point" in field_name_lower or "points" in field_name_lower:
-            return "story_points"
-        elif "team" in field_name_lower or "discipline" in field_name_lower:
-            return "discipline_team"
-        elif "epic" in field_name_lower:
-            return "epic_name"
-        elif "priority" in field_name_lower:
-            return "priority"
-        elif "component" in field_name_lower:
-            return "components"
-        elif "version" in field_name_lower:
-            return "fix_versions"
-        elif "label" in field_name_lower:
-            return "labels"
-        elif "environment" in field_name_lower:
-            return "environment"
-        elif "due" in field_name_lower or "deadline" in field_name_lower:
-            return "due_date"
-        elif "estimate" in field_name_lower:
-            return "time_estimate"
-        else:
-            # Generate generic target field name
-            return field_name_lower.replace(" ", "_").replace("-", "_")
+        group = min((m.lastindex for m in self._SUGGEST_RE.finditer(field_name_lower)), default=None)
+        if group is not None:
+            return self._SUGGEST_TARGETS[group]
+        
+        # Generate generic target field name
+        return field_name_lower.replace(" ", "_").replace("-", "_")
     
     def _generate_mapping_suggestions(self, field_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate field mapping suggestions based on analysis."""
@@ -505,12 +1081,9 @@ class JiraFieldMappingService:
         field_name = analysis["name"].lower()
         name_score = 0.0
         
-        high_confidence_patterns = ["story point", "team", "discipline", "epic", "priority", "component"]
-        medium_confidence_patterns = ["version", "label", "environment", "due", "estimate"]
-        
-        if any(pattern in field_name for pattern in high_confidence_patterns):
+        if self._HIGH_CONFIDENCE_RE.search(field_name):
             name_score = 1.0
-        elif any(pattern in field_name for pattern in medium_confidence_patterns):
+        elif self._MEDIUM_CONFIDENCE_RE.search(field_name):
             name_score = 0.7
         else:
             name_score = 0.3
@@ -549,7 +1122,7 @@ class JiraFieldMappingService:
                 if field_value is not None:
                     try:
                         # Apply project-specific transformation
-                        transformed_value = await self._transform_field_value(
+                        transformed_value = self._transform_field_value(
                             field_value, field_type, transformation_rule
                         )
                         
@@ -572,7 +1145,7 @@ class JiraFieldMappingService:
         
         return mapped_fields
 
-    async def _transform_field_value(
+    def _transform_field_value(
         self,
         field_value: Any,
         field_type: str,
@@ -594,27 +1167,15 @@ class JiraFieldMappingService:
         
         try:
             # Apply type-based transformations
-            if field_type == "float" and not isinstance(field_value, (int, float)):
-                return float(field_value) if field_value != "" else None
-            elif field_type == "integer" and not isinstance(field_value, int):
-                return int(float(field_value)) if field_value != "" else None
-            elif field_type == "string":
-                if isinstance(field_value, dict) and "value" in field_value:
-                    return field_value["value"]
-                return str(field_value)
-            elif field_type == "list":
-                if isinstance(field_value, list):
-                    return field_value
-                elif isinstance(field_value, str):
-                    return [field_value]
-                else:
-                    return [str(field_value)]
-            elif field_type == "object":
-                return field_value
+            converter = self._TRANSFORMERS.get(field_type)
+            if converter is not None:
+                converted = converter(field_value)
+                if converted is not _UNCONVERTED:
+                    return converted
             
             # Apply custom transformation rules if specified
             if transformation_rule:
-                return await self._apply_transformation_rule(field_value, transformation_rule)
+                return self._apply_transformation_rule(field_value, transformation_rule)
             
             return field_value
             
@@ -622,7 +1183,7 @@ class JiraFieldMappingService:
             logger.debug(f"Field transformation failed for {field_type}: {e}")
             return field_value  # Return original value on transformation failure
 
-    async def _apply_transformation_rule(self, field_value: Any, rule: str) -> Any:
+    def _apply_transformation_rule(self, field_value: Any, rule: str) -> Any:
         """
         Apply custom transformation rule to field value.
         
@@ -638,9 +1199,8 @@ class JiraFieldMappingService:
         
         if rule == "extract_numeric":
             # Extract numeric value from string
-            import re
             if isinstance(field_value, str):
-                match = re.search(r'\d+\.?\d*', field_value)
+                match = _NUMERIC_RE.search(field_value)
                 return float(match.group()) if match else None
         elif rule == "uppercase":
             return str(field_value).upper() if field_value else None
@@ -668,12 +1228,26 @@ class MetaBoardService:
         """
         Analyze a board to detect if it should be configured as a meta-board.
         
+        Successful analyses are cached for META_BOARD_DETECTION_CACHE_TTL seconds,
+        so repeated syncs and webhook bursts for a board reuse them.
+        
         Args:
             board_id: JIRA board ID to analyze
             
         Returns:
             Meta-board detection results and configuration suggestions
         """
+        key = self.client._cache_key("metaBoardDetection", board_id)
+        detection = _cache_get(key, META_BOARD_DETECTION_CACHE_TTL)
+        if detection is None:
+            detection = await self._detect_meta_board_configuration(board_id)
+            if "error" not in detection:
+                _cache_set(key, detection)
+        # Callers get their own copy so they cannot mutate the cached entry
+        return copy.deepcopy(detection)
+    
+    async def _detect_meta_board_configuration(self, board_id: int) -> Dict[str, Any]:
+        """Analyze a board's recent sprints for meta-board detection, uncached."""
         try:
             # Get recent sprints for this board
             sprints = await self._get_sprints_for_board(board_id)
@@ -685,40 +1259,42 @@ class MetaBoardService:
                 }
             
             # Analyze recent sprints (up to 5 most recent)
-            recent_sprints = sorted(sprints, key=lambda s: s.get("id", 0), reverse=True)[:5]
+            recent_sprints = heapq.nlargest(5, sprints, key=lambda s: s.get("id", 0))
             project_analysis = {}
             total_multi_project_sprints = 0
             
-            for sprint in recent_sprints:
-                sprint_id = sprint.get("id")
-                if not sprint_id:
-                    continue
-                    
+            # Fetch issues for all recent sprints concurrently
+            sprint_ids = [sprint.get("id") for sprint in recent_sprints if sprint.get("id")]
+            responses = await self.client.get_many(
+                [self._sprint_issues_request(sprint_id) for sprint_id in sprint_ids],
+                return_exceptions=True
+            )
+            
+            for sprint_id, response in zip(sprint_ids, responses):
                 try:
-                    issues = await self._get_sprint_issues_for_analysis(sprint_id)
+                    if isinstance(response, BaseException):
+                        raise response
+                    issues = response.get("issues", [])
                     if not issues:
                         continue
                     
-                    # Count projects in this sprint
-                    sprint_projects = set()
-                    for issue in issues:
-                        project_key = issue.get("fields", {}).get("project", {}).get("key")
-                        if project_key:
-                            sprint_projects.add(project_key)
+                    # Count issues per project in this sprint
+                    project_counts = Counter(
+                        project_key
+                        for project_key in map(_issue_project_key, issues)
+                        if project_key
+                    )
                     
-                    if len(sprint_projects) > 1:
+                    if len(project_counts) > 1:
                         total_multi_project_sprints += 1
                     
                     # Track project frequency across sprints
-                    for project_key in sprint_projects:
-                        if project_key not in project_analysis:
-                            project_analysis[project_key] = {
-                                "sprint_count": 0,
-                                "total_issues": 0
-                            }
-                        project_analysis[project_key]["sprint_count"] += 1
-                        project_analysis[project_key]["total_issues"] += len([i for i in issues 
-                                                                              if i.get("fields", {}).get("project", {}).get("key") == project_key])
+                    for project_key, issue_count in project_counts.items():
+                        stats = project_analysis.setdefault(
+                            project_key, {"sprint_count": 0, "total_issues": 0}
+                        )
+                        stats["sprint_count"] += 1
+                        stats["total_issues"] += issue_count
                 
                 except Exception as e:
                     logger.warning(f"Error analyzing sprint {sprint_id}: {e}")
@@ -786,23 +1362,11 @@ class MetaBoardService:
         board_id: int
     ) -> float:
         """Calculate confidence score for meta-board recommendation."""
-        confidence = 0.0
-        
-        # Base confidence on multi-project sprint frequency
-        if multi_project_sprints >= 3:
-            confidence += 0.4
-        elif multi_project_sprints >= 2:
-            confidence += 0.3
-        elif multi_project_sprints >= 1:
-            confidence += 0.2
-        
-        # Add confidence based on project diversity
-        if unique_projects >= 4:
-            confidence += 0.3
-        elif unique_projects >= 3:
-            confidence += 0.2
-        elif unique_projects >= 2:
-            confidence += 0.1
+        # Base confidence on multi-project sprint frequency and project diversity
+        confidence = (
+            _MULTI_PROJECT_SPRINT_CONFIDENCE[min(multi_project_sprints, 3)]
+            + _PROJECT_DIVERSITY_CONFIDENCE[min(unique_projects, 4)]
+        )
         
         # Special boost for Board 259
         if board_id == 259:
@@ -832,60 +1396,92 @@ class MetaBoardService:
         project_keys = set()
         project_stats = {}
         cross_project_dependencies = []
+        issue_project_keys = []
+        # Priority and status names per project, counted in one pass after the loop
+        priorities: Dict[str, List[str]] = {}
+        statuses: Dict[str, List[str]] = {}
         
         for issue in issues:
-            project_key = issue.get("fields", {}).get("project", {}).get("key")
-            if project_key:
+            fields = issue.get("fields") or {}
+            try:
+                project_info = fields["project"]
+                project_key = project_info["key"]
+            except (KeyError, TypeError):
+                project_key = None
+            issue_project_keys.append(project_key)
+            if not project_key:
+                continue
+            
+            stats = project_stats.get(project_key)
+            if stats is None:
                 project_keys.add(project_key)
-                if project_key not in project_stats:
-                    project_info = issue.get("fields", {}).get("project", {})
-                    project_stats[project_key] = {
-                        "count": 0,
-                        "project_name": project_info.get("name", "Unknown"),
-                        "project_id": project_info.get("id"),
-                        "issues": [],
-                        "story_points": 0.0,
-                        "priority_distribution": {},
-                        "status_distribution": {},
-                        "components": set(),
-                        "teams": set()
-                    }
-                
-                # Collect enhanced project statistics
-                stats = project_stats[project_key]
-                stats["count"] += 1
-                stats["issues"].append(issue.get("key"))
-                
-                # Story points aggregation
-                story_points = self._extract_story_points(issue)
-                if story_points:
-                    stats["story_points"] += story_points
-                
-                # Priority and status distribution
-                priority = issue.get("fields", {}).get("priority", {}).get("name", "Unknown")
-                status = issue.get("fields", {}).get("status", {}).get("name", "Unknown")
-                stats["priority_distribution"][priority] = stats["priority_distribution"].get(priority, 0) + 1
-                stats["status_distribution"][status] = stats["status_distribution"].get(status, 0) + 1
-                
-                # Components and teams
-                components = issue.get("fields", {}).get("components", [])
-                for comp in components:
-                    if comp.get("name"):
-                        stats["components"].add(comp["name"])
-                
-                # Extract team information from custom fields
-                team_field = self._extract_team_field(issue)
-                if team_field:
-                    stats["teams"].add(team_field)
-                
-                # Check for cross-project dependencies
-                dependencies = self._extract_cross_project_dependencies(issue, project_key)
-                cross_project_dependencies.extend(dependencies)
+                stats = project_stats[project_key] = {
+                    "count": 0,
+                    "project_name": project_info.get("name", "Unknown"),
+                    "project_id": project_info.get("id"),
+                    "issues": [],
+                    "story_points": 0.0,
+                    "priority_distribution": None,
+                    "status_distribution": None,
+                    # Dicts used as insertion-ordered sets
+                    "components": {},
+                    "teams": {}
+                }
+                priorities[project_key] = []
+                statuses[project_key] = []
+            
+            # Collect enhanced project statistics
+            stats["count"] += 1
+            stats["issues"].append(issue.get("key"))
+            
+            # Story points aggregation
+            story_points = self._extract_story_points(issue)
+            if story_points:
+                stats["story_points"] += story_points
+            
+            # Priority and status distribution
+            try:
+                priority = fields["priority"]["name"]
+            except (KeyError, TypeError):
+                priority = "Unknown"
+            try:
+                status = fields["status"]["name"]
+            except (KeyError, TypeError):
+                status = "Unknown"
+            priorities[project_key].append(priority)
+            statuses[project_key].append(status)
+            
+            # Components and teams
+            components = stats["components"]
+            for comp in fields.get("components") or ():
+                comp_name = comp.get("name")
+                if comp_name:
+                    components[comp_name] = None
+            
+            # Extract team information from custom fields
+            team_field = self._extract_team_field(issue)
+            if team_field:
+                stats["teams"][team_field] = None
+            
+            # Check for cross-project dependencies
+            if fields.get("issuelinks"):
+                cross_project_dependencies.extend(
+                    self._extract_cross_project_dependencies(issue, project_key)
+                )
         
-        # Convert sets to lists for JSON serialization
-        for stats in project_stats.values():
+        # Finish per-project stats in one pass: count distributions, convert
+        # components and teams to lists for JSON serialization, and collect the
+        # totals shared by the Board 259 weights and every issue's project context
+        project_story_points = []
+        total_issues = 0
+        for project_key, stats in project_stats.items():
+            stats["priority_distribution"] = Counter(priorities[project_key])
+            stats["status_distribution"] = Counter(statuses[project_key])
             stats["components"] = list(stats["components"])
             stats["teams"] = list(stats["teams"])
+            project_story_points.append(stats["story_points"])
+            total_issues += stats["count"]
+        project_totals = (sum(project_story_points), total_issues, max(project_story_points, default=0))
         
         # Determine enhanced meta-board classification
         is_meta_board = len(project_keys) > 1
@@ -909,7 +1505,7 @@ class MetaBoardService:
             # Board 259 specific configuration
             board_259_config = {
                 "aggregation_strategy": "project_based_grouping",
-                "priority_weighting": self._calculate_board_259_priority_weights(project_stats),
+                "priority_weighting": self._calculate_board_259_priority_weights(project_stats, project_totals),
                 "cross_project_tracking": len(cross_project_dependencies) > 0,
                 "specialized_sync": True,
                 "requires_project_validation": True
@@ -932,30 +1528,44 @@ class MetaBoardService:
         if board_259_config:
             meta_board_metadata["board_259_config"] = board_259_config
         
-        # Enhance each issue with comprehensive project source metadata
+        # Project context and field profiles depend only on the project, so build
+        # them once per distinct project; a single-project sprint builds them once.
+        # Profile lookups share self.db, and an AsyncSession does not allow
+        # concurrent operations, so they run sequentially rather than through
+        # asyncio.gather.
+        deps_by_project = defaultdict(list)
+        for dep in cross_project_dependencies:
+            # Extraction guarantees source and target projects differ
+            deps_by_project[dep["source_project"]].append(dep)
+            deps_by_project[dep["target_project"]].append(dep)
+        
+        project_contexts: Dict[Optional[str], Dict[str, Any]] = {}
+        profiles: Dict[Optional[str], Dict[str, Any]] = {}
+        for project_key in dict.fromkeys(issue_project_keys):
+            project_contexts[project_key] = {
+                "is_primary_project": self._is_primary_project(project_key, project_stats, project_totals),
+                "project_weight": self._calculate_project_weight(project_key, project_stats, project_totals),
+                "cross_project_links": deps_by_project.get(project_key, [])
+            }
+            profiles[project_key] = await self._get_project_field_profile(project_key)
+        
+        # Enhance each issue with comprehensive project source metadata. Every issue
+        # references the one sprint-level metadata dict under "meta" rather than
+        # carrying its own copy of it.
         enhanced_issues = []
-        for issue in issues:
-            project_key = issue.get("fields", {}).get("project", {}).get("key")
-            
-            # Add comprehensive meta-board metadata
+        for issue, project_key in zip(issues, issue_project_keys):
             issue["meta_board_info"] = {
-                **meta_board_metadata,
+                "meta": meta_board_metadata,
                 "source_project": project_key,
                 "source_project_stats": project_stats.get(project_key, {}),
-                "project_context": {
-                    "is_primary_project": self._is_primary_project(project_key, project_stats),
-                    "project_weight": self._calculate_project_weight(project_key, project_stats),
-                    "cross_project_links": [dep for dep in cross_project_dependencies 
-                                          if dep.get("source_project") == project_key or 
-                                             dep.get("target_project") == project_key]
-                }
+                "project_context": project_contexts[project_key]
             }
             
             # Add project-specific field mapping context
             issue["field_mapping_context"] = {
                 "source_project": project_key,
                 "requires_project_specific_mapping": is_meta_board,
-                "project_field_profile": await self._get_project_field_profile(project_key)
+                "project_field_profile": profiles[project_key]
             }
             
             enhanced_issues.append(issue)
@@ -972,38 +1582,16 @@ class MetaBoardService:
     
     async def _get_sprints_for_board(self, board_id: int) -> List[Dict[str, Any]]:
         """Get sprints for a specific board."""
-        endpoint = f"/rest/agile/1.0/board/{board_id}/sprint"
-        
-        # Implement pagination to get all sprints
-        all_sprints = []
-        start_at = 0
-        max_results = 50
-        
-        while True:
-            response = await self.client.get(endpoint, params={
-                "maxResults": max_results,
-                "startAt": start_at
-            })
-            
-            sprints = response.get("values", [])
-            if not sprints:
-                break
-                
-            all_sprints.extend(sprints)
-            
-            # Check if we've got all results
-            if len(sprints) < max_results:
-                break
-                
-            start_at += max_results
-        
-        return all_sprints
+        return await _get_all_pages(self.client, f"/rest/agile/1.0/board/{board_id}/sprint")
+    
+    @staticmethod
+    def _sprint_issues_request(sprint_id: int) -> Tuple[str, Dict[str, Any]]:
+        """Endpoint and params for fetching a sprint's issues for analysis."""
+        return f"/rest/agile/1.0/sprint/{sprint_id}/issue", {"maxResults": 1000, "fields": _ANALYSIS_FIELDS}
     
     async def _get_sprint_issues_for_analysis(self, sprint_id: int) -> List[Dict[str, Any]]:
         """Get issues for sprint analysis (simplified version)."""
-        endpoint = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
-        params = {"maxResults": 1000}
-        
+        endpoint, params = self._sprint_issues_request(sprint_id)
         response = await self.client.get(endpoint, params=params)
         return response.get("issues", [])
     
@@ -1017,6 +1605,12 @@ class MetaBoardService:
         Returns:
             Board information or None if not found
         """
+        # A sprint's board rarely changes, and webhook bursts ask for the same sprint
+        key = self.client._cache_key("sprintBoard", sprint_id)
+        board_info = _cache_get(key, SPRINT_BOARD_CACHE_TTL)
+        if board_info is not None:
+            return board_info
+        
         try:
             # Get sprint details first
             endpoint = f"/rest/agile/1.0/sprint/{sprint_id}"
@@ -1030,12 +1624,14 @@ class MetaBoardService:
             board_endpoint = f"/rest/agile/1.0/board/{board_id}"
             board_response = await self.client.get(board_endpoint)
             
-            return {
+            board_info = {
                 "board_id": board_id,
                 "board_name": board_response.get("name"),
                 "board_type": board_response.get("type"),
                 "project_key": board_response.get("location", {}).get("projectKey")
             }
+            _cache_set(key, board_info)
+            return board_info
             
         except Exception as e:
             logger.warning(f"Could not get board info for sprint {sprint_id}: {e}")
@@ -1043,16 +1639,9 @@ class MetaBoardService:
     
     def _extract_story_points(self, issue: Dict[str, Any]) -> Optional[float]:
         """Extract story points from issue fields."""
-        fields = issue.get("fields", {})
-        
-        # Common story points field IDs
-        story_point_fields = [
-            "customfield_10002",  # Common Atlassian Cloud field
-            "customfield_10004",  # Common Atlassian Server field
-            "customfield_10016",  # Another common field
-        ]
+        fields = issue.get("fields") or {}
         
-        for field_id in story_point_fields:
+        for field_id in _STORY_POINT_FIELDS:
             value = fields.get(field_id)
             if value is not None:
                 try:
@@ -1064,21 +1653,17 @@ class MetaBoardService:
     
     def _extract_team_field(self, issue: Dict[str, Any]) -> Optional[str]:
         """Extract team/discipline information from issue custom fields."""
-        fields = issue.get("fields", {})
-        
-        # Common team field patterns
-        team_field_patterns = [
-            "customfield_10741",  # Discipline team field from example
-            "customfield_10740",  # Alternative team field
-            "customfield_10015",  # Another common team field
-        ]
+        fields = issue.get("fields") or {}
         
-        for field_id in team_field_patterns:
+        for field_id in _TEAM_FIELDS:
             value = fields.get(field_id)
-            if value:
-                if isinstance(value, dict) and "value" in value:
-                    return value["value"]
-                elif isinstance(value, str):
+            if not value:
+                continue
+            # Option fields ({"value": ...}) are the common layout
+            try:
+                return value["value"]
+            except (KeyError, TypeError):
+                if isinstance(value, str):
                     return value
         
         return None
@@ -1092,51 +1677,47 @@ class MetaBoardService:
         dependencies = []
         fields = issue.get("fields", {})
         issue_links = fields.get("issuelinks", [])
+        source_issue = issue.get("key")
         
         for link in issue_links:
-            # Check inward links
-            if "inwardIssue" in link:
-                target_issue = link["inwardIssue"]
-                target_project = target_issue.get("fields", {}).get("project", {}).get("key")
-                
-                if target_project and target_project != source_project:
-                    dependencies.append({
-                        "type": "inward",
-                        "source_project": source_project,
-                        "target_project": target_project,
-                        "source_issue": issue.get("key"),
-                        "target_issue": target_issue.get("key"),
-                        "link_type": link.get("type", {}).get("inward", "depends on"),
-                        "priority": target_issue.get("fields", {}).get("priority", {}).get("name")
-                    })
-            
-            # Check outward links
-            if "outwardIssue" in link:
-                target_issue = link["outwardIssue"]
-                target_project = target_issue.get("fields", {}).get("project", {}).get("key")
+            link_type = link.get("type") or {}
+            # Inward links first, then outward, with JIRA's default link names
+            for direction, target_key, default_name in _LINK_DIRECTIONS:
+                target_issue = link.get(target_key)
+                if target_issue is None:
+                    continue
                 
+                target_project = _issue_project_key(target_issue)
                 if target_project and target_project != source_project:
                     dependencies.append({
-                        "type": "outward",
+                        "type": direction,
                         "source_project": source_project,
                         "target_project": target_project,
-                        "source_issue": issue.get("key"),
+                        "source_issue": source_issue,
                         "target_issue": target_issue.get("key"),
-                        "link_type": link.get("type", {}).get("outward", "blocks"),
-                        "priority": target_issue.get("fields", {}).get("priority", {}).get("name")
+                        "link_type": link_type.get(direction, default_name),
+                        "priority": _nested_value(target_issue, "fields", "priority", "name")
                     })
         
         return dependencies
     
-    def _calculate_board_259_priority_weights(self, project_stats: Dict[str, Any]) -> Dict[str, float]:
-        """Calculate Board 259 specific priority weights for projects."""
+    def _calculate_board_259_priority_weights(
+        self,
+        project_stats: Dict[str, Any],
+        totals: Tuple[float, int, float]
+    ) -> Dict[str, float]:
+        """
+        Calculate Board 259 specific priority weights for projects.
+        
+        totals is (total story points, total issue count, largest project story points).
+        """
         weights = {}
-        total_story_points = sum(stats.get("story_points", 0) for stats in project_stats.values())
+        total_story_points, total_issues_all, _ = totals
         
         for project_key, stats in project_stats.items():
             # Base weight on story points and issue count
             story_point_weight = stats.get("story_points", 0) / max(total_story_points, 1)
-            issue_count_weight = stats.get("count", 0) / sum(s.get("count", 0) for s in project_stats.values())
+            issue_count_weight = stats.get("count", 0) / max(total_issues_all, 1)
             
             # Adjust based on priority distribution
             priority_dist = stats.get("priority_distribution", {})
@@ -1150,25 +1731,34 @@ class MetaBoardService:
         
         return weights
     
-    def _is_primary_project(self, project_key: str, project_stats: Dict[str, Any]) -> bool:
-        """Determine if a project is the primary project in a meta-board context."""
+    def _is_primary_project(
+        self,
+        project_key: str,
+        project_stats: Dict[str, Any],
+        totals: Tuple[float, int, float]
+    ) -> bool:
+        """Determine if a project is the primary project, given the sprint totals."""
         if not project_stats:
             return True
         
         project_data = project_stats.get(project_key, {})
-        max_story_points = max(stats.get("story_points", 0) for stats in project_stats.values())
+        max_story_points = totals[2]
         
         # Primary project is the one with the most story points
         return project_data.get("story_points", 0) >= max_story_points
     
-    def _calculate_project_weight(self, project_key: str, project_stats: Dict[str, Any]) -> float:
-        """Calculate project weight within meta-board sprint context."""
+    def _calculate_project_weight(
+        self,
+        project_key: str,
+        project_stats: Dict[str, Any],
+        totals: Tuple[float, int, float]
+    ) -> float:
+        """Calculate project weight within meta-board sprint context, given the sprint totals."""
         if not project_stats:
             return 1.0
         
         project_data = project_stats.get(project_key, {})
-        total_story_points = sum(stats.get("story_points", 0) for stats in project_stats.values())
-        total_issues = sum(stats.get("count", 0) for stats in project_stats.values())
+        total_story_points, total_issues, _ = totals
         
         if total_story_points == 0 and total_issues == 0:
             return 1.0 / len(project_stats)  # Equal weight if no data
@@ -1226,6 +1816,8 @@ class JiraSyncService:
         self.meta_board_service = meta_board_service
         self.db = db
         self._field_mapping_service = None
+        # Active field mappings as (fetched at, mapping rows)
+        self._mapping_cache: Optional[Tuple[float, List[Any]]] = None
     
     async def _get_field_mapping_service(self):
         """Get or create field mapping service."""
@@ -1281,10 +1873,10 @@ class JiraSyncService:
             "issue_key": issue.get("key"),
             "issue_id": issue.get("id"),
             "summary": fields.get("summary"),
-            "issue_type": fields.get("issuetype", {}).get("name"),
-            "status": fields.get("status", {}).get("name"),
-            "priority": fields.get("priority", {}).get("name"),
-            "project_key": fields.get("project", {}).get("key"),
+            "issue_type": _nested_value(fields, "issuetype", "name"),
+            "status": _nested_value(fields, "status", "name"),
+            "priority": _nested_value(fields, "priority", "name"),
+            "project_key": _nested_value(fields, "project", "key"),
             "assignee": None,
             "story_points": None,
             "discipline_team": None,
@@ -1305,19 +1897,19 @@ class JiraSyncService:
         # Extract custom fields with mapping if available
         if field_mapping_service:
             try:
-                mappings = await field_mapping_service.get_active_mappings(data["project_key"])
+                mappings = await self._get_active_mappings(field_mapping_service)
                 for mapping in mappings:
                     jira_field = mapping.jira_field_id
                     if jira_field in fields:
                         field_value = fields[jira_field]
                         
                         # Map the field based on its type
-                        if mapping.sprint_reports_field == "story_points":
+                        if mapping.target_field == "story_points":
                             try:
                                 data["story_points"] = float(field_value) if field_value else None
                             except (ValueError, TypeError):
                                 pass
-                        elif mapping.sprint_reports_field == "discipline_team":
+                        elif mapping.target_field == "discipline_team":
                             if isinstance(field_value, dict) and "value" in field_value:
                                 data["discipline_team"] = field_value["value"]
                             elif isinstance(field_value, str):
@@ -1353,6 +1945,17 @@ class JiraSyncService:
         
         return data
     
+    async def _get_active_mappings(self, field_mapping_service: Any) -> List[Any]:
+        """Get the active field mappings, reused for a burst of webhook events."""
+        now = time.monotonic()
+        entry = self._mapping_cache
+        if entry and now - entry[0] < WEBHOOK_MAPPING_CACHE_TTL:
+            return entry[1]
+        
+        mappings = await field_mapping_service.get_active_mappings()
+        self._mapping_cache = (now, mappings)
+        return mappings
+    
     async def _process_sprint_webhook(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process sprint-related webhook events."""
         sprint = event_data.get("sprint", {})
@@ -1506,15 +2109,28 @@ class JiraSyncService:
                 )[:3]
                 sprints_to_sync = active_sprints + recent_closed
             
-            # Synchronize each sprint with project awareness
+            # Synchronize sprints concurrently, up to SPRINT_SYNC_CONCURRENCY at a time
+            semaphore = asyncio.Semaphore(SPRINT_SYNC_CONCURRENCY)
+            
+            async def _sync_sprint(sprint: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._sync_meta_board_sprint(
+                        sprint["id"], preserve_project_context, meta_board_config=meta_board_config
+                    )
+            
+            sprint_sync_results = await asyncio.gather(
+                *(_sync_sprint(sprint) for sprint in sprints_to_sync),
+                return_exceptions=True
+            )
+            
+            # Aggregate the results in sprint order with project awareness
             all_cross_project_deps = []
-            project_metrics = {}
+            project_metrics = defaultdict(_new_project_metrics)
             
-            for sprint in sprints_to_sync:
+            for sprint, sprint_sync_result in zip(sprints_to_sync, sprint_sync_results):
                 try:
-                    sprint_sync_result = await self._sync_meta_board_sprint(
-                        sprint["id"], preserve_project_context
-                    )
+                    if isinstance(sprint_sync_result, BaseException):
+                        raise sprint_sync_result
                     
                     sync_results["project_results"][sprint["id"]] = sprint_sync_result
                     
@@ -1525,20 +2141,12 @@ class JiraSyncService:
                     # Aggregate project metrics
                     sprint_projects = sprint_sync_result.get("project_metrics", {})
                     for project_key, metrics in sprint_projects.items():
-                        if project_key not in project_metrics:
-                            project_metrics[project_key] = {
-                                "total_sprints": 0,
-                                "total_issues": 0,
-                                "total_story_points": 0.0,
-                                "teams": set(),
-                                "components": set()
-                            }
-                        
-                        project_metrics[project_key]["total_sprints"] += 1
-                        project_metrics[project_key]["total_issues"] += metrics.get("count", 0)
-                        project_metrics[project_key]["total_story_points"] += metrics.get("story_points", 0.0)
-                        project_metrics[project_key]["teams"].update(metrics.get("teams", []))
-                        project_metrics[project_key]["components"].update(metrics.get("components", []))
+                        totals = project_metrics[project_key]
+                        totals["total_sprints"] += 1
+                        totals["total_issues"] += metrics.get("count", 0)
+                        totals["total_story_points"] += metrics.get("story_points", 0.0)
+                        totals["teams"].update(metrics.get("teams", ()))
+                        totals["components"].update(metrics.get("components", ()))
                 
                 except Exception as e:
                     error_msg = f"Failed to sync sprint {sprint['id']}: {e}"
@@ -1551,6 +2159,7 @@ class JiraSyncService:
                 metrics["components"] = list(metrics["components"])
             
             # Store aggregated results
+            project_metrics = dict(project_metrics)
             sync_results["cross_project_dependencies"] = all_cross_project_deps
             sync_results["aggregated_metrics"] = {
                 "total_projects": len(project_metrics),
@@ -1588,7 +2197,9 @@ class JiraSyncService:
     async def _sync_meta_board_sprint(
         self,
         sprint_id: int,
-        preserve_project_context: bool = True
+        preserve_project_context: bool = True,
+        *,
+        meta_board_config: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Synchronize a single sprint within meta-board context.
@@ -1596,6 +2207,8 @@ class JiraSyncService:
         Args:
             sprint_id: Sprint ID to synchronize
             preserve_project_context: Whether to preserve project source information
+            meta_board_config: Board detection already made by the caller, so the
+                sprint sync does not detect it again
             
         Returns:
             Sprint synchronization results with project breakdown
@@ -1654,8 +2267,25 @@ class JiraSyncService:
         """
         project_metrics = sync_results.get("aggregated_metrics", {}).get("project_metrics", {})
         
+        # Weigh the sync totals the same way as a single sprint's project stats
+        project_stats = {
+            project_key: {
+                "story_points": metrics.get("total_story_points", 0),
+                "count": metrics.get("total_issues", 0)
+            }
+            for project_key, metrics in project_metrics.items()
+        }
+        story_points = [stats["story_points"] for stats in project_stats.values()]
+        totals = (
+            sum(story_points),
+            sum(stats["count"] for stats in project_stats.values()),
+            max(story_points, default=0)
+        )
+        
         enhancements = {
-            "priority_weighted_projects": self.meta_board_service._calculate_board_259_priority_weights(project_metrics),
+            "priority_weighted_projects": self.meta_board_service._calculate_board_259_priority_weights(
+                project_stats, totals
+            ),
             "aggregation_validation": {
                 "all_projects_have_data": all(
                     metrics.get("total_issues", 0) > 0 
@@ -1731,8 +2361,17 @@ class JiraService:
         return self._sync_service
     
     # Core CRUD Operations - Backward Compatible Facade
-    async def get_sprints(self, board_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get sprints from JIRA with full pagination support."""
+    async def get_sprints(
+        self,
+        board_id: Optional[int] = None,
+        allow_placeholders: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get sprints from JIRA with full pagination support.
+        
+        If JIRA cannot be reached, no sprints are returned, or a sample sprint
+        when allow_placeholders is set.
+        """
         client = await self._get_client()
         
         try:
@@ -1742,35 +2381,17 @@ class JiraService:
                 # Get all sprints - with pagination
                 endpoint = "/rest/agile/1.0/sprint"
             
-            # Implement pagination to get all sprints
-            all_sprints = []
-            start_at = 0
-            max_results = 50  # Use smaller batches for better performance
-            
-            while True:
-                response = await client.get(endpoint, params={
-                    "maxResults": max_results,
-                    "startAt": start_at
-                })
-                
-                sprints = response.get("values", [])
-                if not sprints:
-                    break
-                    
-                all_sprints.extend(sprints)
-                
-                # Check if we've got all results
-                if len(sprints) < max_results:
-                    break
-                    
-                start_at += max_results
+            # Fetch every page, using smaller batches for better performance
+            all_sprints = await _get_all_pages(client, endpoint, page_size=50)
             
             logger.debug(f"Retrieved {len(all_sprints)} sprints from {'board ' + str(board_id) if board_id else 'all boards'}")
             return all_sprints
             
         except Exception as e:
             logger.error(f"Failed to get sprints: {e}")
-            # Return placeholder data for now to maintain backward compatibility
+            if not allow_placeholders:
+                return []
+            # Placeholder data for callers that still rely on it
             return [
                 {
                     "id": 1,
@@ -1788,20 +2409,39 @@ class JiraService:
         sprint_id: int,
         exclude_subtasks: bool = True,
         jql_filter: Optional[str] = None,
-        detect_meta_board: bool = True
+        detect_meta_board: bool = True,
+        fields: Optional[Iterable[str]] = None,
+        allow_placeholders: bool = False
     ) -> List[Dict[str, Any]]:
-        """Get issues for a specific sprint with optional meta-board detection."""
+        """
+        Get issues for a specific sprint with optional meta-board detection.
+        
+        fields limits the issue fields JIRA returns; the fields needed for subtask
+        filtering and meta-board enhancement are always included. All fields are
+        returned when it is omitted.
+        
+        If JIRA cannot be reached, no issues are returned, or a sample issue when
+        allow_placeholders is set.
+        """
         client = await self._get_client()
         
         try:
             endpoint = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
             
-            params = {"maxResults": 1000}
+            params = {}
             if jql_filter:
                 params["jql"] = jql_filter
-            
-            response = await client.get(endpoint, params=params)
-            issues = response.get("issues", [])
+            if fields is not None:
+                requested = set(fields)
+                if exclude_subtasks:
+                    requested.add("issuetype")
+                if detect_meta_board:
+                    requested |= _ENHANCEMENT_FIELDS
+                params["fields"] = ",".join(sorted(requested))
+            
+            # Request up to 1000 issues per page; when JIRA caps the page size
+            # lower, the remaining pages are fetched concurrently
+            issues = await _get_all_pages(client, endpoint, params, page_size=1000, values_key="issues")
             
             if exclude_subtasks:
                 issues = [issue for issue in issues
@@ -1816,7 +2456,9 @@ class JiraService:
             
         except Exception as e:
             logger.error(f"Failed to get sprint issues: {e}")
-            # Return placeholder data for now to maintain backward compatibility
+            if not allow_placeholders:
+                return []
+            # Placeholder data for callers that still rely on it
             return [
                 {
                     "key": "TEST-123",
@@ -1836,7 +2478,8 @@ class JiraService:
         template_id: Optional[int] = None,
         exclude_subtasks: bool = True,
         jql_filter: Optional[str] = None,
-        enable_project_specific_mapping: bool = True
+        enable_project_specific_mapping: bool = True,
+        fields: Optional[Iterable[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Enhanced sprint issues retrieval with project-specific field mapping for meta-boards.
@@ -1847,6 +2490,7 @@ class JiraService:
             exclude_subtasks: Whether to exclude subtasks
             jql_filter: Additional JQL filter
             enable_project_specific_mapping: Enable project-specific field mappings for meta-boards
+            fields: Issue fields to request from JIRA, or None for all fields
             
         Returns:
             List of issues with mapped fields and meta-board enhancements
@@ -1856,7 +2500,8 @@ class JiraService:
             sprint_id=sprint_id,
             exclude_subtasks=exclude_subtasks,
             jql_filter=jql_filter,
-            detect_meta_board=True
+            detect_meta_board=True,
+            fields=fields
         )
         
         # Apply field mappings via service composition
@@ -1865,12 +2510,17 @@ class JiraService:
         mapped_issues = []
         project_mapping_cache = {}  # Cache project-specific mappings
         
+        # Meta-board detection is per sprint; every enhanced issue shares its metadata
+        is_meta_board = bool(raw_issues) and raw_issues[0].get("meta_board_info", {}).get("meta", {}).get(
+            "is_meta_board", False
+        )
+        
         for issue in raw_issues:
             try:
                 # Extract project information for project-specific mapping
-                project_key = issue.get("fields", {}).get("project", {}).get("key")
+                project_key = _issue_project_key(issue)
+                fields = issue.get("fields", {})
                 meta_board_info = issue.get("meta_board_info", {})
-                is_meta_board = meta_board_info.get("is_meta_board", False)
                 
                 # Determine mapping strategy
                 mapping_template_id = template_id
@@ -1903,10 +2553,11 @@ class JiraService:
                 mapped_issue = {
                     "key": issue.get("key"),
                     "id": issue.get("id"),
-                    "original_fields": issue.get("fields", {}),
+                    "original_fields": fields,
                     "mapped_fields": mapped_fields,
-                    # Keep backward compatibility
-                    "fields": {**issue.get("fields", {}), **mapped_fields},
+                    # Keep backward compatibility; without mapped values the
+                    # original fields are shared rather than copied
+                    "fields": _merge_fields(fields, mapped_fields),
                     # Preserve meta-board information
                     "meta_board_info": meta_board_info,
                     "field_mapping_context": issue.get("field_mapping_context", {}),
@@ -1924,8 +2575,9 @@ class JiraService:
                 
             except Exception as e:
                 logger.error(f"Failed to apply field mappings to issue {issue.get('key', 'unknown')}: {e}")
-                # Fall back to original issue structure but preserve meta-board info
-                fallback_issue = {**issue}
+                # Fall back to original issue structure but preserve meta-board info;
+                # the raw issue is not used again, so it is annotated in place
+                fallback_issue = issue
                 fallback_issue["mapping_metadata"] = {
                     "template_id": template_id,
                     "project_specific": False,
@@ -1937,7 +2589,7 @@ class JiraService:
                 mapped_issues.append(fallback_issue)
         
         # Log meta-board mapping statistics
-        if mapped_issues and mapped_issues[0].get("meta_board_info", {}).get("is_meta_board"):
+        if mapped_issues and is_meta_board:
             project_keys = set(issue.get("mapping_metadata", {}).get("project_key") for issue in mapped_issues)
             project_specific_count = sum(1 for issue in mapped_issues 
                                       if issue.get("mapping_metadata", {}).get("project_specific"))
@@ -1995,33 +2647,12 @@ class JiraService:
         try:
             endpoint = "/rest/agile/1.0/board"
             
-            # Implement pagination to get all boards
-            all_boards = []
-            start_at = 0
-            max_results = 50  # Use smaller batches for better performance
+            params = {}
+            if project_key:
+                params["projectKeyOrId"] = project_key
             
-            while True:
-                params = {
-                    "maxResults": max_results,
-                    "startAt": start_at
-                }
-                
-                if project_key:
-                    params["projectKeyOrId"] = project_key
-                
-                response = await client.get(endpoint, params=params)
-                boards = response.get("values", [])
-                
-                if not boards:
-                    break
-                    
-                all_boards.extend(boards)
-                
-                # Check if we've got all results
-                if len(boards) < max_results:
-                    break
-                    
-                start_at += max_results
+            # Fetch every page, using smaller batches for better performance
+            all_boards = await _get_all_pages(client, endpoint, params, page_size=50)
             
             logger.debug(f"Retrieved {len(all_boards)} boards{' for project ' + project_key if project_key else ''}")
             return all_boards
@@ -2035,7 +2666,7 @@ class JiraService:
         client = await self._get_client()
         
         try:
-            endpoint = f"/rest/api/{client.preferred_api_version}/project"
+            endpoint = client._ep["project"]
             response = await client.get(endpoint)
             return response if isinstance(response, list) else response.get("values", [])
             
@@ -2053,7 +2684,7 @@ class JiraService:
         client = await self._get_client()
         
         try:
-            endpoint = f"/rest/api/{client.preferred_api_version}/search"
+            endpoint = client._ep["search"]
             params = {
                 "jql": jql,
                 "maxResults": max_results
@@ -33,6 +33,9 @@ from app.core.exceptions import NotFoundError, ValidationError
 
 logger = get_logger(__name__)
 
+# Issue fields read by story point and status metrics (see _extract_story_points)
+STORY_POINT_STATUS_FIELDS = ("status", "customfield_10002")
+
 
 class SprintService:
     """Service class for sprint operations."""
@@ -1045,7 +1048,8 @@ class SprintService:
                 # Get sprint issues for this project
                 issues = await jira_service.get_sprint_issues(
                     sprint.jira_sprint_id,
-                    jql_filter=f"project = {project_key}"
+                    jql_filter=f"project = {project_key}",
+                    fields=STORY_POINT_STATUS_FIELDS
                 )
                 
                 # Calculate completed story points
@@ -1315,7 +1319,8 @@ class SprintService:
             try:
                 issues = await jira_service.get_sprint_issues(
                     sprint.jira_sprint_id,
-                    jql_filter=f"project = {project_key}"
+                    jql_filter=f"project = {project_key}",
+                    fields=STORY_POINT_STATUS_FIELDS
                 )
                 
                 total_points = sum(self._extract_story_points(issue) for issue in issues)
@@ -25,6 +25,10 @@ from app.workers.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
 
+# Sprint syncs triggered by webhooks wait this long, so a burst of events for
+# the same sprint is handled by one sync that sees all of their changes
+SPRINT_SYNC_DEBOUNCE_SECONDS = 5
+
 # Create async database engine for workers
 engine = create_async_engine(settings.DATABASE_URL)
 AsyncSessionLocal = sessionmaker(
@@ -274,8 +278,7 @@ async def process_sprint_event(db: AsyncSession, event: WebhookEvent):
     
     # Trigger sprint synchronization if needed
     if event.event_type in ["jira:sprint_started", "jira:sprint_closed"]:
-        from app.workers.jira_sync_tasks import sync_sprint_data
-        sync_sprint_data.delay(sprint_id)
+        await schedule_sprint_sync(sprint_id)
     
     log_event_processing(
         event.id, "INFO",
@@ -285,6 +288,34 @@ async def process_sprint_event(db: AsyncSession, event: WebhookEvent):
     )
 
 
+async def schedule_sprint_sync(sprint_id: int):
+    """
+    Schedule a debounced sync for a sprint, coalescing bursts of events.
+    
+    The first event in a debounce window queues a sync to run when the window
+    ends; later events in the window are covered by that sync. If Redis is
+    unavailable, every event schedules its own sync as before.
+    """
+    from app.workers.jira_sync_tasks import sync_sprint_data
+    
+    try:
+        redis_client = await get_redis_client()
+        try:
+            scheduled = await redis_client.set(
+                f"sprint_sync_pending:{sprint_id}", 1, nx=True, ex=SPRINT_SYNC_DEBOUNCE_SECONDS
+            )
+        finally:
+            await redis_client.close()
+    except Exception as e:
+        logger.warning(f"Could not coalesce sync for sprint {sprint_id}: {e}")
+        scheduled = True
+    
+    if scheduled:
+        sync_sprint_data.apply_async(args=[sprint_id], countdown=SPRINT_SYNC_DEBOUNCE_SECONDS)
+    else:
+        logger.debug(f"Sync for sprint {sprint_id} already scheduled")
+
+
 async def update_queue_items(db: AsyncSession, event: WebhookEvent):
     """Update existing queue items with new issue data."""
     if not event.processed_data:
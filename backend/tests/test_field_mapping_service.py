@@ -0,0 +1,340 @@
+"""
+Tests for field mapping transformations and validation.
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+import os
+from datetime import datetime
+
+# Mock settings before importing
+os.environ.update({
+    'SECRET_KEY': 'test-secret-key-for-testing-only',
+    'ENCRYPTION_KEY': 'test-encryption-key-for-testing-only-32-bytes',
+    'POSTGRES_SERVER': 'localhost',
+    'POSTGRES_USER': 'test',
+    'POSTGRES_PASSWORD': 'test',
+    'POSTGRES_DB': 'test'
+})
+
+from app.models.field_mapping import FieldType, MappingType
+from app.schemas.field_mapping import FieldMappingCreate, FieldMappingUpdate
+from app.services import field_mapping_service
+from app.services.field_mapping_service import FieldMappingService
+
+
+@pytest.fixture
+def service():
+    """Field mapping service with a mocked database session."""
+    return FieldMappingService(Mock())
+
+
+class TestFieldTransformations:
+    """Test cases for field value transformations."""
+
+    def test_date_format_default_jira_format(self, service):
+        """Test date_format with the default JIRA timestamp format."""
+        result = service._apply_transformation(
+            "2024-03-15T10:30:00.000Z", "date_format", {}, FieldType.STRING
+        )
+
+        assert result == "2024-03-15"
+
+    def test_date_format_custom_formats(self, service):
+        """Test date_format with custom input and output formats."""
+        config = {"input_format": "%d/%m/%Y", "output_format": "%Y.%m.%d"}
+        result = service._apply_transformation(
+            "15/03/2024", "date_format", config, FieldType.STRING
+        )
+
+        assert result == "2024.03.15"
+
+    def test_date_format_invalid_value_passthrough(self, service):
+        """Test date_format returns the original value when parsing fails."""
+        result = service._apply_transformation(
+            "not-a-date", "date_format", {}, FieldType.STRING
+        )
+
+        assert result == "not-a-date"
+
+    @pytest.mark.parametrize("value", [
+        "2024-03-15",
+        "2024-03-15T10:30:00.000+10:00",
+        "2024-03-15T10:30:00Z",
+        "2024-03-15 10:30:00.000Z",
+    ])
+    def test_date_format_rejects_non_jira_timestamps(self, service, value):
+        """Test values strptime rejects are passed through, even with the C parser available."""
+        fast_parser = Mock(return_value=datetime(2024, 3, 15, 10, 30))
+        field_mapping_service._get_date_parser.cache_clear()
+        try:
+            with patch.object(field_mapping_service, "CISO8601_AVAILABLE", True), \
+                    patch.object(field_mapping_service, "ciso8601",
+                                 Mock(parse_datetime_as_naive=fast_parser), create=True):
+                result = service._apply_transformation(value, "date_format", {}, FieldType.STRING)
+                canonical = service._apply_transformation(
+                    "2024-03-15T10:30:00.000Z", "date_format", {}, FieldType.STRING
+                )
+        finally:
+            field_mapping_service._get_date_parser.cache_clear()
+
+        assert result == value
+        assert canonical == "2024-03-15"
+        fast_parser.assert_called_once_with("2024-03-15T10:30:00.000Z")
+
+
+    def test_unknown_transformation_returns_value(self, service):
+        """Test unknown transformation types pass the value through."""
+        assert service._apply_transformation("x", "unknown", {}, FieldType.STRING) == "x"
+
+    def test_conditional_transformation(self, service):
+        """Test conditional transformation picks the first matching condition."""
+        config = {
+            "conditions": [
+                {"operator": "greater_than", "value": "8", "result": "large"},
+                {"operator": "greater_than", "value": 3, "result": "medium"},
+                {"operator": "unknown", "value": 0, "result": "never"},
+            ],
+            "default": "small",
+        }
+
+        assert service._apply_transformation(13, "conditional", config, FieldType.STRING) == "large"
+        assert service._apply_transformation("5", "conditional", config, FieldType.STRING) == "medium"
+        assert service._apply_transformation(1, "conditional", config, FieldType.STRING) == "small"
+
+
+class TestTypeConversion:
+    """Test cases for converting values to target field types."""
+
+    def test_convert_object_from_json_string(self, service):
+        """Test JSON strings are parsed for object fields."""
+        assert service._convert_to_type('{"team": "Frontend"}', FieldType.OBJECT) == {"team": "Frontend"}
+
+    def test_convert_object_invalid_json_passthrough(self, service):
+        """Test invalid JSON is returned unchanged for object fields."""
+        assert service._convert_to_type("{not json", FieldType.OBJECT) == "{not json"
+
+    def test_convert_boolean_from_string(self, service):
+        """Test boolean conversion of string values."""
+        assert service._convert_to_type("Yes", FieldType.BOOLEAN) is True
+        assert service._convert_to_type("on", FieldType.BOOLEAN) is True
+        assert service._convert_to_type("no", FieldType.BOOLEAN) is False
+        assert service._convert_to_type(0, FieldType.BOOLEAN) is False
+
+
+class TestBulkFieldMappingCreation:
+    """Test cases for batched field mapping creation."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_batches_inserts(self):
+        """Test mappings and version records are inserted in one batch each."""
+        db = Mock()
+        insert_result = Mock()
+        insert_result.scalars.return_value.all.return_value = [11, 12]
+        db.execute = AsyncMock(side_effect=[insert_result, Mock()])
+        db.commit = AsyncMock()
+        service = FieldMappingService(db)
+
+        mappings = [
+            FieldMappingCreate(name="Team", jira_field_id="customfield_1", target_field="team"),
+            FieldMappingCreate(name="Points", jira_field_id="customfield_2", target_field="points"),
+        ]
+        mapping_ids = await service.bulk_create_field_mappings(mappings, template_id=5)
+
+        assert mapping_ids == [11, 12]
+        assert db.execute.await_count == 2
+        mapping_rows = db.execute.await_args_list[0].args[1]
+        assert [row["template_id"] for row in mapping_rows] == [5, 5]
+        version_rows = db.execute.await_args_list[1].args[1]
+        assert [row["mapping_id"] for row in version_rows] == [11, 12]
+        insert_statement = db.execute.await_args_list[0].args[0]
+        assert insert_statement._sort_by_parameter_order
+        # Each version row carries the config of the mapping it is linked to
+        assert [(row["mapping_id"], row["new_config"]["name"]) for row in version_rows] == [
+            (11, "Team"), (12, "Points")
+        ]
+        # Version configs are JSON-ready, with enums stored as their values
+        assert [row["new_config"]["field_type"] for row in version_rows] == ["string", "string"]
+        assert type(version_rows[0]["new_config"]["field_type"]) is str
+        version_numbers = [row["version_number"] for row in version_rows]
+        assert len(set(version_numbers)) == 2
+        assert all(len(number) <= 20 for number in version_numbers)
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_without_commit(self):
+        """Test the caller's transaction is left open when commit is False."""
+        db = Mock()
+        insert_result = Mock()
+        insert_result.scalars.return_value.all.return_value = [1]
+        db.execute = AsyncMock(side_effect=[insert_result, Mock()])
+        db.commit = AsyncMock()
+        service = FieldMappingService(db)
+
+        mappings = [FieldMappingCreate(name="Team", jira_field_id="customfield_1", target_field="team")]
+        await service.bulk_create_field_mappings(mappings, commit=False)
+
+        db.commit.assert_not_awaited()
+
+
+class TestJiraFieldExtraction:
+    """Test cases for extracting values from JIRA issue data."""
+
+    def test_extract_nested_field(self, service):
+        """Test values under fields take precedence over top-level keys."""
+        jira_data = {"key": "PROJ-1", "fields": {"summary": "Nested", "customfield_1": None}}
+
+        assert service._extract_jira_field_value(jira_data, "summary") == "Nested"
+        assert service._extract_jira_field_value(jira_data, "customfield_1") is None
+
+    def test_extract_top_level_field(self, service):
+        """Test fallback to top-level keys and missing fields."""
+        jira_data = {"key": "PROJ-1", "fields": {"summary": "Nested"}}
+
+        assert service._extract_jira_field_value(jira_data, "key") == "PROJ-1"
+        assert service._extract_jira_field_value(jira_data, "missing") is None
+        assert service._extract_jira_field_value({"key": "PROJ-2"}, "key") == "PROJ-2"
+
+
+class TestApplyFieldMappings:
+    """Test cases for applying field mappings to JIRA data."""
+
+    @staticmethod
+    def _mapping(**overrides):
+        """Build a mapping stand-in with the attributes the service reads."""
+        values = {
+            "name": "Mapping",
+            "jira_field_id": "customfield_1",
+            "target_field": "target",
+            "field_type": FieldType.STRING,
+            "mapping_type": MappingType.DIRECT,
+            "transformation_config": None,
+            "validation_rules": None,
+            "default_value": None,
+            "is_required": False,
+        }
+        values.update(overrides)
+        return Mock(**values)
+
+    @pytest.mark.asyncio
+    async def test_apply_transformation_validation_and_defaults(self, service):
+        """Test transformations, validation fallbacks and defaults are applied."""
+        mappings = [
+            self._mapping(
+                jira_field_id="customfield_team",
+                target_field="team",
+                mapping_type=MappingType.TRANSFORMATION,
+                transformation_config={"type": "extract_object_value"},
+            ),
+            self._mapping(
+                jira_field_id="customfield_points",
+                target_field="story_points",
+                field_type=FieldType.INTEGER,
+                mapping_type=MappingType.TRANSFORMATION,
+                transformation_config={"type": "numeric_conversion"},
+                validation_rules={"max_value": 100},
+                default_value="0",
+            ),
+            self._mapping(jira_field_id="customfield_missing", target_field="missing"),
+            self._mapping(jira_field_id="key", target_field="issue_key"),
+            self._mapping(
+                jira_field_id="customfield_empty",
+                target_field="priority",
+                default_value="Medium",
+            ),
+        ]
+        service.get_active_mappings = AsyncMock(return_value=mappings)
+        jira_data = {
+            "key": "PROJ-1",
+            "fields": {
+                "customfield_team": {"value": "Frontend"},
+                "customfield_points": "250",
+            },
+        }
+
+        result = await service.apply_field_mappings(jira_data, template_id=1)
+
+        assert result == {
+            "team": "Frontend",
+            "story_points": "0",
+            "issue_key": "PROJ-1",
+            "priority": "Medium",
+        }
+
+    @pytest.mark.asyncio
+    async def test_mapping_plan_is_compiled_once_per_template(self, service):
+        """Test mappings are loaded and compiled once and reused across issues."""
+        mappings = [self._mapping(jira_field_id="summary", target_field="title")]
+        service.get_active_mappings = AsyncMock(return_value=mappings)
+
+        first = await service.apply_field_mappings({"fields": {"summary": "One"}}, template_id=1)
+        second = await service.apply_field_mappings({"fields": {"summary": "Two"}}, template_id=1)
+
+        assert first == {"title": "One"}
+        assert second == {"title": "Two"}
+        service.get_active_mappings.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_conditional_mapping_uses_compiled_conditions(self, service):
+        """Test conditional mappings match the uncompiled transformation."""
+        config = {
+            "type": "conditional",
+            "conditions": [
+                {"operator": "equals", "value": "Blocker", "result": "critical"},
+                {"operator": "greater_than", "value": "not-a-number", "result": "never"},
+            ],
+        }
+        mappings = [
+            self._mapping(
+                jira_field_id="priority",
+                target_field="severity",
+                mapping_type=MappingType.TRANSFORMATION,
+                transformation_config=config,
+            )
+        ]
+        service.get_active_mappings = AsyncMock(return_value=mappings)
+
+        blocker = await service.apply_field_mappings({"fields": {"priority": "Blocker"}})
+        minor = await service.apply_field_mappings({"fields": {"priority": "Minor"}})
+
+        assert blocker == {"severity": "critical"}
+        # The failing numeric comparison keeps the original value
+        assert minor == {"severity": "Minor"}
+
+
+class TestFieldMappingUpdate:
+    """Test cases for updating field mappings."""
+
+    @pytest.mark.asyncio
+    async def test_update_skips_template_refresh(self):
+        """Test the template is not reloaded when the update leaves it unchanged."""
+        db = Mock()
+        db.commit = AsyncMock()
+        db.refresh = AsyncMock()
+        service = FieldMappingService(db)
+        mapping = Mock(field_type=FieldType.STRING, mapping_type=MappingType.DIRECT)
+        service.get_field_mapping = AsyncMock(return_value=mapping)
+        service._create_version_record = AsyncMock()
+
+        result = await service.update_field_mapping(1, FieldMappingUpdate(name="Renamed"))
+
+        assert result is mapping
+        assert mapping.name == "Renamed"
+        db.commit.assert_awaited_once()
+        db.refresh.assert_not_awaited()
+
+
+class TestApplyFieldMappingsBatch:
+    """Test cases for applying field mappings to batches of issues."""
+
+    @pytest.mark.asyncio
+    async def test_batch_loads_mappings_once(self, service):
+        """Test a batch is mapped with a single mapping lookup."""
+        mapping = TestApplyFieldMappings._mapping(jira_field_id="summary", target_field="title")
+        service.get_active_mappings = AsyncMock(return_value=[mapping])
+        issues = ({"fields": {"summary": f"Issue {i}"}} for i in range(3))
+
+        results = await service.apply_field_mappings_batch(issues, template_id=2)
+
+        assert results == [{"title": "Issue 0"}, {"title": "Issue 1"}, {"title": "Issue 2"}]
+        service.get_active_mappings.assert_awaited_once_with(2)
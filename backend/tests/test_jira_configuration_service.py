@@ -0,0 +1,542 @@
+"""
+Tests for JIRA configuration service.
+"""
+
+import asyncio
+from dataclasses import asdict
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+import os
+
+# Mock settings before importing
+os.environ.update({
+    'SECRET_KEY': 'test-secret-key-for-testing-only',
+    'ENCRYPTION_KEY': 'test-encryption-key-for-testing-only-32-bytes',
+    'POSTGRES_SERVER': 'localhost',
+    'POSTGRES_USER': 'test',
+    'POSTGRES_PASSWORD': 'test',
+    'POSTGRES_DB': 'test'
+})
+
+from sqlalchemy.dialects import postgresql
+
+from app.enums import ConnectionStatus
+from app.schemas.jira import JiraConfigurationMonitoringResponse
+from app.services import jira_configuration_service as config_module
+from app.services.jira_configuration_service import JiraConfigurationService
+
+
+def _stored_config(**overrides):
+    """Build a stored configuration stand-in with the attributes the service reads."""
+    values = {
+        "id": 1,
+        "url": "https://company.atlassian.net",
+        "auth_method": "token",
+        "instance_type": "cloud",
+        "email": "user@example.com",
+        "username": None,
+        "api_token": "token123",
+        "_api_token": "encrypted-token",
+        "password": None,
+        "_password": None,
+        "oauth_config": None,
+        "_oauth_config": None,
+    }
+    values.update(overrides)
+    name = values.pop("name", "Configuration")
+    config = Mock(**values)
+    config.name = name
+    config.is_cloud_instance.return_value = True
+    return config
+
+
+@pytest.fixture
+def service():
+    """Configuration service with a mocked database session."""
+    db = Mock()
+    db.commit = AsyncMock()
+    return JiraConfigurationService(db)
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Keep the module-level caches isolated between tests."""
+    caches = (
+        config_module._client_cache,
+        config_module._default_config_cache,
+        config_module._default_config_versions,
+        config_module._shared_transports,
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+async def _async_iter(items):
+    """Yield items from an async iterator."""
+    for item in items:
+        yield item
+
+
+def _cached(config_id):
+    """Cache entry of a configuration for the running event loop."""
+    return config_module._client_cache[(asyncio.get_running_loop(), config_id)]
+
+
+def _mock_client():
+    """Build a JIRA API client stand-in."""
+    client = Mock(is_cloud=True, preferred_api_version="3")
+    client.test_connection = AsyncMock(return_value=True)
+    client.close = AsyncMock()
+    return client
+
+
+class TestConnectionTestClientCache:
+    """Test cases for reusing API clients across connection tests."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_for_unchanged_configuration(self, service):
+        """Test repeated tests of a configuration share one open client."""
+        service.get_configuration = AsyncMock(return_value=_stored_config())
+
+        with patch.object(config_module, "JiraAPIClient", side_effect=lambda **kwargs: _mock_client()) as client_cls:
+            first = await service.test_configuration_connection(1, update_status=False)
+            second = await service.test_configuration_connection(1, update_status=False)
+
+        assert first.connection_valid and second.connection_valid
+        assert client_cls.call_count == 1
+        _cached(1)[2].close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_changed_credentials_replace_client(self, service):
+        """Test a new client is built and the old one closed when credentials change."""
+        service.get_configuration = AsyncMock(side_effect=[
+            _stored_config(),
+            _stored_config(_api_token="rotated-token", api_token="rotated"),
+        ])
+
+        with patch.object(config_module, "JiraAPIClient", side_effect=lambda **kwargs: _mock_client()) as client_cls:
+            await service.test_configuration_connection(1, update_status=False)
+            old_client = _cached(1)[2]
+            await service.test_configuration_connection(1, update_status=False)
+
+        assert client_cls.call_count == 2
+        old_client.close.assert_awaited_once()
+        assert _cached(1)[1].api_token == "rotated"
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_cached_clients(self, service):
+        """Test shutdown closes and clears all cached clients."""
+        service.get_configuration = AsyncMock(return_value=_stored_config())
+
+        with patch.object(config_module, "JiraAPIClient", side_effect=lambda **kwargs: _mock_client()):
+            await service.test_configuration_connection(1, update_status=False)
+        client = _cached(1)[2]
+
+        await JiraConfigurationService.aclose()
+
+        client.close.assert_awaited_once()
+        assert config_module._client_cache == {}
+
+
+class TestSharedTransport:
+    """Test cases for sharing one connection pool across API clients."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_transport(self, service):
+        """Test built clients reuse one transport that outlives each client."""
+        from app.schemas.jira import JiraConnectionConfig
+
+        config = JiraConnectionConfig(
+            url="https://jira.company.com",
+            auth_method="token",
+            api_token="token123",
+            is_cloud=False
+        )
+        first = service._build_client(config)
+        second = service._build_client(config)
+        transport = config_module._shared_transports[asyncio.get_running_loop()]
+
+        assert first.client._transport is transport
+        assert second.client._transport is transport
+
+        await first.close()
+        assert not first.client.is_closed
+
+        with patch.object(transport, "aclose", new=AsyncMock()) as transport_close:
+            await JiraConfigurationService.aclose()
+
+        transport_close.assert_awaited_once()
+        assert config_module._shared_transports == {}
+
+    @pytest.mark.asyncio
+    async def test_closed_loop_entries_are_dropped(self, service):
+        """Test clients and transports of a closed event loop are never reused."""
+        closed_loop = asyncio.new_event_loop()
+        closed_loop.close()
+        stale_client = _mock_client()
+        stale_transport = Mock()
+        config_module._client_cache[(closed_loop, 1)] = (None, None, stale_client)
+        config_module._shared_transports[closed_loop] = stale_transport
+        service.get_configuration = AsyncMock(return_value=_stored_config())
+
+        with patch.object(config_module, "JiraAPIClient", side_effect=lambda **kwargs: _mock_client()) as client_cls:
+            await service.test_configuration_connection(1, update_status=False)
+
+        assert client_cls.call_count == 1
+        assert _cached(1)[2] is not stale_client
+        assert closed_loop not in config_module._shared_transports
+
+        await JiraConfigurationService.aclose()
+
+        stale_client.close.assert_not_awaited()
+        assert config_module._client_cache == {}
+
+
+class TestMonitorConfigurations:
+    """Test cases for configuration monitoring."""
+
+    @staticmethod
+    def _monitored_config(config_id, status, healthy):
+        """Build a monitored configuration stand-in."""
+        config = _stored_config(id=config_id, name=f"Config {config_id}", status=status)
+        config.is_healthy.return_value = healthy
+        return config
+
+    @pytest.mark.asyncio
+    async def test_summary_uses_aggregate_counts(self, service):
+        """Test the summary comes from the aggregate query without loading rows."""
+        service.get_configurations = AsyncMock()
+        service._aggregate_health = AsyncMock(return_value=(4, 2, 1))
+
+        result = await service.monitor_configurations("production")
+
+        assert result.total_configurations == 4
+        assert result.healthy_count == 2
+        assert result.error_count == 1
+        assert result.inactive_count == 1
+        assert result.health_percentage == 50
+        assert result.configurations == []
+        service.get_configurations.assert_not_awaited()
+        service._aggregate_health.assert_awaited_once_with("production")
+        service.db.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_details_built_from_column_rows(self, service):
+        """Test per-configuration entries are built from streamed column tuples."""
+        def row(config_id, name, status, consecutive_errors, avg_response_time_ms=None):
+            values = Mock(
+                id=config_id, url=f"https://{name.lower()}.atlassian.net", status=status,
+                last_tested_at=None, consecutive_errors=consecutive_errors,
+                avg_response_time_ms=avg_response_time_ms
+            )
+            values.name = name
+            return values
+
+        rows = [
+            row(1, "One", ConnectionStatus.ACTIVE, 0, 120),
+            row(2, "Two", ConnectionStatus.ACTIVE, 2),
+            row(3, "Three", ConnectionStatus.ERROR, 0),
+        ]
+        service.get_configurations = AsyncMock()
+        service.db.stream = AsyncMock(return_value=_async_iter(rows))
+        service._aggregate_health = AsyncMock(return_value=(3, 1, 1))
+
+        result = await service.monitor_configurations(include_details=True)
+
+        service.get_configurations.assert_not_awaited()
+        service.db.stream.assert_awaited_once()
+        assert [entry.id for entry in result.configurations] == [1, 2, 3]
+        assert [entry.is_healthy for entry in result.configurations] == [True, False, False]
+        assert [entry.status for entry in result.configurations] == ["active", "active", "error"]
+        assert result.configurations[0].name == "One"
+        assert result.configurations[0].avg_response_time_ms == 120
+
+        response = JiraConfigurationMonitoringResponse(**asdict(result))
+        assert response.configurations[1]["consecutive_errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_summary(self, service):
+        """Test an environment without configurations reports zero health."""
+        service._aggregate_health = AsyncMock(return_value=(0, 0, 0))
+
+        result = await service.monitor_configurations("staging")
+
+        assert result.health_percentage == 0
+        assert result.inactive_count == 0
+
+    @pytest.mark.asyncio
+    async def test_connection_tests_run_concurrently(self, service):
+        """Test re-testing overlaps connection tests and records every result."""
+        configs = [self._monitored_config(i, ConnectionStatus.ACTIVE, True) for i in range(3)]
+        service.get_configurations = AsyncMock(return_value=configs)
+        service._aggregate_health = AsyncMock(return_value=(3, 3, 0))
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_test(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(connection_valid=True, total_time_ms=12.0, errors=[])
+
+        service._test_configuration_connection = slow_test
+        with patch.object(config_module, "JiraAPIClient", side_effect=lambda **kwargs: _mock_client()):
+            await service.monitor_configurations(test_connections=True)
+
+        assert max_in_flight == 3
+        for config in configs:
+            config.record_successful_test.assert_called_once_with(12)
+        service.db.commit.assert_awaited_once()
+
+
+class TestConfigurationCounts:
+    """Test cases for single-query configuration counts."""
+
+    @pytest.mark.asyncio
+    async def test_page_includes_window_total(self, service):
+        """Test a page of configurations carries the total match count."""
+        first, second = _stored_config(id=1), _stored_config(id=2)
+        result = Mock()
+        result.all.return_value = [(first, 7), (second, 7)]
+        service.db.execute = AsyncMock(return_value=result)
+
+        configurations, total = await service.get_configurations_page(limit=2)
+
+        assert configurations == [first, second]
+        assert total == 7
+        service.db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_page_total(self, service):
+        """Test an empty page reports no matches."""
+        result = Mock()
+        result.all.return_value = []
+        service.db.execute = AsyncMock(return_value=result)
+
+        assert await service.get_configurations_page(offset=50) == ([], 0)
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_configurations_in_batches(self, service):
+        """Test streamed configurations come from a batched server-side cursor."""
+        configs = [_stored_config(id=1), _stored_config(id=2)]
+        service.db.stream_scalars = AsyncMock(return_value=_async_iter(configs))
+
+        streamed = [config async for config in service.get_configurations_stream(is_active=True)]
+
+        assert streamed == configs
+        query = service.db.stream_scalars.await_args.args[0]
+        assert query.get_execution_options()["yield_per"] == config_module.CONFIGURATION_STREAM_BATCH_SIZE
+
+    @pytest.mark.asyncio
+    async def test_active_and_default_counts_in_one_query(self, service):
+        """Test active and default counts come back from a single round-trip."""
+        result = Mock()
+        result.one.return_value = (3, 1)
+        service.db.execute = AsyncMock(return_value=result)
+
+        assert await service._count_active_and_defaults("production") == (3, 1)
+        service.db.execute.assert_awaited_once()
+
+
+class TestCreateConfiguration:
+    """Test cases for creating configurations."""
+
+    @pytest.mark.asyncio
+    async def test_connection_test_overlaps_default_check(self, service):
+        """Test the connection test and default-check query run concurrently."""
+        from app.schemas.jira import JiraConnectionConfig
+
+        events = []
+
+        async def connection_test(config):
+            events.append("test started")
+            await asyncio.sleep(0.01)
+            events.append("test finished")
+            return Mock(connection_valid=True, errors=[])
+
+        async def count_defaults(environment):
+            events.append("count started")
+            await asyncio.sleep(0.01)
+            events.append("count finished")
+            return 0, 0
+
+        service._test_configuration_connection = connection_test
+        service._count_active_and_defaults = count_defaults
+        service.db.add = Mock()
+        config = JiraConnectionConfig(
+            url="https://jira.company.com", auth_method="token", api_token="token123", is_cloud=False
+        )
+
+        with patch.object(config_module, "JiraConfiguration") as model:
+            created = await service.create_configuration(config, name="Primary")
+
+        assert events[:2] == ["test started", "count started"]
+        assert created is model.return_value
+        assert created.is_default is True
+        service.db.commit.assert_awaited_once()
+
+
+class TestDefaultPromotion:
+    """Test cases for changing the default configuration."""
+
+    @pytest.mark.asyncio
+    async def test_update_promotes_default_in_one_statement(self, service):
+        """Test promoting a default leaves the flag to the single promotion UPDATE."""
+        config = _stored_config(id=4, environment="production", is_default=False)
+        service.get_configuration = AsyncMock(return_value=config)
+        service.db.execute = AsyncMock()
+        service.db.refresh = AsyncMock()
+
+        result = await service.update_configuration(
+            4, {"is_default": True, "name": "Primary"}, test_connection=False
+        )
+
+        assert result is config
+        assert config.name == "Primary"
+        assert config.is_default is False
+        service.db.execute.assert_awaited_once()
+        statement = service.db.execute.await_args.args[0]
+        assert statement.is_dml
+        assert "is_default" in str(statement)
+        service.db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_promote_default_locks_rows_in_id_order(self, service):
+        """Test the promotion UPDATE targets the environment's default rows locked in id order."""
+        service.db.execute = AsyncMock()
+
+        await service._promote_default("production", 4)
+
+        service.db.execute.assert_awaited_once()
+        statement = service.db.execute.await_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        assert sql.startswith("UPDATE jira_configurations SET is_default=(jira_configurations.id = 4)")
+        assert "WHERE jira_configurations.id IN (SELECT jira_configurations.id" in sql
+        assert "environment = 'production'" in sql
+        assert "is_default = true OR jira_configurations.id = 4" in sql
+        assert sql.rstrip().endswith("ORDER BY jira_configurations.id ASC FOR UPDATE)")
+
+
+class TestInPlaceUpdate:
+    """Test cases for updating plain columns without loading the configuration."""
+
+    @pytest.mark.asyncio
+    async def test_plain_fields_updated_with_returning(self, service):
+        """Test plain column updates skip the SELECT and return the updated row."""
+        config = _stored_config(id=4, environment="production")
+        result = Mock()
+        result.scalar_one_or_none.return_value = config
+        service.db.execute = AsyncMock(return_value=result)
+        service.get_configuration = AsyncMock()
+        service._promote_default = AsyncMock()
+
+        updated = await service.update_configuration(4, {"description": "Primary", "is_default": True})
+
+        assert updated is config
+        service.get_configuration.assert_not_awaited()
+        service.db.execute.assert_awaited_once()
+        service._promote_default.assert_awaited_once_with("production", 4)
+        service.db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_configuration_returns_none(self, service):
+        """Test an in-place update of an unknown configuration returns None."""
+        result = Mock()
+        result.scalar_one_or_none.return_value = None
+        service.db.execute = AsyncMock(return_value=result)
+        service.db.rollback = AsyncMock()
+
+        assert await service.update_configuration(99, {"description": "Gone"}) is None
+        service.db.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_validated_fields_use_orm_path(self, service):
+        """Test fields with validators or encryption still load the configuration."""
+        config = _stored_config(id=4, environment="production")
+        service.get_configuration = AsyncMock(return_value=config)
+
+        await service.update_configuration(4, {"name": "Renamed", "description": "x"}, test_connection=False)
+
+        service.get_configuration.assert_awaited_once_with(4)
+        assert config.name == "Renamed"
+
+
+class TestDefaultConfigurationCache:
+    """Test cases for caching the default configuration per environment."""
+
+    @staticmethod
+    def _default_result(config):
+        """Build a query result returning the given default configuration."""
+        result = Mock()
+        result.scalar_one_or_none.return_value = config
+        return result
+
+    @pytest.mark.asyncio
+    async def test_cached_default_served_without_query(self, service):
+        """Test repeat lookups merge the cached snapshot instead of querying."""
+        config = _stored_config(id=2)
+        snapshot = Mock()
+        merged = Mock()
+        service.db.execute = AsyncMock(return_value=self._default_result(config))
+        service.db.merge = AsyncMock(return_value=merged)
+        service._detached_copy = Mock(return_value=snapshot)
+
+        first = await service.get_default_configuration("production")
+        second = await service.get_default_configuration("production")
+
+        assert first is config
+        assert second is merged
+        service.db.execute.assert_awaited_once()
+        service.db.merge.assert_awaited_once_with(snapshot, load=False)
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cached_default(self, service):
+        """Test a write to the environment forces the next lookup to query."""
+        service.db.execute = AsyncMock(return_value=self._default_result(None))
+
+        assert await service.get_default_configuration("production") is None
+        assert await service.get_default_configuration("production") is None
+        service._invalidate_default_configuration("production")
+        await service.get_default_configuration("production")
+        await service.get_default_configuration("staging")
+
+        assert service.db.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_default_is_reloaded(self, service):
+        """Test entries past their time-to-live are re-queried."""
+        service.db.execute = AsyncMock(return_value=self._default_result(None))
+
+        with patch.object(config_module.time, "monotonic", side_effect=[0, 1000, 1000]):
+            await service.get_default_configuration("production")
+            await service.get_default_configuration("production")
+
+        assert service.db.execute.await_count == 2
+
+
+class TestConnectionTestRequirement:
+    """Test cases for deciding whether an update needs a connection test."""
+
+    def test_credential_and_url_changes_require_test(self, service):
+        """Test only connection-related fields trigger a connection test."""
+        assert service._requires_connection_test({"url": "https://x.atlassian.net"}) is True
+        assert service._requires_connection_test({"name": "x", "password": "secret"}) is True
+        assert service._requires_connection_test({"name": "x", "description": "y"}) is False
+        assert service._requires_connection_test({}) is False
+
+
+class TestInstanceTypeDetection:
+    """Test cases for detecting JIRA Cloud instances."""
+
+    def test_detect_cloud_and_server_urls(self, service):
+        """Test Atlassian Cloud hosts are detected regardless of case or port."""
+        assert service._detect_instance_type("https://company.atlassian.net") is True
+        assert service._detect_instance_type("https://Company.Atlassian.NET:443/jira") is True
+        assert service._detect_instance_type("https://jira.company.com") is False
+        assert service._detect_instance_type("https://atlassian.net.evil.com") is False
+        assert service._detect_instance_type("not a url") is False
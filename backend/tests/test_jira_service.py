@@ -3,9 +3,12 @@ Tests for JIRA API client and service.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock, call, patch
+import asyncio
 import httpx
+import json
 import os
+import time
 
 # Mock settings before importing
 os.environ.update({
@@ -22,10 +25,30 @@ os.environ.update({
     'JIRA_WEBHOOK_SECRET': 'test-webhook-secret'
 })
 
-from app.services.jira_service import JiraAPIClient, JiraService
+from app.services import jira_service
+from app.services.field_mapping_service import FieldMappingService
+from app.services.jira_service import (
+    LARGE_RESPONSE_BYTES, JiraAPIClient, JiraFieldMappingService, JiraService, JiraSyncService,
+    MetaBoardService, invalidate_cache
+)
 from app.core.exceptions import ExternalServiceError, RateLimitError
 
 
+@pytest.fixture(autouse=True)
+def clear_jira_caches():
+    """Keep the module-level caches, shared HTTP clients and rate limiters isolated between tests."""
+    caches = (
+        jira_service._RESPONSE_CACHE,
+        jira_service._RATE_LIMITERS,
+        JiraAPIClient._CLIENT_CACHE,
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
 class TestJiraAPIClient:
     """Test cases for JiraAPIClient."""
     
@@ -53,6 +76,29 @@ class TestJiraAPIClient:
         assert client.email == "test@example.com"
         assert client.api_token == "token123"
         assert client.preferred_api_version == "3"
+        assert client._ep["search"] == "/rest/api/3/search"
+        assert client.client.headers["Authorization"].startswith("Basic ")
+    
+    def test_atlassian_client_created_lazily(self):
+        """Test the Atlassian fallback client is only built on first access."""
+        with patch('atlassian.Jira') as mock_atlassian:
+            client = JiraAPIClient(
+                "https://jira.company.com",
+                auth_method="basic",
+                username="testuser",
+                password="testpass"
+            )
+            mock_atlassian.assert_not_called()
+            
+            assert client.atlassian_client is mock_atlassian.return_value
+            assert client.atlassian_client is mock_atlassian.return_value
+        
+        mock_atlassian.assert_called_once_with(
+            url="https://jira.company.com",
+            username="testuser",
+            password="testpass",
+            cloud=False
+        )
     
     def test_init_with_basic_auth_server(self):
         """Test initialization with basic authentication for server."""
@@ -71,22 +117,114 @@ class TestJiraAPIClient:
     
     @pytest.mark.asyncio
     async def test_rate_limiting(self):
-        """Test rate limiting functionality."""
+        """Test rate limiting functionality: requests beyond the burst wait for a token."""
+        clock = [100.0]
+        
+        async def advance(seconds):
+            # Sleep in short steps so the bucket has to check again
+            clock[0] += 0.2
+        
+        with patch('app.services.jira_service.time.monotonic', side_effect=lambda: clock[0]), \
+                patch('asyncio.sleep', side_effect=advance) as mock_sleep:
+            bucket = jira_service.AsyncTokenBucket(rate=4, burst=2)
+            
+            # The burst is served immediately
+            assert bucket.try_acquire()
+            await bucket.acquire()
+            mock_sleep.assert_not_called()
+            assert not bucket.try_acquire()
+            
+            # The next request only proceeds once a whole token is available
+            await bucket.acquire()
+            assert clock[0] == pytest.approx(100.4)
+            assert mock_sleep.await_count == 2
+            
+            # Tokens refill with elapsed time, capped at the burst size
+            clock[0] = 110.0
+            bucket._refill()
+        assert bucket._tokens == 2
+    
+    @pytest.mark.asyncio
+    async def test_rate_limiter_shared_per_instance_url(self):
+        """Test clients of one JIRA instance draw from the same token bucket."""
+        first = JiraAPIClient("https://company.atlassian.net", email="a@example.com", api_token="t1")
+        second = JiraAPIClient("https://company.atlassian.net", email="b@example.com", api_token="t2")
+        other = JiraAPIClient("https://other.atlassian.net", email="a@example.com", api_token="t1")
+        
+        assert first._rate_limiter is second._rate_limiter
+        assert other._rate_limiter is not first._rate_limiter
+        assert first._rate_limiter.burst == jira_service.RATE_LIMIT_BURST
+    
+    @pytest.mark.asyncio
+    async def test_each_request_attempt_takes_a_token(self):
+        """Test retries are paced like first attempts."""
         client = JiraAPIClient("https://jira.example.com")
-        client._rate_limit_max_calls = 2
-        client._rate_limit_window = 1
+        client.client = AsyncMock()
+        client.client.request = AsyncMock(side_effect=[Mock(status_code=502, headers={}), Mock(status_code=200)])
+        limiter = Mock(try_acquire=Mock(return_value=False), acquire=AsyncMock())
+        
+        with patch.object(JiraAPIClient, "_rate_limiter", limiter), patch('asyncio.sleep'):
+            await client._make_request_with_retry("GET", "/test")
         
-        # First two calls should pass
-        await client._check_rate_limit()
-        await client._check_rate_limit()
+        assert limiter.acquire.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_http_client_shared_per_credentials(self):
+        """Test clients with the same credentials reuse one HTTP client."""
+        JiraAPIClient._CLIENT_CACHE.clear()
+        first = JiraAPIClient("https://company.atlassian.net", email="a@example.com", api_token="t1")
+        second = JiraAPIClient("https://company.atlassian.net", email="a@example.com", api_token="t1")
+        other = JiraAPIClient("https://company.atlassian.net", email="a@example.com", api_token="t2")
         
-        # Third call should trigger rate limiting (but we won't wait)
-        start_time = client._rate_limit_window_start
-        client._rate_limit_calls = client._rate_limit_max_calls
+        assert first.client is second.client
+        assert other.client is not first.client
         
-        # Mock time to avoid actual waiting
-        with patch('asyncio.sleep'):
-            await client._check_rate_limit()
+        # Closing one API client leaves the shared HTTP client usable
+        await first.close()
+        assert second.client.is_closed is False
+        
+        await JiraAPIClient.aclose_all()
+        assert first.client.is_closed and other.client.is_closed
+        assert JiraAPIClient._CLIENT_CACHE == {}
+        
+        # A closed client is replaced rather than reused
+        third = JiraAPIClient("https://company.atlassian.net", email="a@example.com", api_token="t1")
+        assert third.client.is_closed is False
+        await JiraAPIClient.aclose_all()
+    
+    def test_http_client_not_shared_across_event_loops(self):
+        """Test each event loop gets its own HTTP client and closed loops are dropped."""
+        JiraAPIClient._CLIENT_CACHE.clear()
+        
+        async def build():
+            return JiraAPIClient("https://company.atlassian.net", email="a@example.com", api_token="t1").client
+        
+        first = asyncio.run(build())
+        second = asyncio.run(build())
+        
+        assert first is not second
+        assert list(JiraAPIClient._CLIENT_CACHE.values()) == [second]
+        assert all("t1" not in str(part) for part in next(iter(JiraAPIClient._CLIENT_CACHE)))
+        JiraAPIClient._CLIENT_CACHE.clear()
+    
+    @pytest.mark.asyncio
+    async def test_http_client_cache_evicts_least_recently_used(self):
+        """Test the client cache is bounded and evicted clients are closed by their owners."""
+        JiraAPIClient._CLIENT_CACHE.clear()
+        with patch.object(JiraAPIClient, "_CLIENT_CACHE_MAXSIZE", 2):
+            clients = [
+                JiraAPIClient("https://company.atlassian.net", email="a@example.com", api_token=token)
+                for token in ("t1", "t2", "t3")
+            ]
+        
+        assert len(JiraAPIClient._CLIENT_CACHE) == 2
+        assert clients[0].client not in JiraAPIClient._CLIENT_CACHE.values()
+        
+        await clients[0].close()
+        await clients[1].close()
+        assert clients[0].client.is_closed
+        assert clients[1].client.is_closed is False
+        await JiraAPIClient.aclose_all()
     
     @pytest.mark.asyncio
     async def test_make_request_with_retry_success(self):
@@ -128,6 +266,108 @@ class TestJiraAPIClient:
         assert response.status_code == 200
         assert client.client.request.call_count == 2
     
+    def test_backoff_is_jittered_and_capped(self):
+        """Test retry waits are drawn below the exponential bound and capped."""
+        client = JiraAPIClient("https://jira.example.com")
+        
+        with patch('app.services.jira_service.random.uniform', side_effect=lambda a, b: b) as mock_uniform:
+            assert client._sleep_for(2, 1.0) == 4.0
+            assert client._sleep_for(10, 1.0) == client._max_backoff
+        
+        mock_uniform.assert_any_call(0, 4.0)
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds and HTTP dates."""
+        assert JiraAPIClient._parse_retry_after("5") == 5.0
+        assert JiraAPIClient._parse_retry_after(None) is None
+        assert JiraAPIClient._parse_retry_after("soon") is None
+        assert JiraAPIClient._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_make_request_with_retry_honors_retry_after_on_503(self):
+        """Test 503 responses wait for the server-provided Retry-After."""
+        client = JiraAPIClient("https://jira.example.com")
+        
+        unavailable_response = Mock()
+        unavailable_response.status_code = 503
+        unavailable_response.headers = {"Retry-After": "7"}
+        
+        success_response = Mock()
+        success_response.status_code = 200
+        
+        client.client = AsyncMock()
+        client.client.request = AsyncMock(side_effect=[unavailable_response, success_response])
+        
+        with patch('asyncio.sleep') as mock_sleep:
+            response = await client._make_request_with_retry("GET", "/test")
+        
+        assert response.status_code == 200
+        mock_sleep.assert_awaited_once_with(7.0)
+    
+    @pytest.mark.asyncio
+    async def test_get_decodes_json_body(self):
+        """Test GET responses decode to the same structure as response.json()."""
+        client = JiraAPIClient("https://jira.example.com")
+        response = httpx.Response(200, content='{"issues": [{"key": "PROJ-1", "summary": "Café"}]}'.encode())
+        client._make_request_with_retry = AsyncMock(return_value=response)
+        
+        result = await client.get("/rest/api/2/search")
+        
+        assert result == response.json()
+        assert result["issues"][0]["summary"] == "Café"
+    
+    @pytest.mark.asyncio
+    async def test_large_json_body_decoded_in_thread(self):
+        """Test large bodies are decoded in a worker thread."""
+        client = JiraAPIClient("https://jira.example.com")
+        body = json.dumps({"issues": [{"key": f"PROJ-{i}"} for i in range(20000)]}).encode()
+        response = httpx.Response(200, content=body)
+        client._make_request_with_retry = AsyncMock(return_value=response)
+        
+        with patch('app.services.jira_service.asyncio.to_thread', wraps=asyncio.to_thread) as mock_to_thread:
+            result = await client.get("/rest/api/2/search")
+        
+        assert len(body) > LARGE_RESPONSE_BYTES
+        assert len(result["issues"]) == 20000
+        mock_to_thread.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_many_preserves_order_and_bounds_concurrency(self):
+        """Test concurrent GETs return in call order without exceeding the pool size."""
+        client = JiraAPIClient("https://jira.example.com")
+        client._POOL_LIMIT = 2
+        in_flight = 0
+        peak = 0
+        
+        async def fake_get(endpoint, params=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"endpoint": endpoint, "params": params}
+        
+        client.get = AsyncMock(side_effect=fake_get)
+        
+        results = await client.get_many([("/a", None), ("/b", {"x": 1}), ("/c", None)])
+        
+        assert [r["endpoint"] for r in results] == ["/a", "/b", "/c"]
+        assert results[1]["params"] == {"x": 1}
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_post_sends_pre_encoded_json_body(self):
+        """Test json= bodies are sent as encoded content."""
+        client = JiraAPIClient("https://jira.example.com")
+        client._make_request_with_retry = AsyncMock(return_value=httpx.Response(201, content=b'{"id": "1"}'))
+        
+        result = await client.post("/rest/api/2/issue", json={"fields": {"customfield_1": 2.5}})
+        
+        assert result == {"id": "1"}
+        kwargs = client._make_request_with_retry.await_args.kwargs
+        assert "json" not in kwargs
+        assert json.loads(kwargs["content"]) == {"fields": {"customfield_1": 2.5}}
+    
     @pytest.mark.asyncio
     async def test_make_request_with_retry_auth_failure(self):
         """Test authentication failure handling."""
@@ -167,6 +407,535 @@ class TestJiraAPIClient:
         assert result is False
 
 
+class TestJiraMetadataCache:
+    """Test cases for cached JIRA metadata lookups."""
+    
+    @pytest.mark.asyncio
+    async def test_custom_fields_cached_until_invalidated(self):
+        """Test the field list is fetched once per instance until invalidated."""
+        client = JiraAPIClient("https://jira.example.com", auth_method="basic", username="u", password="p")
+        client.get = AsyncMock(return_value=[
+            {"id": "customfield_1", "name": "Team"},
+            {"id": "summary", "name": "Summary"},
+        ])
+        service = JiraFieldMappingService(client)
+        
+        first = await service.get_custom_fields()
+        second = await service.get_custom_fields()
+        
+        assert first == second == [{"id": "customfield_1", "name": "Team"}]
+        client.get.assert_awaited_once()
+        
+        invalidate_cache("https://jira.example.com/")
+        await service.get_custom_fields()
+        assert client.get.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_sprint_board_info_cached(self):
+        """Test a sprint's board is resolved with two requests once, then from cache."""
+        client = JiraAPIClient("https://jira.example.com")
+        client.get = AsyncMock(side_effect=[
+            {"originBoardId": 259},
+            {"name": "Meta", "type": "scrum", "location": {"projectKey": "WEB"}},
+        ])
+        service = MetaBoardService(client)
+        
+        first = await service._get_sprint_board_info(7)
+        second = await service._get_sprint_board_info(7)
+        
+        assert first == second == {
+            "board_id": 259, "board_name": "Meta", "board_type": "scrum", "project_key": "WEB"
+        }
+        assert client.get.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_listing_responses_cached_per_params(self):
+        """Test board listings are cached per parameters and issue listings are not."""
+        client = JiraAPIClient("https://jira.example.com")
+        client._make_request_with_retry = AsyncMock(
+            side_effect=lambda method, endpoint, **kwargs: httpx.Response(200, json={"values": [endpoint]})
+        )
+        
+        await client.get("/rest/agile/1.0/board", params={"startAt": 0})
+        await client.get("/rest/agile/1.0/board", params={"startAt": 0})
+        await client.get("/rest/agile/1.0/board", params={"startAt": 50})
+        await client.get("/rest/agile/1.0/sprint/7/issue")
+        await client.get("/rest/agile/1.0/sprint/7/issue")
+        
+        assert client._make_request_with_retry.await_count == 4
+    
+    @pytest.mark.asyncio
+    async def test_stale_listing_served_during_outage(self):
+        """Test an expired listing is served when JIRA fails, but auth errors still raise."""
+        client = JiraAPIClient("https://jira.example.com")
+        client._make_request_with_retry = AsyncMock(return_value=httpx.Response(200, json=[{"key": "WEB"}]))
+        endpoint = "/rest/api/2/project"
+        await client.get(endpoint)
+        
+        with patch('app.services.jira_service.time.monotonic', return_value=time.monotonic() + 120):
+            client._make_request_with_retry = AsyncMock(side_effect=ExternalServiceError("JIRA", "down"))
+            assert await client.get(endpoint) == [{"key": "WEB"}]
+            
+            client._make_request_with_retry = AsyncMock(
+                side_effect=ExternalServiceError("JIRA", "Authentication failed", 401)
+            )
+            with pytest.raises(ExternalServiceError):
+                await client.get(endpoint)
+        
+        # Listings older than the stale limit are not served
+        later = time.monotonic() + jira_service.STALE_RESPONSE_MAX_AGE + 1
+        with patch('app.services.jira_service.time.monotonic', return_value=later):
+            client._make_request_with_retry = AsyncMock(side_effect=ExternalServiceError("JIRA", "down"))
+            with pytest.raises(ExternalServiceError):
+                await client.get(endpoint)
+    
+    @pytest.mark.asyncio
+    async def test_cached_listing_isolated_from_callers(self):
+        """Test mutating a returned listing does not change the cached copy."""
+        client = JiraAPIClient("https://jira.example.com")
+        client._make_request_with_retry = AsyncMock(return_value=httpx.Response(200, json={"values": [1]}))
+        
+        first = await client.get("/rest/agile/1.0/board")
+        first["values"].append(2)
+        second = await client.get("/rest/agile/1.0/board")
+        second["values"].clear()
+        
+        assert await client.get("/rest/agile/1.0/board") == {"values": [1]}
+        client._make_request_with_retry.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_board_sprint_listing_not_cached(self):
+        """Test sprint listings are always fetched, so state changes are seen at once."""
+        client = JiraAPIClient("https://jira.example.com")
+        client._make_request_with_retry = AsyncMock(
+            side_effect=lambda method, endpoint, **kwargs: httpx.Response(200, json={"values": []})
+        )
+        
+        await client.get("/rest/agile/1.0/board/9/sprint")
+        await client.get("/rest/agile/1.0/board/9/sprint")
+        
+        assert client._make_request_with_retry.await_count == 2
+    
+    def test_cache_evicts_least_recently_used(self):
+        """Test the response cache stays bounded, evicting the stalest entry."""
+        with patch('app.services.jira_service._RESPONSE_CACHE_MAXSIZE', 2):
+            jira_service._cache_set(("url", "a"), 1)
+            jira_service._cache_set(("url", "b"), 2)
+            assert jira_service._cache_get(("url", "a"), 60) == 1
+            jira_service._cache_set(("url", "c"), 3)
+        
+        assert jira_service._cache_get(("url", "a"), 60) == 1
+        assert jira_service._cache_get(("url", "b"), 60) is None
+        assert jira_service._cache_get(("url", "c"), 60) == 3
+    
+    @pytest.mark.asyncio
+    async def test_server_info_reuses_connection_test(self):
+        """Test a connection test primes the server info cache."""
+        client = JiraAPIClient("https://jira.example.com")
+        client.get = AsyncMock(return_value={"version": "9.4.0"})
+        
+        assert await client.test_connection() is True
+        assert await client.get_server_info() == {"version": "9.4.0"}
+        client.get.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_server_info_returns_copies(self):
+        """Test mutating returned server info leaves the cached entry intact."""
+        client = JiraAPIClient("https://jira.example.com")
+        client.get = AsyncMock(return_value={"version": "9.4.0"})
+        
+        (await client.get_server_info())["version"] = "changed"
+        
+        assert await client.get_server_info() == {"version": "9.4.0"}
+        client.get.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_server_info_expires(self):
+        """Test cached server info is refetched after its TTL."""
+        client = JiraAPIClient("https://jira.example.com")
+        client.get = AsyncMock(return_value={"version": "9.4.0"})
+        
+        with patch('app.services.jira_service.time.monotonic', side_effect=[0, 10_000, 10_000]):
+            await client.get_server_info()
+            await client.get_server_info()
+        
+        assert client.get.await_count == 2
+
+
+class TestFieldSuggestions:
+    """Test cases for field mapping suggestions during discovery."""
+    
+    def test_suggest_target_field_keyword_priority(self):
+        """Test higher-priority keywords win regardless of position."""
+        service = JiraFieldMappingService(Mock())
+        
+        assert service._suggest_target_field("Team Story Points", "number", []) == "story_points"
+        assert service._suggest_target_field("Release Due Date", "date", []) == "due_date"
+        # Overlapping keywords are still detected
+        assert service._suggest_target_field("Estimateam", "string", []) == "discipline_team"
+        assert service._suggest_target_field("Sprint-Goal Text", "string", []) == "sprint_goal_text"
+    
+    @pytest.mark.asyncio
+    async def test_discover_field_mappings_counts_populated_fields(self):
+        """Test usage counts and samples come from the first five issues only."""
+        service = JiraFieldMappingService(Mock())
+        service.get_custom_fields = AsyncMock(return_value=[
+            {"id": "customfield_1", "name": "Story Points", "schema": {"type": "number"}},
+            {"id": "customfield_2", "name": "Unused"},
+        ])
+        issues = [{"fields": {"customfield_1": n, "customfield_2": None, "summary": "x"}} for n in range(6)]
+        
+        result = await service.discover_field_mappings(sample_issues=issues)
+        
+        assert result["total_custom_fields"] == 2
+        assert result["used_fields"] == 1
+        analysis = result["field_analysis"]["customfield_1"]
+        assert analysis["usage_count"] == 5
+        assert analysis["sample_values"] == [0, 1, 2]
+        assert analysis["suggested_target"] == "story_points"
+    
+    @pytest.mark.asyncio
+    async def test_discovery_search_requests_only_custom_fields(self):
+        """Test project discovery asks JIRA for the custom fields alone."""
+        client = JiraAPIClient("https://jira.example.com")
+        client.post = AsyncMock(return_value={"issues": [{"fields": {"customfield_1": 3}}]})
+        client.get = AsyncMock()
+        service = JiraFieldMappingService(client)
+        service.get_custom_fields = AsyncMock(return_value=[{"id": "customfield_1", "name": "Points"}])
+        
+        result = await service.discover_field_mappings(project_key="PROJ")
+        
+        assert result["used_fields"] == 1
+        client.get.assert_not_awaited()
+        body = client.post.await_args.kwargs["json"]
+        assert body == {"jql": "project = PROJ", "maxResults": 10, "fields": ["customfield_1"]}
+    
+    @pytest.mark.asyncio
+    async def test_apply_project_specific_field_mappings(self):
+        """Test type conversions and transformation rules per mapping."""
+        service = JiraFieldMappingService(Mock())
+        mappings = [
+            Mock(jira_field_id="customfield_1", sprint_reports_field="story_points",
+                 field_type="float", transformation_rule=None),
+            Mock(jira_field_id="customfield_2", sprint_reports_field="team",
+                 field_type="string", transformation_rule=None),
+            Mock(jira_field_id="customfield_3", sprint_reports_field="size",
+                 field_type="object", transformation_rule="extract_numeric"),
+            Mock(jira_field_id="customfield_4", sprint_reports_field="release",
+                 field_type="custom", transformation_rule="uppercase"),
+        ]
+        issue = {"fields": {
+            "customfield_1": "5",
+            "customfield_2": {"value": "Frontend"},
+            "customfield_3": "about 8 pts",
+            "customfield_4": "r1",
+        }}
+        
+        result = await service.apply_project_specific_field_mappings(issue, mappings, Mock())
+        
+        assert result == {"story_points": 5.0, "team": "Frontend", "size": "about 8 pts", "release": "R1"}
+    
+    def test_calculate_confidence_name_patterns(self):
+        """Test name clarity tiers feed into the confidence score."""
+        service = JiraFieldMappingService(Mock())
+        
+        assert service._calculate_confidence({"usage_count": 5, "name": "Epic Link"}) == 1.0
+        assert service._calculate_confidence({"usage_count": 5, "name": "Fix Version"}) == pytest.approx(0.85)
+        assert service._calculate_confidence({"usage_count": 0, "name": "Notes"}) == pytest.approx(0.15)
+
+
+class TestMetaBoardDetection:
+    """Test cases for meta-board detection."""
+    
+    @staticmethod
+    def _issue(project_key):
+        return {"fields": {"project": {"key": project_key}}}
+    
+    @pytest.mark.asyncio
+    async def test_detect_counts_projects_across_sprints(self):
+        """Test per-project counts and tolerance of failed sprint fetches."""
+        client = JiraAPIClient("https://jira.example.com")
+        service = MetaBoardService(client)
+        service._get_sprints_for_board = AsyncMock(return_value=[{"id": 1}, {"id": 2}, {"id": 3}, {}])
+        issues = {
+            3: [self._issue("WEB"), self._issue("API"), self._issue("WEB"), {"fields": {}}],
+            2: ExternalServiceError("JIRA", "boom"),
+            1: [self._issue("API"), self._issue("OPS")],
+        }
+        
+        async def fetch(endpoint, params=None):
+            sprint_id = int(endpoint.split("/")[-2])
+            if isinstance(issues[sprint_id], Exception):
+                raise issues[sprint_id]
+            return {"issues": issues[sprint_id]}
+        
+        client.get = AsyncMock(side_effect=fetch)
+        
+        result = await service.detect_meta_board_configuration(42)
+        
+        assert result["is_meta_board"] is True
+        assert result["analysis"]["multi_project_sprints"] == 2
+        assert result["analysis"]["project_distribution"] == {
+            "WEB": {"sprint_count": 1, "total_issues": 2},
+            "API": {"sprint_count": 2, "total_issues": 2},
+            "OPS": {"sprint_count": 1, "total_issues": 1},
+        }
+        assert client.get.await_count == 3
+        assert client.get.await_args.kwargs["params"]["fields"] == "project"
+        
+        # The analysis is reused for the same board until it expires, and
+        # callers mutating their copy do not change the cached entry
+        result["analysis"]["project_distribution"].clear()
+        cached = await service.detect_meta_board_configuration(42)
+        assert cached["analysis"]["project_distribution"]["API"]["sprint_count"] == 2
+        assert client.get.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_sprint_pages_fetched_concurrently_when_total_known(self):
+        """Test pages after the first are requested together once the total is known."""
+        client = JiraAPIClient("https://jira.example.com")
+        service = MetaBoardService(client)
+        client.get = AsyncMock(return_value={"values": [{"id": i} for i in range(50)], "total": 120})
+        client.get_many = AsyncMock(return_value=[
+            {"values": [{"id": i} for i in range(50, 100)]},
+            {"values": [{"id": i} for i in range(100, 120)]},
+        ])
+        
+        sprints = await service._get_sprints_for_board(42)
+        
+        assert [sprint["id"] for sprint in sprints] == list(range(120))
+        client.get.assert_awaited_once()
+        calls = client.get_many.await_args.args[0]
+        assert [params["startAt"] for _, params in calls] == [50, 100]
+    
+    @pytest.mark.asyncio
+    async def test_sprint_pages_sequential_without_total(self):
+        """Test pagination stops at the page marked last when no total is reported."""
+        client = JiraAPIClient("https://jira.example.com")
+        service = MetaBoardService(client)
+        client.get = AsyncMock(side_effect=[
+            {"values": [{"id": i} for i in range(50)], "isLast": False},
+            {"values": [{"id": i} for i in range(50, 100)], "isLast": True},
+        ])
+        
+        sprints = await service._get_sprints_for_board(42)
+        
+        assert len(sprints) == 100
+        assert client.get.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_detect_analyzes_five_most_recent_sprints(self):
+        """Test only the five highest sprint ids are fetched."""
+        client = JiraAPIClient("https://jira.example.com")
+        client.get_many = AsyncMock(return_value=[{"issues": []}] * 5)
+        service = MetaBoardService(client)
+        service._get_sprints_for_board = AsyncMock(return_value=[{"id": i} for i in (4, 9, 1, 7, 3, 8, 6)])
+        
+        result = await service.detect_meta_board_configuration(42)
+        
+        assert result["analysis"]["analyzed_sprints"] == 5
+        endpoints = [endpoint for endpoint, _ in client.get_many.await_args.args[0]]
+        assert endpoints == [f"/rest/agile/1.0/sprint/{i}/issue" for i in (9, 8, 7, 6, 4)]
+
+
+class TestProjectSourceEnhancement:
+    """Test cases for meta-board project source enhancement."""
+    
+    @staticmethod
+    def _issue(key, project_key, priority="High", links=None, **extra_fields):
+        fields = {
+            "project": {"key": project_key, "name": f"{project_key} Project", "id": "1"},
+            "priority": {"name": priority} if priority else None,
+            "status": {"name": "Done"},
+            **extra_fields,
+        }
+        if links:
+            fields["issuelinks"] = links
+        return {"key": key, "fields": fields}
+    
+    @staticmethod
+    def _service():
+        service = MetaBoardService(Mock(spec=JiraAPIClient))
+        service._get_sprint_board_info = AsyncMock(return_value={"board_id": 12, "board_name": "Board"})
+        return service
+    
+    def test_extract_team_field_layouts(self):
+        """Test option, string and unusable team field values."""
+        service = self._service()
+        
+        assert service._extract_team_field(self._issue("A-1", "A", customfield_10741={"value": "Frontend"})) == "Frontend"
+        assert service._extract_team_field(self._issue("A-2", "A", customfield_10740="Backend")) == "Backend"
+        assert service._extract_team_field(
+            self._issue("A-3", "A", customfield_10741={"id": "1"}, customfield_10740=["x"], customfield_10015="QA")
+        ) == "QA"
+        assert service._extract_team_field({"key": "A-4"}) is None
+    
+    @pytest.mark.asyncio
+    async def test_project_stats_aggregation(self):
+        """Test per-project statistics and issue metadata on a meta-board sprint."""
+        service = self._service()
+        issues = [
+            self._issue("WEB-1", "WEB", customfield_10002=3, components=[{"name": "UI"}, {}]),
+            self._issue("WEB-2", "WEB", priority=None, customfield_10741={"value": "Frontend"}),
+            self._issue("API-1", "API", customfield_10002="5"),
+            {"key": "NOPROJ-1", "fields": {}},
+        ]
+        
+        result = await service.enhance_issues_with_project_source(issues, sprint_id=7)
+        
+        assert result is not issues and len(result) == 4
+        web = result[0]["meta_board_info"]
+        assert web["meta"]["is_meta_board"] is True
+        assert web["source_project"] == "WEB"
+        # Sprint-level metadata is shared rather than copied per issue
+        assert result[1]["meta_board_info"]["meta"] is web["meta"]
+        stats = web["meta"]["project_stats"]["WEB"]
+        assert stats["count"] == 2
+        assert stats["issues"] == ["WEB-1", "WEB-2"]
+        assert stats["story_points"] == 3.0
+        assert dict(stats["priority_distribution"]) == {"High": 1, "Unknown": 1}
+        assert stats["components"] == ["UI"]
+        assert stats["teams"] == ["Frontend"]
+        assert result[2]["meta_board_info"]["project_context"]["is_primary_project"] is True
+        assert result[3]["meta_board_info"]["source_project"] is None
+        assert result[3]["field_mapping_context"]["source_project"] is None
+    
+    @pytest.mark.asyncio
+    async def test_cross_project_links_indexed_by_project(self):
+        """Test each issue sees the dependencies touching its own project."""
+        service = self._service()
+        link_to_api = {"outwardIssue": {"key": "API-1", "fields": {"project": {"key": "API"}}},
+                       "type": {"outward": "blocks"}}
+        link_to_ext = {"inwardIssue": {"key": "EXT-9", "fields": {"project": {"key": "EXT"}}},
+                       "type": {"inward": "is blocked by"}}
+        issues = [
+            self._issue("WEB-1", "WEB", links=[link_to_api, link_to_ext]),
+            self._issue("API-1", "API"),
+            self._issue("OPS-1", "OPS"),
+        ]
+        
+        result = await service.enhance_issues_with_project_source(issues, sprint_id=7)
+        
+        web_links = result[0]["meta_board_info"]["project_context"]["cross_project_links"]
+        api_links = result[1]["meta_board_info"]["project_context"]["cross_project_links"]
+        ops_links = result[2]["meta_board_info"]["project_context"]["cross_project_links"]
+        assert [(d["type"], d["target_project"]) for d in web_links] == [("outward", "API"), ("inward", "EXT")]
+        assert [d["source_issue"] for d in api_links] == ["WEB-1"]
+        assert ops_links == []
+    
+    @pytest.mark.asyncio
+    async def test_field_profile_fetched_once_per_project(self):
+        """Test field profiles are looked up once per distinct project."""
+        service = self._service()
+        service._get_project_field_profile = AsyncMock(side_effect=lambda key: {"project_key": key})
+        issues = [self._issue(f"WEB-{i}", "WEB") for i in range(5)] + [self._issue("API-1", "API")]
+        
+        result = await service.enhance_issues_with_project_source(issues, sprint_id=7)
+        
+        assert service._get_project_field_profile.await_count == 2
+        assert result[4]["field_mapping_context"]["project_field_profile"] == {"project_key": "WEB"}
+        assert result[5]["field_mapping_context"]["project_field_profile"] == {"project_key": "API"}
+
+
+class TestIssueWebhookProcessing:
+    """Test cases for issue webhook processing."""
+    
+    @pytest.mark.asyncio
+    async def test_active_mappings_reused_within_ttl(self):
+        """Test a burst of events loads the active field mappings once."""
+        service = JiraSyncService(Mock(), Mock())
+        mapping = Mock(jira_field_id="customfield_1", target_field="story_points")
+        field_mapping_service = Mock(spec=FieldMappingService)
+        field_mapping_service.get_active_mappings = AsyncMock(return_value=[mapping])
+        service._get_field_mapping_service = AsyncMock(return_value=field_mapping_service)
+        event = {"issue": {"key": "WEB-1", "fields": {"project": {"key": "WEB"}, "customfield_1": "3"}}}
+        
+        with patch('app.services.jira_service.time.monotonic', side_effect=[0, 30, 61]):
+            first = await service._process_issue_webhook(event)
+            await service._process_issue_webhook(event)
+            assert field_mapping_service.get_active_mappings.await_count == 1
+            
+            # Expired entries are reloaded
+            await service._process_issue_webhook(event)
+        
+        assert first["story_points"] == 3.0
+        assert first["custom_fields"] == {"customfield_1": "3"}
+        assert field_mapping_service.get_active_mappings.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_missing_and_null_nested_fields(self):
+        """Test absent or null nested JIRA fields are read as None."""
+        service = JiraSyncService(Mock(), Mock())
+        service._get_field_mapping_service = AsyncMock(return_value=None)
+        event = {"issue": {"key": "WEB-2", "fields": {"priority": None, "status": {"name": "Done"}}}}
+        
+        data = await service._process_issue_webhook(event)
+        
+        assert data["priority"] is None
+        assert data["issue_type"] is None
+        assert data["project_key"] is None
+        assert data["status"] == "Done"
+
+
+class TestMetaBoardSync:
+    """Test cases for meta-board synchronization."""
+    
+    @pytest.mark.asyncio
+    async def test_sprints_synced_concurrently_and_aggregated_in_order(self):
+        """Test sprint syncs overlap while results and errors keep sprint order."""
+        meta_board_service = Mock()
+        meta_board_service.detect_meta_board_configuration = AsyncMock(return_value={"is_meta_board": True})
+        service = JiraSyncService(Mock(), meta_board_service)
+        service._get_sprints_for_board = AsyncMock(return_value=[
+            {"id": 1, "state": "ACTIVE"}, {"id": 2, "state": "CLOSED"}, {"id": 3, "state": "CLOSED"},
+        ])
+        running = 0
+        peak = 0
+        
+        async def sync_sprint(sprint_id, preserve_project_context, meta_board_config=None):
+            assert meta_board_config == {"is_meta_board": True}
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            if sprint_id == 2:
+                raise ExternalServiceError("JIRA", "boom")
+            return {
+                "project_metrics": {"WEB": {"count": sprint_id, "story_points": 1.0, "teams": ["UI"]}},
+                "cross_project_dependencies": [sprint_id],
+            }
+        
+        service._sync_meta_board_sprint = AsyncMock(side_effect=sync_sprint)
+        
+        result = await service.sync_meta_board_data(42)
+        
+        assert peak == 3
+        assert list(result["project_results"]) == [1, 3]
+        assert result["cross_project_dependencies"] == [1, 3]
+        assert len(result["sync_errors"]) == 1 and "sprint 2" in result["sync_errors"][0]
+        web = result["aggregated_metrics"]["project_metrics"]["WEB"]
+        assert web["total_sprints"] == 2 and web["total_issues"] == 4
+        assert web["teams"] == ["UI"]
+    
+    @pytest.mark.asyncio
+    async def test_board_259_sync_applies_priority_weights(self):
+        """Test Board 259 syncs weight the aggregated project metrics."""
+        meta_board_service = MetaBoardService(Mock(spec=JiraAPIClient))
+        meta_board_service.detect_meta_board_configuration = AsyncMock(return_value={"is_meta_board": True})
+        service = JiraSyncService(Mock(), meta_board_service)
+        service._get_sprints_for_board = AsyncMock(return_value=[{"id": 1, "state": "ACTIVE"}])
+        service._sync_meta_board_sprint = AsyncMock(return_value={
+            "project_metrics": {"WEB": {"count": 3, "story_points": 5.0}, "API": {"count": 1}},
+            "cross_project_dependencies": [],
+        })
+        
+        result = await service.sync_meta_board_data(259)
+        
+        assert "success" not in result
+        assert result["board_259_enhancements"]["priority_weighted_projects"] == {"WEB": 0.7, "API": 0.1}
+
+
 class TestJiraService:
     """Test cases for JiraService."""
     
@@ -218,9 +987,31 @@ class TestJiraService:
         assert sprints[0]["name"] == "Sprint 1"
         mock_client.get.assert_called_once_with(
             "/rest/agile/1.0/board/123/sprint",
-            params={"maxResults": 100}
+            params={"maxResults": 50, "startAt": 0}
         )
     
+    @pytest.mark.asyncio
+    async def test_get_boards_fetches_remaining_pages_concurrently(self):
+        """Test board pages after the first are requested together with the project filter."""
+        service = JiraService()
+        
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value={"values": [{"id": i} for i in range(50)], "total": 75})
+        mock_client.get_many = AsyncMock(return_value=[{"values": [{"id": i} for i in range(50, 75)]}])
+        
+        service._client = mock_client
+        
+        boards = await service.get_boards(project_key="WEB")
+        
+        assert [board["id"] for board in boards] == list(range(75))
+        mock_client.get.assert_awaited_once_with(
+            "/rest/agile/1.0/board",
+            params={"projectKeyOrId": "WEB", "maxResults": 50, "startAt": 0}
+        )
+        mock_client.get_many.assert_awaited_once_with([
+            ("/rest/agile/1.0/board", {"projectKeyOrId": "WEB", "maxResults": 50, "startAt": 50})
+        ])
+    
     @pytest.mark.asyncio
     async def test_get_sprints_fallback_on_error(self):
         """Test sprint retrieval fallback on error."""
@@ -231,7 +1022,10 @@ class TestJiraService:
         
         service._client = mock_client
         
-        sprints = await service.get_sprints()
+        # No made-up sprints unless placeholders are requested
+        assert await service.get_sprints() == []
+        
+        sprints = await service.get_sprints(allow_placeholders=True)
         
         # Should return placeholder data
         assert len(sprints) == 1
@@ -261,10 +1055,73 @@ class TestJiraService:
         
         assert len(issues) == 1
         assert issues[0]["key"] == "TEST-123"
-        mock_client.get.assert_called_once_with(
-            "/rest/agile/1.0/sprint/456/issue",
-            params={"maxResults": 1000}
-        )
+        # Issues are paged from startAt 0, then the sprint is looked up for its board
+        assert mock_client.get.await_args_list == [
+            call("/rest/agile/1.0/sprint/456/issue", params={"maxResults": 1000, "startAt": 0}),
+            call("/rest/agile/1.0/sprint/456"),
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_get_sprint_issues_pages_past_server_cap(self):
+        """Test a capped first page is followed by concurrent fetches of the rest."""
+        service = JiraService()
+        
+        mock_client = AsyncMock()
+        issue = {"key": "TEST-1", "fields": {"issuetype": {"subtask": False}}}
+        mock_client.get = AsyncMock(return_value={"issues": [issue] * 100, "total": 250})
+        mock_client.get_many = AsyncMock(return_value=[{"issues": [issue] * 100}, {"issues": [issue] * 50}])
+        
+        service._client = mock_client
+        
+        issues = await service.get_sprint_issues(sprint_id=456, detect_meta_board=False)
+        
+        assert len(issues) == 250
+        calls = mock_client.get_many.await_args.args[0]
+        assert [params["startAt"] for _, params in calls] == [100, 200]
+        assert all(endpoint == "/rest/agile/1.0/sprint/456/issue" for endpoint, _ in calls)
+    
+    @pytest.mark.asyncio
+    async def test_get_sprint_issues_with_mapping_shares_unmapped_fields(self):
+        """Test issues without mapped values keep their fields without a copy."""
+        service = JiraService()
+        fields = {"summary": "Test issue", "project": {"key": "WEB"}}
+        service.get_sprint_issues = AsyncMock(return_value=[{"key": "WEB-1", "fields": fields}])
+        service._get_field_mapping_service = AsyncMock(return_value=Mock())
+        
+        issues = await service.get_sprint_issues_with_mapping(sprint_id=456, template_id=3)
+        
+        assert issues[0]["fields"] is fields
+        assert issues[0]["original_fields"] is fields
+        assert issues[0]["mapped_fields"] == {}
+        assert issues[0]["mapping_metadata"]["template_id"] == 3
+        assert issues[0]["mapping_metadata"]["project_key"] == "WEB"
+    
+    def test_merge_fields_overlays_mapped_values(self):
+        """Test mapped values override a copy of the issue fields."""
+        fields = {"summary": "Issue", "customfield_1": "3"}
+        
+        merged = jira_service._merge_fields(fields, {"customfield_1": 3, "team": "UI"})
+        
+        assert merged == {"summary": "Issue", "customfield_1": 3, "team": "UI"}
+        assert fields == {"summary": "Issue", "customfield_1": "3"}
+        assert jira_service._merge_fields(fields, {}) is fields
+    
+    @pytest.mark.asyncio
+    async def test_get_sprint_issues_requests_only_needed_fields(self):
+        """Test a field list is sent with the fields subtask filtering relies on."""
+        service = JiraService()
+        
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value={"issues": []})
+        
+        service._client = mock_client
+        
+        await service.get_sprint_issues(sprint_id=456, detect_meta_board=False, fields=["status"])
+        await service.get_sprint_issues(sprint_id=456)
+        
+        first, second = mock_client.get.await_args_list
+        assert first.kwargs["params"]["fields"] == "issuetype,status"
+        assert "fields" not in second.kwargs["params"]
     
     @pytest.mark.asyncio
     async def test_get_sprint_issues_exclude_subtasks(self):